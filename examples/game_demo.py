@@ -16,10 +16,10 @@ Dependencies:
 import time
 import board
 import displayio
-import bitmaptools
 from adafruit_display_text import label
 import terminalio
 from rm690b0 import RM690B0, create_qspi_bus
+from rm690b0.primitives import PrimitiveCache
 
 DISPLAY_WIDTH = 600
 DISPLAY_HEIGHT = 450
@@ -79,40 +79,15 @@ display.root_group = game
 
 print("Pre-rendering sprites...")
 
-# Pre-render ball sprite (WHITE circle)
-ball_size = ball_r * 2 + 4
-ball_sprite = displayio.Bitmap(ball_size, ball_size, 65536)
-ball_sprite.fill(0x0000)
-
-# Pre-render clear sprite (BLACK circle - for erasing)
-clear_sprite = displayio.Bitmap(ball_size, ball_size, 65536)
-clear_sprite.fill(0x0000)
-
-# Draw filled circles
-ball_center = ball_r + 2
-r_squared = ball_r * ball_r
-for dy in range(-ball_r, ball_r + 1):
-    y_pos = ball_center + dy
-    dx_max = int((r_squared - dy * dy) ** 0.5)
-    for dx in range(-dx_max, dx_max + 1):
-        x_pos = ball_center + dx
-        ball_sprite[x_pos, y_pos] = 0xFFFF  # White
-        clear_sprite[x_pos, y_pos] = 0x0000  # Black (for clearing)
-
-# Pre-render paddle sprite (GREEN rectangle with 2px padding)
-paddle_sprite_w = paddle_w + 4
-paddle_sprite_h = paddle_h + 4
-paddle_sprite = displayio.Bitmap(paddle_sprite_w, paddle_sprite_h, 65536)
-paddle_sprite.fill(0x0000)
-bitmaptools.fill_region(paddle_sprite, 2, 2, 2 + paddle_w, 2 + paddle_h, 0x07E0)
-
-# Pre-render paddle clear sprite (BLACK - for erasing)
-paddle_clear = displayio.Bitmap(paddle_sprite_w, paddle_sprite_h, 65536)
-paddle_clear.fill(0x0000)
+# Rasterize the ball and paddle once; the sprites keep only the opaque
+# spans, so drawing and erasing skip the transparent corners
+shapes = PrimitiveCache()
+ball = shapes.sprite("circle", ball_r, color=0xFFFF)  # White, anchored at centre
+paddle = shapes.sprite("round_rect", paddle_w, paddle_h, 0, color=0x07E0)  # Green
 
 print("Sprites created!")
-print(f"Ball sprite size: {ball_sprite.width}x{ball_sprite.height}")
-print(f"Paddle sprite size: {paddle_sprite.width}x{paddle_sprite.height}")
+print(f"Ball sprite: {ball.pixels} of {ball.width}x{ball.height} pixels opaque")
+print(f"Paddle sprite: {paddle.pixels} of {paddle.width}x{paddle.height} pixels opaque")
 
 
 # Initial clear (full screen once)
@@ -120,14 +95,8 @@ canvas.fill(0x0000)
 display.refresh()
 
 # Draw initial objects
-ball_sprite_x = int(ball_x - ball_r - 2)
-ball_sprite_y = int(ball_y - ball_r - 2)
-bitmaptools.blit(
-    canvas, ball_sprite, ball_sprite_x, ball_sprite_y, skip_source_index=0x0000
-)
-bitmaptools.blit(
-    canvas, paddle_sprite, paddle_x - 2, paddle_y - 2, skip_source_index=0x0000
-)
+ball.blit(canvas, ball_x, ball_y)
+paddle.blit(canvas, paddle_x, paddle_y)
 display.refresh()
 
 print("Game started!")
@@ -140,44 +109,7 @@ last_fps_update = time.monotonic()
 last_motion_update = time.monotonic()
 
 
-def _mark_ball_dirty(bitmap, prev_bx, prev_by, bx, by):
-    x1 = min(prev_bx, bx) - ball_r - 2
-    y1 = min(prev_by, by) - ball_r - 2
-    x2 = max(prev_bx, bx) + ball_r + 2
-    y2 = max(prev_by, by) + ball_r + 2
-    x1 = max(0, x1) & ~1
-    y1 = max(0, y1)
-    x2 = min(DISPLAY_WIDTH, (x2 + 1) & ~1)
-    y2 = min(DISPLAY_HEIGHT, y2)
-    if x2 <= x1:
-        x2 = min(DISPLAY_WIDTH, x1 + 2)
-    if y2 <= y1:
-        y2 = min(DISPLAY_HEIGHT, y1 + 1)
-    bitmap.dirty(x1=x1, y1=y1, x2=x2, y2=y2)
-
-
-def _mark_paddle_dirty(bitmap, prev_px, px):
-    x1 = min(prev_px, px) - 2
-    y1 = paddle_y - 2
-    x2 = max(prev_px, px) + paddle_w + 2
-    y2 = paddle_y + paddle_h + 2
-    x1 = max(0, x1) & ~1
-    y1 = max(0, y1)
-    x2 = min(DISPLAY_WIDTH, (x2 + 1) & ~1)
-    y2 = min(DISPLAY_HEIGHT, y2)
-    if x2 <= x1:
-        x2 = min(DISPLAY_WIDTH, x1 + 2)
-    if y2 <= y1:
-        y2 = min(DISPLAY_HEIGHT, y1 + 1)
-    bitmap.dirty(x1=x1, y1=y1, x2=x2, y2=y2)
-
-
 try:
-    # Track previous positions
-    prev_ball_x = ball_x
-    prev_ball_y = ball_y
-    prev_paddle_x = paddle_x
-
     while True:
         frame_start = time.monotonic()
         now = time.monotonic()
@@ -253,27 +185,16 @@ try:
         if score_label.text != score_text:
             score_label.text = score_text
 
+        # Draw ball and paddle, then send both in one commit
+        display.begin_frame(canvas)
+
         # --- Phase 1: Ball ---
-        bitmaptools.blit(
-            canvas, clear_sprite, prev_ball_x - ball_r - 2, prev_ball_y - ball_r - 2
-        )
-        bitmaptools.blit(
-            canvas,
-            ball_sprite,
-            ball_x - ball_r - 2,
-            ball_y - ball_r - 2,
-            skip_source_index=0x0000,
-        )
-        _mark_ball_dirty(canvas, prev_ball_x, prev_ball_y, ball_x, ball_y)
-        display.refresh()
+        display.mark_dirty(*ball.move(canvas, 0x0000, ball_x, ball_y))
 
         # --- Phase 2: Paddle ---
-        bitmaptools.blit(canvas, paddle_clear, prev_paddle_x - 2, paddle_y - 2)
-        bitmaptools.blit(
-            canvas, paddle_sprite, paddle_x - 2, paddle_y - 2, skip_source_index=0x0000
-        )
-        _mark_paddle_dirty(canvas, prev_paddle_x, paddle_x)
-        display.refresh()
+        display.mark_dirty(*paddle.move(canvas, 0x0000, paddle_x, paddle_y))
+
+        frame_stats = display.commit_frame()
 
         # Update FPS counter (every 0.5 seconds)
         now = time.monotonic()
@@ -284,11 +205,6 @@ try:
                 fps_samples = []
             last_fps_update = now
 
-        # Save current positions for next frame
-        prev_ball_x = ball_x
-        prev_ball_y = ball_y
-        prev_paddle_x = paddle_x
-
         frame_count += 1
 
         # Calculate FPS
@@ -300,7 +216,8 @@ try:
         if frame_count % 120 == 0:
             print(
                 f"frame={frame_count}, score={score}, "
-                f"frame_time={frame_time*1000:.1f}ms"
+                f"frame_time={frame_time*1000:.1f}ms, "
+                f"windows={frame_stats.windows}, bytes={frame_stats.bytes}"
             )
 
 except KeyboardInterrupt:
@@ -0,0 +1,84 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: Unlicense
+
+"""
+Readout Demo - Glyph Atlas Text
+===============================
+
+Fast-changing numeric readouts drawn from a glyph atlas. Only the digits
+that change are redrawn and refreshed.
+
+Dependencies:
+    - bitmaptools (built-in firmware module)
+"""
+
+import time
+import board
+import displayio
+import terminalio
+from rm690b0 import RM690B0, create_qspi_bus
+from rm690b0.text import GlyphAtlas, TextField
+
+DISPLAY_WIDTH = 600
+DISPLAY_HEIGHT = 450
+
+print("Initializing RM690B0 display...")
+
+# Release any existing displays
+displayio.release_displays()
+
+# Create QSPI bus
+bus = create_qspi_bus(board, frequency=40_000_000)
+
+# Create RM690B0 display
+display = RM690B0(bus, width=DISPLAY_WIDTH, height=DISPLAY_HEIGHT)
+
+# Full-screen canvas the readouts are drawn into
+canvas = displayio.Bitmap(DISPLAY_WIDTH, DISPLAY_HEIGHT, 65536)
+palette = displayio.ColorConverter(input_colorspace=displayio.Colorspace.RGB565)
+group = displayio.Group()
+group.append(displayio.TileGrid(canvas, pixel_shader=palette))
+display.root_group = group
+
+# One atlas per font and scale, shared by all fields using it
+large = GlyphAtlas(terminalio.FONT, scale=4)
+small = GlyphAtlas(terminalio.FONT, scale=2)
+
+counter = TextField(large, 40, 60, color=0x07FF)  # Cyan
+clock = TextField(large, 40, 180, color=0xFFE0)  # Yellow
+stats = TextField(small, 40, 360, color=0x8410)  # Grey
+
+canvas.fill(0x0000)
+display.refresh()
+
+print("Press Ctrl+C to stop")
+
+count = 0
+start = time.monotonic()
+pixels = 0
+frames = 0
+
+try:
+    while True:
+        elapsed = time.monotonic() - start
+        display.begin_frame(canvas)
+        for rect in counter.update(canvas, "COUNT %06d" % count):
+            display.mark_dirty(*rect)
+        for rect in clock.update(canvas, "T+%8.2f" % elapsed):
+            display.mark_dirty(*rect)
+        if frames % 30 == 0:
+            text = "atlas %d/%d  px/frame %d" % (
+                large.hits,
+                large.misses,
+                pixels // max(1, frames),
+            )
+            for rect in stats.update(canvas, text):
+                display.mark_dirty(*rect)
+        pixels += display.commit_frame().pixels
+        frames += 1
+        count += 1
+
+except KeyboardInterrupt:
+    print("\nStopped")
+    print(f"Frames: {frames}, glyph cache hits/misses: {large.hits}/{large.misses}")
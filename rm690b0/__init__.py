@@ -0,0 +1,995 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0`
+====================================================
+
+CircuitPython displayio driver for RM690B0 AMOLED displays
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+**Hardware:**
+
+* `Waveshare ESP32-S3-Touch-AMOLED-2.41 <https://www.waveshare.com/esp32-s3-touch-amoled-2.41.htm>`_
+
+**Software and Dependencies:**
+
+* Adafruit CircuitPython firmware for the supported boards:
+  https://circuitpython.org/downloads
+"""
+
+import time
+from binascii import crc32
+from collections import namedtuple
+from busdisplay import BusDisplay
+
+from rm690b0.boards import detect_profile, resolve_pins, stored_frequency
+from rm690b0.pacing import FramePacer, _te_counter
+from rm690b0.regions import DirtyRegionTracker
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+# RM690B0 initialization sequence
+# This sequence is based on vendor recommendations and has been tested
+# to work reliably with RM690B0 AMOLED panels.
+_INIT_SEQUENCE = (
+    # Page select and configuration
+    b"\xFE\x01\x20"  # Enter user command mode
+    b"\x26\x01\x0A"  # Bias setting
+    b"\x24\x01\x80"  # Source output control
+    b"\xFE\x01\x13"  # Page 13
+    b"\xEB\x01\x0E"  # Unknown vendor command
+    b"\xFE\x01\x00"  # Return to page 0
+    # Display configuration
+    b"\x3A\x01\x55"  # COLMOD: 16-bit RGB565
+    b"\xC2\x81\x00\x0A"  # Unknown vendor command with delay
+    b"\x35\x00"  # Tearing effect line on
+    b"\x51\x81\x00\x0A"  # Brightness control with delay
+    # Power on sequence
+    b"\x11\x80\x50"  # Sleep out, wait 80ms
+    # Set display window (600x450 with 16-pixel Y offset)
+    b"\x2A\x04\x00\x10\x01\xD1"  # CASET: column 16 to 465
+    b"\x2B\x04\x00\x00\x02\x57"  # RASET: row 0 to 599
+    # Enable display
+    b"\x29\x80\x0A"  # Display on, wait 10ms
+    # Memory access control (rotation)
+    b"\x36\x81\x30\x0A"  # MADCTL: default orientation
+    # Brightness
+    b"\x51\x01\xFF"  # Set brightness to maximum
+)
+
+# Same sequence with the redundant first brightness write dropped and only
+# the sleep-out delay kept, as produced by rm690b0.initseq.optimize().
+_FAST_INIT_SEQUENCE = (
+    b"\xFE\x01\x20"  # Enter user command mode
+    b"\x26\x01\x0A"  # Bias setting
+    b"\x24\x01\x80"  # Source output control
+    b"\xFE\x01\x13"  # Page 13
+    b"\xEB\x01\x0E"  # Unknown vendor command
+    b"\xFE\x01\x00"  # Return to page 0
+    b"\x3A\x01\x55"  # COLMOD: 16-bit RGB565
+    b"\xC2\x01\x00"  # Unknown vendor command
+    b"\x35\x00"  # Tearing effect line on
+    b"\x11\x80\x50"  # Sleep out, wait 80ms
+    b"\x2A\x04\x00\x10\x01\xD1"  # CASET: column 16 to 465
+    b"\x2B\x04\x00\x00\x02\x57"  # RASET: row 0 to 599
+    b"\x29\x00"  # Display on
+    b"\x36\x01\x30"  # MADCTL: default orientation
+    b"\x51\x01\xFF"  # Set brightness to maximum
+)
+
+# Minimum sequence for a panel that is still powered and configured from
+# a previous run: no reset, no sleep-out wait, no delays.
+_WARM_INIT_SEQUENCE = (
+    b"\x3A\x01\x55"  # COLMOD: 16-bit RGB565
+    b"\x35\x00"  # Tearing effect line on
+    b"\x36\x01\x30"  # MADCTL: default orientation
+    b"\x29\x00"  # Display on
+)
+
+# MADCTL bits
+_MADCTL_MY = 0x80
+_MADCTL_MX = 0x40
+_MADCTL_MV = 0x20
+_MADCTL_ML = 0x10
+_MADCTL_DEFAULT = _MADCTL_MV | _MADCTL_ML
+
+# Frame memory size in the landscape address space. The visible 450 rows
+# leave a 16-row margin on one side and a 14-row margin on the other.
+_GRAM_WIDTH = 600
+_GRAM_HEIGHT = 480
+
+# Refresh rate of the panel scan, and so of its TE output
+_PANEL_FPS = 60
+
+_WARM_MAGIC = b"RM69"
+_WARM_MARKER_SIZE = 8
+
+
+def _rotation_layout(rotation, width, height, colstart, rowstart):
+    """
+    Controller setup that shows the display rotated by ``rotation``.
+
+    ``width``, ``height``, ``colstart`` and ``rowstart`` describe the
+    unrotated landscape layout. Mirroring an axis moves its offset to the
+    opposite margin of the frame memory.
+
+    :return: ``(madctl, width, height, colstart, rowstart)`` for BusDisplay
+    :raises ValueError: For an unsupported rotation or offsets that fall
+        outside the frame memory
+    """
+    far_col = _GRAM_WIDTH - width - colstart
+    far_row = _GRAM_HEIGHT - height - rowstart
+    if rotation == 0:
+        layout = (_MADCTL_DEFAULT, width, height, colstart, rowstart)
+    elif rotation == 90:
+        layout = (_MADCTL_ML | _MADCTL_MX, height, width, far_row, colstart)
+    elif rotation == 180:
+        madctl = _MADCTL_DEFAULT | _MADCTL_MX | _MADCTL_MY
+        layout = (madctl, width, height, far_col, far_row)
+    elif rotation == 270:
+        layout = (_MADCTL_ML | _MADCTL_MY, height, width, rowstart, far_col)
+    else:
+        raise ValueError("rotation must be 0, 90, 180 or 270")
+    if layout[3] < 0 or layout[4] < 0:
+        raise ValueError("display does not fit frame memory at rotation %d" % rotation)
+    return layout
+
+
+def _with_madctl(sequence, madctl):
+    """Copy of an init sequence with its MADCTL argument replaced."""
+    if madctl == _MADCTL_DEFAULT:
+        return sequence
+    # pylint: disable=import-outside-toplevel
+    from rm690b0.initseq import InitCommand, decode, encode
+
+    return encode(
+        InitCommand(entry.command, bytes((madctl,)), entry.delay)
+        if entry.command == 0x36
+        else entry
+        for entry in decode(sequence)
+    )
+
+
+def _warm_memory():
+    """Memory that survives a soft reload but not a power cycle, or None."""
+    try:
+        import alarm  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return getattr(alarm, "sleep_memory", None)
+
+
+def _warm_marker(config):
+    return _WARM_MAGIC + (crc32(config) & 0xFFFFFFFF).to_bytes(4, "little")
+
+
+def panel_is_warm(memory=None):
+    """
+    Check whether a previous :class:`RM690B0` left the panel configured.
+
+    Call this before creating the bus to decide whether the reset pulse
+    can be skipped. The marker lives in ``alarm.sleep_memory`` by default,
+    which survives a soft reload but not a power cycle, just like the
+    panel's own configuration.
+
+    :param memory: Buffer whose first 8 bytes hold the marker (default:
+        ``alarm.sleep_memory``)
+    :return: True if a marker from a previous initialization is present
+    """
+    if memory is None:
+        memory = _warm_memory()
+    if memory is None or len(memory) < _WARM_MARKER_SIZE:
+        return False
+    return bytes(memory[: len(_WARM_MAGIC)]) == _WARM_MAGIC
+
+
+def forget_warm_panel(memory=None):
+    """
+    Clear the warm-start marker so the next start does a full init.
+
+    :param memory: Buffer whose first 8 bytes hold the marker (default:
+        ``alarm.sleep_memory``)
+    """
+    if memory is None:
+        memory = _warm_memory()
+    if memory is not None and len(memory) >= _WARM_MARKER_SIZE:
+        memory[:_WARM_MARKER_SIZE] = bytes(_WARM_MARKER_SIZE)
+
+
+FrameStats = namedtuple("FrameStats", ("windows", "pixels", "bytes", "elapsed"))
+"""
+Result of :meth:`RM690B0.commit_frame`.
+
+``windows`` is the number of display windows flushed, each in its own
+refresh pass, ``pixels`` the number of pixels they cover, ``bytes`` the
+RGB565 payload sent and ``elapsed`` the time spent in ``refresh()`` in
+seconds.
+"""
+
+
+class _Frame:
+    """Context manager returned by :meth:`RM690B0.frame`."""
+
+    def __init__(self, display, bitmap):
+        self._display = display
+        self._bitmap = bitmap
+        self.stats = None
+
+    def __enter__(self):
+        self._display.begin_frame(self._bitmap)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.stats = self._display.commit_frame()
+        else:
+            self._display.abort_frame()
+        return False
+
+
+class RM690B0(BusDisplay):  # pylint: disable=too-many-instance-attributes
+    """
+    RM690B0 AMOLED display driver.
+
+    This class provides a displayio-compatible interface to RM690B0 panels.
+    It inherits from BusDisplay and handles all initialization and
+    communication with the display controller.
+
+    :param bus: The QSPI bus interface (qspibus.QSPIBus)
+    :param int width: Display width in pixels (default: 600)
+    :param int height: Display height in pixels (default: 450)
+    :param int colstart: Column start offset (default: 0)
+    :param int rowstart: Row start offset (default: 16)
+    :param int rotation: Display rotation in degrees (0, 90, 180, 270)
+    :param bool hardware_rotation: Rotate by reprogramming the controller's
+        memory access control (MADCTL) and window offsets, so pixels are
+        sent in natural scan order instead of being transformed by
+        displayio. ``width``, ``height``, ``colstart`` and ``rowstart``
+        still describe the unrotated layout (default: False)
+    :param bool auto_refresh: Enable automatic refresh (default: False)
+    :param te_pin: Pin wired to the panel's TE output, used to align
+        committed frames to the panel scan; without ``target_fps`` frames
+        are paced at the panel's 60Hz refresh rate (default: None)
+    :param float target_fps: Pace committed frames to this rate; with no
+        ``te_pin`` a software timer is used (default: None: no pacing, or
+        60 with a ``te_pin``)
+    :param bool fast_init: Use the optimized init sequence, which skips a
+        redundant brightness write and 40ms of delays (default: False)
+    :param bool warm_start: Send only a minimal sequence when a marker
+        shows the panel is still configured from a previous run with the
+        same settings (default: False)
+    :param warm_memory: Buffer whose first 8 bytes hold the warm-start
+        marker (default: ``alarm.sleep_memory``)
+    :param bool double_buffer: Allocate a
+        :class:`rm690b0.framebuffer.DoubleBuffer` as :attr:`buffers` for
+        drawing without displayio (default: False)
+    :param int band_height: Create a :class:`rm690b0.bands.BandRenderer`
+        with bands of this many rows as :attr:`bands`, for composing the
+        screen without a full-screen buffer (default: None)
+    :param int indexed_bits: Create a
+        :class:`rm690b0.indexed.IndexedFramebuffer` with this many bits per
+        pixel as :attr:`indexed` and show it (default: None)
+    :param int tile_shadow: Keep a :class:`rm690b0.shadow.TileShadow` with
+        tiles of this size as :attr:`shadow`, so :attr:`buffers` and
+        :attr:`bands` skip tiles that did not change (default: None)
+
+    Example:
+
+        bus = qspibus.QSPIBus(...)
+        display = RM690B0(bus, width=600, height=450)
+        display.root_group = my_group
+        display.refresh()
+
+    After a soft reload the panel keeps its configuration, so a warm start
+    can skip the reset pulse and the 80ms sleep-out wait:
+
+        warm = panel_is_warm()
+        bus = create_qspi_bus(board, reset=not warm)
+        display = RM690B0(bus, warm_start=True)
+
+    Several draws can be folded into one commit with a frame, which sends
+    them in as few windows as the dirty-region planner finds cheapest:
+
+        with display.frame(canvas) as frame:
+            bitmaptools.blit(canvas, ball, x, y)
+            display.mark_dirty(x, y, x + ball.width, y + ball.height)
+            bitmaptools.blit(canvas, paddle, px, py)
+            display.mark_dirty(px, py, px + paddle.width, py + paddle.height)
+        print(frame.stats.windows, frame.stats.bytes)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments,too-many-locals,too-many-statements
+        self,
+        bus,
+        *,
+        width=600,
+        height=450,
+        colstart=0,
+        rowstart=16,
+        rotation=0,
+        hardware_rotation=False,
+        auto_refresh=False,
+        te_pin=None,
+        target_fps=None,
+        fast_init=False,
+        warm_start=False,
+        warm_memory=None,
+        double_buffer=False,
+        band_height=None,
+        indexed_bits=None,
+        tile_shadow=None,
+    ):
+        """Initialize RM690B0 display driver."""
+        init_sequence = _FAST_INIT_SEQUENCE if fast_init else _INIT_SEQUENCE
+        warm_sequence = _WARM_INIT_SEQUENCE
+        madctl_rotation = 0
+        layout = (_MADCTL_DEFAULT, width, height, colstart, rowstart)
+        if hardware_rotation:
+            layout = _rotation_layout(rotation, width, height, colstart, rowstart)
+            init_sequence = _with_madctl(init_sequence, layout[0])
+            warm_sequence = _with_madctl(warm_sequence, layout[0])
+            madctl_rotation = rotation
+        config = bytes(init_sequence) + bytes(
+            (width >> 8, width & 0xFF, height >> 8, height & 0xFF)
+        )
+        config += bytes((colstart, rowstart, rotation // 90))
+        marker = _warm_marker(config)
+        if warm_memory is None and warm_start:
+            warm_memory = _warm_memory()
+        warm = (
+            warm_start
+            and warm_memory is not None
+            and bytes(warm_memory[:_WARM_MARKER_SIZE]) == marker
+        )
+        super().__init__(
+            bus,
+            warm_sequence if warm else init_sequence,
+            width=layout[1],
+            height=layout[2],
+            colstart=layout[3],
+            rowstart=layout[4],
+            rotation=rotation - madctl_rotation,
+            color_depth=16,
+            auto_refresh=auto_refresh,
+        )
+        self._bus = bus
+        self._layout = layout
+        self._base_layout = (width, height, colstart, rowstart)
+        self._hardware_rotation = hardware_rotation
+        self.madctl_rotation = madctl_rotation
+        """Part of the rotation done by the controller through MADCTL."""
+        self.dirty = DirtyRegionTracker(self.width, self.height)
+        """Dirty rectangles collected for the next committed frame."""
+        self.last_frame = None
+        """:class:`FrameStats` of the most recently committed frame."""
+        self._frame_bitmap = None
+        self._frame_auto_refresh = None
+        self.pacer = None
+        """:class:`FramePacer` used by :meth:`commit_frame`, if any."""
+        if te_pin is not None and target_fps is None:
+            target_fps = _PANEL_FPS
+        if target_fps is not None:
+            te_source = _te_counter(te_pin) if te_pin is not None else None
+            self.pacer = FramePacer(target_fps, te_source)
+        self.warm_started = warm
+        """True if initialization took the warm-start path."""
+        if not warm_start:
+            warm_memory = None
+        self._warm = (warm_memory, marker)
+        if warm_memory is not None:
+            warm_memory[:_WARM_MARKER_SIZE] = marker
+        self.partial_band = None
+        """Band shown in partial display mode as ``(start, end)``, or None."""
+        self.scroll_area = None
+        """Scrolling lines as ``(start, end)``, or None if never defined."""
+        self.scroll_position = 0
+        """Current :meth:`scroll` offset in lines."""
+        self._scroll_lines = None
+        self.window_offset = (0, 0)
+        """Shift of :meth:`write_window` windows, set by :meth:`set_window_offset`."""
+        self.chunk_rows = 32
+        """Rows sent between yields by the ``_async`` methods."""
+        self.shadow = None
+        """:class:`rm690b0.shadow.TileShadow` of frame memory, if ``tile_shadow`` was set."""
+        if tile_shadow is not None:
+            # pylint: disable=import-outside-toplevel
+            from rm690b0.shadow import TileShadow
+
+            self.shadow = TileShadow(self.width, self.height, tile_shadow)
+        self.buffers = None
+        """:class:`rm690b0.framebuffer.DoubleBuffer`, if ``double_buffer`` was set."""
+        if double_buffer:
+            # pylint: disable=import-outside-toplevel
+            from rm690b0.framebuffer import DoubleBuffer
+
+            self.buffers = DoubleBuffer(self)
+        self.bands = None
+        """:class:`rm690b0.bands.BandRenderer`, if ``band_height`` was set."""
+        if band_height is not None:
+            # pylint: disable=import-outside-toplevel
+            from rm690b0.bands import BandRenderer
+
+            self.bands = BandRenderer(self, band_height)
+        self.indexed = None
+        """:class:`rm690b0.indexed.IndexedFramebuffer`, if ``indexed_bits`` was set."""
+        if indexed_bits is not None:
+            # pylint: disable=import-outside-toplevel
+            from rm690b0.indexed import IndexedFramebuffer
+
+            self.indexed = IndexedFramebuffer(self, indexed_bits)
+            self.indexed.show()
+
+    def set_rotation(self, rotation):
+        """
+        Change the display rotation at runtime.
+
+        With ``hardware_rotation`` the controller is reprogrammed through
+        MADCTL whenever the new rotation keeps the same size and window
+        offsets. Otherwise, because displayio's window offsets are fixed
+        when the display is created, the remaining difference is applied
+        as a displayio rotation. Without ``hardware_rotation`` this is the
+        same as setting ``rotation``.
+
+        The display content must be refreshed afterwards.
+
+        :param int rotation: Rotation in degrees (0, 90, 180, 270)
+        """
+        # rotation is a BusDisplay property
+        # pylint: disable=attribute-defined-outside-init
+        if self.partial_band is not None:
+            self.exit_partial_mode()
+        if self.scroll_area is not None:
+            self._bus.send(0x33, _address(0, _GRAM_WIDTH) + b"\x00\x00")
+            self._bus.send(0x37, b"\x00\x00")
+            self.scroll_area = None
+            self.scroll_position = 0
+        if not self._hardware_rotation:
+            self.rotation = rotation
+        else:
+            layout = _rotation_layout(rotation, *self._base_layout)
+            if layout[1:] == self._layout[1:]:
+                self._bus.send(0x36, bytes((layout[0],)))
+                self._layout = layout
+                self.madctl_rotation = rotation
+                self.rotation = 0
+            else:
+                self.rotation = (rotation - self.madctl_rotation) % 360
+        self.window_offset = (0, 0)
+        self.dirty.width = self.width
+        self.dirty.height = self.height
+        self.dirty.add_all()
+        if self.shadow is not None:
+            self.shadow.resize(self.width, self.height)
+
+    def write_window(
+        self, x, y, width, height, buffer, *, stride=None
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        """
+        Send RGB565 pixels straight to display memory, bypassing displayio.
+
+        The buffer is streamed to the panel as is, without copying or
+        colour conversion, so it must hold big-endian RGB565 pixels row by
+        row (the layout of a byte-swapped ``displayio.Bitmap`` or a
+        ``ColorConverter`` output). Any object supporting the buffer
+        protocol works, including a ``memoryview`` slice.
+
+        Auto refresh is paused during the write so displayio cannot
+        interleave its own traffic. displayio does not know about the
+        written pixels: they stay on screen until ``root_group`` redraws
+        that area. Tiles of :attr:`shadow` under the window are forgotten.
+        The window lands shifted by :attr:`window_offset` in frame memory.
+
+        :param int x: Left edge; must be even
+        :param int y: Top edge
+        :param int width: Window width; must be even
+        :param int height: Window height
+        :param buffer: At least ``width * height * 2`` bytes of pixel data
+        :param int stride: Bytes from one buffer row to the next, to send a
+            window out of a larger image; rows are then streamed one by
+            one with RAMWR/RAMWRC (default: ``width * 2``)
+        :raises ValueError: If the window is misaligned, off screen or the
+            buffer is too short
+        :raises RuntimeError: If displayio is rotating the display in
+            software, so display coordinates do not follow memory order
+        """
+        if self.rotation % 360:
+            raise RuntimeError("write_window needs rotation 0 or hardware_rotation")
+        if x % 2 or width % 2:
+            raise ValueError("x and width must be even")
+        if not (
+            0 <= x < x + width <= self.width and 0 <= y < y + height <= self.height
+        ):
+            raise ValueError("window is outside the display")
+        row_bytes = width * 2
+        if stride is None:
+            stride = row_bytes
+        elif stride < row_bytes:
+            raise ValueError("stride is shorter than a row")
+        view = memoryview(buffer)
+        size = stride * (height - 1) + row_bytes
+        itemsize = getattr(view, "itemsize", 1)
+        if len(view) * itemsize < size:
+            raise ValueError("buffer holds fewer than %d bytes" % size)
+        if self.shadow is not None:
+            self.shadow.invalidate(x, y, x + width, y + height)
+        colstart = self._layout[3] + self.window_offset[0] + x
+        rowstart = self._layout[4] + self.window_offset[1] + y
+        auto_refresh = self.auto_refresh
+        # auto_refresh is a BusDisplay property
+        # pylint: disable=attribute-defined-outside-init
+        self.auto_refresh = False
+        try:
+            self._bus.send(0x2A, _address(colstart, colstart + width - 1))
+            self._bus.send(0x2B, _address(rowstart, rowstart + height - 1))
+            if stride == row_bytes:
+                self._bus.send(0x2C, view[: size // itemsize])
+            else:
+                command = 0x2C
+                step = stride // itemsize
+                count = row_bytes // itemsize
+                for start in range(0, height * step, step):
+                    self._bus.send(command, view[start : start + count])
+                    command = 0x3C
+        finally:
+            self.auto_refresh = auto_refresh
+
+    def enter_partial_mode(self, start, end):
+        """
+        Show only a band of the display and turn the rest of the panel off.
+
+        The panel scans along its 600-pixel side, and partial mode selects
+        a range of scan lines. In the landscape layout the band is
+        therefore the columns ``start`` to ``end`` over the full height;
+        in portrait (hardware rotation 90 or 270) it is a range of rows.
+        The band is mapped through the window offsets and MADCTL mirroring
+        to frame memory lines, and must lie within the visible area.
+
+        Frame memory is left untouched, so entering and leaving need no
+        redraw. While the mode is on, dirty rectangles in :attr:`dirty`,
+        :attr:`buffers` and :attr:`bands` are clipped to the band; what was drawn
+        outside it is sent by the first flush after
+        :meth:`exit_partial_mode`. displayio refreshes the whole dirty
+        area of its bitmaps as usual.
+
+        :param int start: First column (landscape) or row (portrait)
+        :param int end: End of the band, exclusive
+        :raises ValueError: If the band is empty or outside the display
+        :raises RuntimeError: If displayio is rotating the display in
+            software
+        """
+        first, stop = self._scan_range(start, end, "partial mode")
+        if self.scan_axis == "x":
+            clip = (start, 0, end, self.height)
+        else:
+            clip = (0, start, self.width, end)
+        self._bus.send(0x30, _address(first, stop - 1))
+        if self.partial_band is None:
+            self._bus.send(0x12, b"")
+        self.partial_band = (start, end)
+        for tracker in self._trackers():
+            tracker.set_clip(clip)
+
+    def exit_partial_mode(self):
+        """Return to normal display mode, showing the whole panel again."""
+        if self.partial_band is None:
+            return
+        self._bus.send(0x13, b"")
+        self.partial_band = None
+        for tracker in self._trackers():
+            tracker.set_clip(None)
+
+    def _trackers(self):
+        """Dirty trackers of displayio frames, :attr:`buffers` and :attr:`bands`."""
+        trackers = [self.dirty]
+        for renderer in (self.buffers, self.bands):
+            if renderer is not None:
+                trackers.append(renderer.dirty)
+        return trackers
+
+    @property
+    def scan_axis(self):
+        """
+        Display axis along which the panel scans, ``"x"`` or ``"y"``.
+
+        Partial mode and hardware scrolling work on ranges along this axis.
+        It is ``"x"`` in the landscape layout and ``"y"`` in portrait.
+        """
+        return "x" if self._layout[0] & _MADCTL_MV else "y"
+
+    @property
+    def frame_margins(self):
+        """
+        Frame memory beyond the display edges, as ``(left, top, right, bottom)``.
+
+        With the default offsets this is 16 lines above the landscape
+        display and 14 below it; the panel's 600-pixel side has none.
+        """
+        _, width, height, colstart, rowstart = self._layout
+        if self.scan_axis == "x":
+            columns, rows = _GRAM_WIDTH, _GRAM_HEIGHT
+        else:
+            columns, rows = _GRAM_HEIGHT, _GRAM_WIDTH
+        return (
+            colstart,
+            rowstart,
+            columns - width - colstart,
+            rows - height - rowstart,
+        )
+
+    def set_window_offset(self, x, y):
+        """
+        Shift where :meth:`write_window` puts windows in frame memory.
+
+        The content on the panel does not move until it is sent again, so
+        :attr:`buffers` and :attr:`bands` are marked fully dirty and
+        :attr:`shadow` forgets every tile. Pixels shifted past an edge go
+        to the spare frame memory of :attr:`frame_margins`, and the lines
+        uncovered at the other edge keep their old content. displayio is
+        not affected; move ``root_group`` instead.
+
+        :param int x: Horizontal shift; must be even
+        :param int y: Vertical shift
+        :raises ValueError: If ``x`` is odd or the shift exceeds
+            :attr:`frame_margins`
+        """
+        left, top, right, bottom = self.frame_margins
+        if x % 2:
+            raise ValueError("x must be even")
+        if not (-left <= x <= right and -top <= y <= bottom):
+            raise ValueError("offset %d, %d exceeds the frame memory margins" % (x, y))
+        if (x, y) == self.window_offset:
+            return
+        self.window_offset = (x, y)
+        if self.shadow is not None:
+            self.shadow.invalidate()
+        for renderer in (self.buffers, self.bands):
+            if renderer is not None:
+                renderer.dirty.add_all()
+
+    def set_scroll_area(self, top=0, bottom=0):
+        """
+        Define the hardware scroll area (VSCRDEF).
+
+        The lines between a fixed area of ``top`` lines at the start of
+        :attr:`scan_axis` and ``bottom`` lines at its end wrap around when
+        :meth:`scroll` moves them. The scroll position is reset to 0.
+
+        :param int top: Fixed lines at the start (default: 0)
+        :param int bottom: Fixed lines at the end (default: 0)
+        :raises ValueError: If no lines are left to scroll
+        :raises RuntimeError: If displayio is rotating the display in
+            software
+        """
+        limit = self.width if self.scan_axis == "x" else self.height
+        first, stop = self._scan_range(top, limit - bottom, "scrolling")
+        area = (first, stop - first, _GRAM_WIDTH - stop)
+        self._bus.send(0x33, b"".join(bytes((n >> 8, n & 0xFF)) for n in area))
+        self.scroll_area = (top, limit - bottom)
+        self._scroll_lines = (first, stop - first)
+        self.scroll_position = -1
+        self.scroll(0)
+
+    def scroll(self, position):
+        """
+        Scroll the scroll area to ``position`` (VSCSAD).
+
+        Display line ``top + i`` then shows the line drawn at
+        ``top + (i + position) % lines``, where ``top`` and ``lines`` are
+        the start and length of the scroll area, so the content moves
+        towards the start of :attr:`scan_axis` as ``position`` grows. Only
+        one command is sent; frame memory is not touched. displayio and
+        :meth:`write_window` keep drawing in unscrolled coordinates.
+
+        The whole display scrolls if :meth:`set_scroll_area` was not
+        called.
+
+        :param int position: Scroll offset in lines
+        """
+        if self.scroll_area is None:
+            self.set_scroll_area()
+        first, lines = self._scroll_lines
+        position %= lines
+        if position == self.scroll_position:
+            return
+        if self._layout[0] & _MADCTL_MY:
+            start = first + (-position % lines)
+        else:
+            start = first + position
+        self._bus.send(0x37, bytes((start >> 8, start & 0xFF)))
+        self.scroll_position = position
+        if self.shadow is not None:
+            # Display coordinates now map to other frame memory lines
+            self.shadow.invalidate()
+
+    def sleep(self):
+        """
+        Turn the display off and put the panel into sleep mode.
+
+        Everything known to :attr:`shadow` is forgotten, so the first
+        flush after :meth:`wake` resends the full dirty area. The
+        warm-start marker is cleared until :meth:`wake`, because the warm
+        sequence does not take the panel out of sleep.
+        """
+        self._bus.send(0x28, b"")
+        self._bus.send(0x10, b"")
+        if self.shadow is not None:
+            self.shadow.invalidate()
+        if self._warm[0] is not None:
+            forget_warm_panel(self._warm[0])
+
+    def wake(self):
+        """Leave sleep mode and turn the display back on."""
+        self._bus.send(0x11, b"")
+        time.sleep(0.08)
+        self._bus.send(0x29, b"")
+        memory, marker = self._warm
+        if memory is not None:
+            memory[:_WARM_MARKER_SIZE] = marker
+
+    def _scan_range(self, start, end, feature):
+        """Frame memory lines ``(first, stop)`` behind display scan lines."""
+        if self.rotation % 360:
+            raise RuntimeError("%s needs rotation 0 or hardware_rotation" % feature)
+        if self.scan_axis == "x":
+            offset = self._layout[3]
+            limit = self.width
+        else:
+            offset = self._layout[4]
+            limit = self.height
+        if not 0 <= start < end <= limit:
+            raise ValueError("lines %d-%d are outside the display" % (start, end))
+        first = offset + start
+        stop = offset + end
+        if self._layout[0] & _MADCTL_MY:
+            first, stop = _GRAM_WIDTH - stop, _GRAM_WIDTH - first
+        return (first, stop)
+
+    @property
+    def in_frame(self):
+        """True between :meth:`begin_frame` and :meth:`commit_frame`."""
+        return self._frame_auto_refresh is not None
+
+    def begin_frame(self, bitmap=None):
+        """
+        Start collecting draws and dirty marks for one frame.
+
+        Automatic refresh is paused until the frame is committed or
+        aborted, so nothing reaches the panel half-drawn.
+
+        :param bitmap: Bitmap that :meth:`mark_dirty` rectangles refer to
+        :raises RuntimeError: If a frame is already open
+        """
+        if self.in_frame:
+            raise RuntimeError("Frame already in progress")
+        self._frame_bitmap = bitmap
+        self._frame_auto_refresh = self.auto_refresh
+        # auto_refresh is a BusDisplay property
+        self.auto_refresh = False  # pylint: disable=attribute-defined-outside-init
+
+    def mark_dirty(self, x1, y1, x2, y2):
+        """
+        Mark a rectangle as changed for the next committed frame.
+
+        Uses the exclusive ``x2``/``y2`` convention of
+        ``displayio.Bitmap.dirty()``.
+        """
+        self.dirty.add(x1, y1, x2, y2)
+
+    def commit_frame(self):
+        """
+        Send everything drawn since :meth:`begin_frame` in one refresh.
+
+        The dirty rectangles are planned into windows by :attr:`dirty`.
+        displayio flushes one dirty area per bitmap in each refresh pass,
+        so every window is marked on the frame bitmap and refreshed in a
+        pass of its own; distant rectangles then do not drag in the space
+        between them. Without a frame bitmap their union is refreshed
+        once. Areas that displayio tracks on its own, such as label text
+        changes, are refreshed too but are not counted. With a
+        :attr:`pacer` the refresh waits for the next frame slot first.
+
+        :return: :class:`FrameStats` for the rectangles marked in this frame
+        :raises RuntimeError: If no frame is open
+        """
+        windows = self._start_commit()
+        if self.pacer is not None:
+            self.pacer.wait()
+        start = time.monotonic()
+        self._refresh_windows(windows)
+        return self._end_commit(windows, start)
+
+    async def commit_frame_async(self, chunk_rows=None):
+        """
+        :meth:`commit_frame` that lets other ``asyncio`` tasks run while
+        it waits for the frame slot and between parts of the refresh.
+
+        With a frame bitmap, each window is refreshed ``chunk_rows`` rows
+        at a time with :func:`rm690b0.refresher.refresh_windows`.
+        Without one, the refresh is a single displayio call and other
+        tasks run before and after it.
+
+        :param int chunk_rows: Rows refreshed between yields (default:
+            :attr:`chunk_rows`)
+        :return: :class:`FrameStats` for the rectangles marked in this frame
+        :raises RuntimeError: If no frame is open
+        """
+        # pylint: disable=import-outside-toplevel
+        import asyncio
+        from rm690b0.refresher import refresh_windows
+
+        windows = self._start_commit()
+        if self.pacer is not None:
+            await self.pacer.wait_async()
+        start = time.monotonic()
+        if self._frame_bitmap is None or not windows:
+            self._refresh_windows(windows)
+            await asyncio.sleep(0)
+        else:
+            await refresh_windows(self, self._frame_bitmap, windows, chunk_rows)
+        return self._end_commit(windows, start)
+
+    async def refresh_async(self, bitmap=None, *, chunk_rows=None):
+        """
+        Refresh the display from an ``asyncio`` task.
+
+        With a :attr:`pacer` the wait for the next frame slot lets other
+        tasks run. Given the bitmap that :meth:`mark_dirty` rectangles
+        refer to, the bounds of those rectangles are refreshed with
+        :func:`rm690b0.refresher.refresh_windows` and forgotten; otherwise
+        displayio sends its own dirty areas in one call.
+
+        :param bitmap: Bitmap that :attr:`dirty` rectangles refer to
+        :param int chunk_rows: Rows refreshed between yields (default:
+            :attr:`chunk_rows`)
+        """
+        # pylint: disable=import-outside-toplevel
+        import asyncio
+        from rm690b0.refresher import refresh_windows
+
+        if self.pacer is not None:
+            await self.pacer.wait_async()
+        bounds = self.dirty.bounds if bitmap is not None else None
+        if bounds is None:
+            self.refresh()
+            await asyncio.sleep(0)
+            return
+        self.dirty.clear()
+        await refresh_windows(self, bitmap, [bounds], chunk_rows)
+
+    async def write_window_async(
+        self, x, y, width, height, buffer, *, stride=None, chunk_rows=None
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        :meth:`write_window` in chunks of rows, letting other ``asyncio``
+        tasks run between them.
+
+        :param int chunk_rows: Rows sent per chunk (default:
+            :attr:`chunk_rows`)
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        if stride is None:
+            stride = width * 2
+        if chunk_rows is None:
+            chunk_rows = self.chunk_rows
+        view = memoryview(buffer)
+        itemsize = getattr(view, "itemsize", 1)
+        for row in range(0, height, chunk_rows):
+            count = min(chunk_rows, height - row)
+            self.write_window(
+                x,
+                y + row,
+                width,
+                count,
+                view[row * stride // itemsize :],
+                stride=stride,
+            )
+            await asyncio.sleep(0)
+
+    def abort_frame(self):
+        """Close the open frame without refreshing the display."""
+        if self.in_frame:
+            self._end_frame()
+
+    def frame(self, bitmap=None):
+        """
+        Context manager wrapping :meth:`begin_frame` and :meth:`commit_frame`.
+
+        The frame is committed when the block exits normally and aborted if
+        it raises. The resulting :class:`FrameStats` is available as
+        ``stats`` on the returned object.
+
+        :param bitmap: Bitmap that :meth:`mark_dirty` rectangles refer to
+        """
+        return _Frame(self, bitmap)
+
+    def _start_commit(self):
+        """Windows to flush for the open frame, as ``(x1, y1, x2, y2)``."""
+        if not self.in_frame:
+            raise RuntimeError("No frame in progress")
+        if self._frame_bitmap is not None:
+            return self.dirty.plan()
+        bounds = self.dirty.bounds
+        return [] if bounds is None else [bounds]
+
+    def _refresh_windows(self, windows):
+        """Refresh each window in a pass of its own, or once if none."""
+        bitmap = self._frame_bitmap
+        if bitmap is None or not windows:
+            self.refresh()
+            return
+        for x1, y1, x2, y2 in windows:
+            bitmap.dirty(x1=x1, y1=y1, x2=x2, y2=y2)
+            self.refresh()
+
+    def _end_commit(self, windows, start):
+        elapsed = time.monotonic() - start
+        self._end_frame()
+        pixels = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in windows)
+        self.last_frame = FrameStats(len(windows), pixels, pixels * 2, elapsed)
+        return self.last_frame
+
+    def _end_frame(self):
+        self.dirty.clear()
+        restore = self._frame_auto_refresh
+        self.auto_refresh = restore  # pylint: disable=attribute-defined-outside-init
+        self._frame_auto_refresh = None
+        self._frame_bitmap = None
+
+
+def _address(start, end):
+    return bytes((start >> 8, start & 0xFF, end >> 8, end & 0xFF))
+
+
+def create_qspi_bus(board_module, frequency=None, reset=True, profile=None):
+    """
+    Helper function to create QSPI bus with automatic pin detection.
+
+    The pins come from the board's :class:`rm690b0.boards.BoardProfile`,
+    found by board id or by the first known pin naming convention the
+    board module matches. The lookup is cached per board.
+
+    :param board_module: The board module (typically `board`)
+    :param int frequency: QSPI bus frequency in Hz (default: the frequency
+        saved by :func:`rm690b0.boards.store_frequency`, else the
+        profile's known-good frequency, 40MHz for the built-in profiles)
+    :param bool reset: Use the panel reset pin if the board has one; pass
+        False to keep a warm panel's state (default: True)
+    :param profile: :class:`rm690b0.boards.BoardProfile` to use instead
+        of detecting one
+    :return: QSPIBus instance
+    :raises AttributeError: If required pins are not found
+
+    Example:
+
+        import board
+        from rm690b0 import create_qspi_bus, RM690B0
+
+        bus = create_qspi_bus(board)
+        display = RM690B0(bus)
+    """
+    import qspibus  # pylint: disable=import-outside-toplevel
+
+    if profile is None:
+        profile = detect_profile(board_module)
+    pins = resolve_pins(board_module, profile)
+    if frequency is None:
+        frequency = stored_frequency() or profile.max_frequency
+
+    return qspibus.QSPIBus(
+        clock=pins["clock"],
+        data0=pins["data0"],
+        data1=pins["data1"],
+        data2=pins["data2"],
+        data3=pins["data3"],
+        cs=pins["cs"],
+        reset=pins["reset"] if reset else None,
+        frequency=frequency,
+    )
@@ -0,0 +1,529 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.anim`
+====================================================
+
+Delta-encoded animations, played straight to the panel.
+
+An animation stores keyframes, which hold the whole picture, and delta
+frames, which hold only the rectangles that changed since the frame
+before, each run-length compressed like an :mod:`rm690b0.image`. The
+panel's frame memory keeps everything else, so the data read and sent
+per frame grows with the motion, not the screen size.
+
+:class:`AnimationPlayer` shows frames at a target rate through
+:meth:`rm690b0.RM690B0.write_window`. After sending a frame it reads the
+next one, so the file read falls into the wait for the next frame slot
+rather than after it. A frame more than one slot late makes the player
+jump to the next keyframe if that is already due; delta frames cannot be
+skipped on their own, since later frames build on them, so without a
+keyframe in reach the animation runs slower instead. :func:`encode` and
+``python -m rm690b0.anim`` create the files on a host.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+The format is a 16-byte header, ``b"RA56"`` followed by the width,
+height, frame count and frame duration in milliseconds as big-endian
+16-bit values and the size of the largest frame record as a big-endian
+32-bit value. Each frame record starts with its size after the size
+field (32-bit), its flags (16-bit, bit 0 marks a keyframe) and its
+rectangle count (16-bit). Each rectangle has ``x``, ``y``, ``width`` and
+``height`` (16-bit) and the size of its pixel data (32-bit), followed by
+the pixels as RL56 packets without the image header. All values are
+big-endian.
+
+The reader holds two frame buffers of the largest record size and the
+player two band buffers, so no pixel data is allocated per frame and a
+buffer is not overwritten while a previous transfer from it may still be
+queued.
+
+Example:
+
+    from rm690b0.anim import AnimationPlayer
+
+    display = RM690B0(bus)
+    player = AnimationPlayer(display, "/boot.ra56")
+    player.play()
+
+On a host::
+
+    python -m rm690b0.anim boot.ra56 30 boot.gif
+"""
+
+import io
+import sys
+
+from rm690b0.color import rgb565_values
+from rm690b0.image import ImageError
+from rm690b0.image import encode as encode_image
+from rm690b0.image import read_ppm
+from rm690b0.pacing import FramePacer
+from rm690b0.regions import DirtyRegionTracker
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+MAGIC = b"RA56"
+"""First bytes of every animation."""
+
+KEYFRAME = 0x01
+"""Frame flag of a keyframe."""
+
+_HEADER_SIZE = 16
+_RECORD_HEADER = 8
+_RECT_HEADER = 12
+
+
+def _u16(data, pos):
+    return data[pos] << 8 | data[pos + 1]
+
+
+def _u32(data, pos):
+    return _u16(data, pos) << 16 | _u16(data, pos + 2)
+
+
+class AnimationReader:  # pylint: disable=too-many-instance-attributes
+    """
+    Reads the frames of an RA56 animation.
+
+    :param source: Path, binary file object or bytes of the animation;
+        file objects must support ``seek``
+    :raises ImageError: If the data is not an RA56 animation
+    """
+
+    def __init__(self, source):
+        self._owned = isinstance(source, str)
+        if self._owned:
+            source = open(source, "rb")  # pylint: disable=consider-using-with
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        self._stream = source
+        header = source.read(_HEADER_SIZE)
+        if len(header) < _HEADER_SIZE or header[:4] != MAGIC:
+            self.close()
+            raise ImageError("not an RA56 animation")
+        self.width = _u16(header, 4)
+        """Animation width in pixels."""
+        self.height = _u16(header, 6)
+        """Animation height in pixels."""
+        self.frames = _u16(header, 8)
+        """Number of frames."""
+        self.frame_ms = _u16(header, 10)
+        """Duration of a frame in milliseconds."""
+        largest = _u32(header, 12)
+        self._buffers = (bytearray(largest), bytearray(largest))
+        self._offsets = []
+        self.keyframes = []
+        """Indices of the keyframes."""
+        self._scan()
+        self._position = None
+        self._turn = 0
+        self._prefetched = None
+
+    def _scan(self):
+        record = bytearray(_RECORD_HEADER)
+        offset = _HEADER_SIZE
+        for index in range(self.frames):
+            self._stream.seek(offset)
+            if self._stream.readinto(record) != _RECORD_HEADER:
+                raise ImageError("animation data ends early")
+            self._offsets.append(offset)
+            if _u16(record, 4) & KEYFRAME:
+                self.keyframes.append(index)
+            offset += 4 + _u32(record, 0)
+
+    def next_keyframe(self, index):
+        """
+        First keyframe at or after a frame.
+
+        :return: Frame index, or None if there is none
+        """
+        for keyframe in self.keyframes:
+            if keyframe >= index:
+                return keyframe
+        return None
+
+    def read_frame(self, index):
+        """
+        Frame record of a frame, from the prefetch if there is one.
+
+        The returned view stays valid until the next but one read.
+
+        :param int index: Frame index
+        :return: ``(flags, rects)``, with ``rects`` a list of ``(x, y,
+            width, height, data)`` tuples whose ``data`` is a memoryview of
+            RL56 packets
+        :raises ImageError: If the frame data is invalid
+        """
+        if self._prefetched is not None and self._prefetched[0] == index:
+            frame = self._prefetched[1]
+            self._prefetched = None
+            return frame
+        return self._read(index)
+
+    def prefetch(self, index):
+        """
+        Read a frame ahead of :meth:`read_frame`.
+
+        Does nothing past the last frame.
+        """
+        if 0 <= index < self.frames:
+            self._prefetched = (index, self._read(index))
+
+    def close(self):
+        """Close the source if the reader opened it."""
+        if self._owned:
+            self._stream.close()
+            self._owned = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _read(self, index):
+        offset = self._offsets[index]
+        if offset != self._position:
+            self._stream.seek(offset)
+        buffer = self._buffers[self._turn]
+        self._turn ^= 1
+        view = memoryview(buffer)
+        if self._stream.readinto(view[:4]) != 4:
+            raise ImageError("animation data ends early")
+        size = _u32(buffer, 0)
+        if size + 4 > len(buffer) or self._stream.readinto(view[4 : 4 + size]) != size:
+            raise ImageError("animation frame is truncated")
+        self._position = offset + 4 + size
+        rects = []
+        pos = _RECORD_HEADER
+        for _ in range(_u16(buffer, 6)):
+            length = _u32(buffer, pos + 8)
+            start = pos + _RECT_HEADER
+            rects.append(
+                (
+                    _u16(buffer, pos),
+                    _u16(buffer, pos + 2),
+                    _u16(buffer, pos + 4),
+                    _u16(buffer, pos + 6),
+                    view[start : start + length],
+                )
+            )
+            pos = start + length
+        return (_u16(buffer, 4), rects)
+
+
+class _Packets:
+    """Decoder of RL56 packets already in memory."""
+
+    def __init__(self, data):
+        self._data = data
+        self._pos = 0
+        self._left = 0
+        self._run = None
+
+    def read_pixels(self, view):
+        """Decode the next pixels, filling ``view`` completely."""
+        data = self._data
+        size = len(view)
+        pos = 0
+        while pos < size:
+            if not self._left:
+                self._next_packet()
+            count = min(self._left, (size - pos) // 2)
+            stop = pos + count * 2
+            if self._run is None:
+                view[pos:stop] = data[self._pos : self._pos + count * 2]
+                self._pos += count * 2
+            else:
+                view[pos : pos + 2] = self._run
+                filled = 2
+                while pos + filled < stop:
+                    step = min(filled, stop - pos - filled)
+                    view[pos + filled : pos + filled + step] = view[pos : pos + step]
+                    filled += step
+            pos = stop
+            self._left -= count
+
+    def _next_packet(self):
+        data = self._data
+        pos = self._pos
+        if pos >= len(data):
+            raise ImageError("rectangle data ends early")
+        header = data[pos]
+        count = header & 0x3F
+        pos += 1
+        if header & 0x40:
+            count = count << 8 | data[pos]
+            pos += 1
+        self._left = count + 1
+        if header & 0x80:
+            self._run = data[pos : pos + 2]
+            pos += 2
+        else:
+            self._run = None
+        self._pos = pos
+
+
+class AnimationPlayer:  # pylint: disable=too-many-instance-attributes
+    """
+    Plays an RA56 animation on an RM690B0.
+
+    :param display: :class:`rm690b0.RM690B0`; see
+        :meth:`~rm690b0.RM690B0.write_window` for the rotation, alignment
+        and displayio caveats
+    :param source: Path, binary file object or bytes of the animation
+    :param int x: Left edge; must be even
+    :param int y: Top edge
+    :param float fps: Frame rate (default: the rate stored in the file)
+    :param bool loop: Start over after the last frame (default: False)
+    :param int band_size: Bytes of each of the two band buffers; a band
+        holds at least one row (default: 9600)
+    """
+
+    def __init__(
+        self, display, source, *, x=0, y=0, fps=None, loop=False, band_size=9600
+    ):  # pylint: disable=too-many-arguments
+        self.display = display
+        self.reader = AnimationReader(source)
+        self.x = x
+        self.y = y
+        self.loop = loop
+        if fps is None:
+            fps = 1000 / max(1, self.reader.frame_ms)
+        te_source = display.pacer.te_source if display.pacer is not None else None
+        self.pacer = FramePacer(fps, te_source)
+        """:class:`rm690b0.pacing.FramePacer` setting the frame slots."""
+        self._bands = (bytearray(band_size), bytearray(band_size))
+        self._turn = 0
+        self.index = 0
+        """Index of the next frame to show."""
+        self.shown = 0
+        """Frames sent."""
+        self.skipped = 0
+        """Frames jumped over to catch up with the schedule."""
+        self.bytes_sent = 0
+        """Pixel bytes sent."""
+
+    def play_frame(self):
+        """
+        Wait for the next frame slot and show the next frame.
+
+        :return: False once the animation has ended
+        """
+        reader = self.reader
+        if self.index >= reader.frames:
+            if not self.loop or not reader.frames:
+                return False
+            self.index = 0
+        late = self.pacer.dropped
+        self.pacer.wait()
+        late = self.pacer.dropped - late
+        if late:
+            keyframe = reader.next_keyframe(self.index + 1)
+            if keyframe is not None and keyframe <= self.index + late:
+                self.skipped += keyframe - self.index
+                self.index = keyframe
+        _, rects = reader.read_frame(self.index)
+        for rect in rects:
+            self._send(*rect)
+        self.shown += 1
+        self.index += 1
+        if self.index < reader.frames:
+            reader.prefetch(self.index)
+        elif self.loop:
+            reader.prefetch(0)
+        return True
+
+    def play(self):
+        """Play until the end, or forever with ``loop``."""
+        while self.play_frame():
+            pass
+
+    def close(self):
+        """Close the animation source."""
+        self.reader.close()
+
+    def _send(
+        self, x, y, width, height, data
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        packets = _Packets(data)
+        row_bytes = width * 2
+        rows = max(1, len(self._bands[0]) // row_bytes)
+        for top in range(0, height, rows):
+            count = min(rows, height - top)
+            band = self._bands[self._turn]
+            self._turn ^= 1
+            if len(band) < count * row_bytes:
+                band = bytearray(count * row_bytes)
+            view = memoryview(band)[: count * row_bytes]
+            packets.read_pixels(view)
+            self.display.write_window(self.x + x, self.y + y + top, width, count, view)
+            self.bytes_sent += len(view)
+
+
+def _changed_rects(previous, current, width, height, tile_size):
+    """Rectangles covering the tiles that differ between two frames."""
+    # pylint: disable=too-many-arguments,too-many-locals
+    dirty = DirtyRegionTracker(width, height, window_cost=64, max_rects=16)
+    for top in range(0, height, tile_size):
+        bottom = min(top + tile_size, height)
+        rows = [
+            row
+            for row in range(top, bottom)
+            if previous[row * width : (row + 1) * width]
+            != current[row * width : (row + 1) * width]
+        ]
+        if not rows:
+            continue
+        for left in range(0, width, tile_size):
+            right = min(left + tile_size, width)
+            for row in rows:
+                start = row * width
+                if (
+                    previous[start + left : start + right]
+                    != current[start + left : start + right]
+                ):
+                    dirty.add(left, top, right, bottom)
+                    break
+    return dirty.plan()
+
+
+def encode(frames, width, height, *, frame_ms=33, keyframe_interval=0, tile_size=8):
+    """
+    Delta-encode frames into an RA56 animation.
+
+    The first frame is always a keyframe. A delta frame whose rectangles
+    cover the whole frame is stored as one.
+
+    :param frames: Iterable of frames, each a sequence of ``width *
+        height`` RGB565 values in row order
+    :param int width: Frame width; must be even
+    :param int height: Frame height
+    :param int frame_ms: Frame duration in milliseconds (default: 33)
+    :param int keyframe_interval: Frames between forced keyframes, or 0 for
+        none beyond the first; keyframes let the player catch up and seek
+        (default: 0)
+    :param int tile_size: Granularity of change detection in pixels; must
+        be even (default: 8)
+    :return: Animation as ``bytes``
+    :raises ValueError: If the size is odd or out of range, or a frame
+        has the wrong number of pixels
+    """
+    # pylint: disable=too-many-arguments,too-many-locals
+    if width % 2 or tile_size % 2:
+        raise ValueError("width and tile_size must be even")
+    records = []
+    previous = None
+    for index, pixels in enumerate(frames):
+        pixels = list(pixels)
+        if len(pixels) != width * height:
+            raise ValueError("frame %d has %d pixels" % (index, len(pixels)))
+        keyframe = _record(KEYFRAME, [(0, 0, width, height)], pixels, width)
+        if previous is None or (keyframe_interval and index % keyframe_interval == 0):
+            record = keyframe
+        else:
+            rects = _changed_rects(previous, pixels, width, height, tile_size)
+            area = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in rects)
+            record = (
+                keyframe if area >= width * height else _record(0, rects, pixels, width)
+            )
+        records.append(record)
+        previous = pixels
+    if not 0 < len(records) < 0x10000:
+        raise ValueError("frame count out of range")
+    out = bytearray(MAGIC)
+    for value in (width, height, len(records), frame_ms):
+        out += value.to_bytes(2, "big")
+    out += max(len(record) for record in records).to_bytes(4, "big")
+    for record in records:
+        out += record
+    return bytes(out)
+
+
+def _record(flags, rects, pixels, width):
+    body = bytearray(flags.to_bytes(2, "big") + len(rects).to_bytes(2, "big"))
+    for x1, y1, x2, y2 in rects:
+        block = [
+            value
+            for row in range(y1, y2)
+            for value in pixels[row * width + x1 : row * width + x2]
+        ]
+        # Drop the 8-byte RL56 header; the rectangle header holds the size
+        data = encode_image(block, x2 - x1, y2 - y1)[8:]
+        for value in (x1, y1, x2 - x1, y2 - y1):
+            body += value.to_bytes(2, "big")
+        body += len(data).to_bytes(4, "big") + data
+    return len(body).to_bytes(4, "big") + body
+
+
+def _load_frames(path):
+    """Yield ``(width, height, pixels)`` of every frame in an image file."""
+    if path.lower().endswith((".ppm", ".pnm")):
+        yield read_ppm(path)
+        return
+    from PIL import Image, ImageSequence  # pylint: disable=import-outside-toplevel
+
+    with Image.open(path) as image:
+        for frame in ImageSequence.Iterator(image):
+            frame = frame.convert("RGB")
+            yield frame.size + (rgb565_values(frame.tobytes()),)
+
+
+def encode_files(sources, dest, fps, keyframe_interval=0):
+    """
+    Encode image files into an RA56 animation file.
+
+    :param sources: Paths of PPM files, or any images Pillow can open;
+        every frame of an animated image is used
+    :param str dest: Output path
+    :param float fps: Frame rate
+    :param int keyframe_interval: As for :func:`encode`
+    :return: ``(width, height, frames, size)`` with the file size in bytes
+    """
+    frames = []
+    size = None
+    for path in sources:
+        for width, height, pixels in _load_frames(path):
+            if size is None:
+                size = (width, height)
+            elif (width, height) != size:
+                raise ValueError("%s is not %dx%d" % (path, size[0], size[1]))
+            frames.append(pixels)
+    if size is None:
+        raise ValueError("no frames given")
+    data = encode(
+        frames,
+        size[0],
+        size[1],
+        frame_ms=round(1000 / fps),
+        keyframe_interval=keyframe_interval,
+    )
+    with open(dest, "wb") as stream:
+        stream.write(data)
+    return size[0], size[1], len(frames), len(data)
+
+
+def main():
+    """Encode images given on the command line: ``DEST FPS SOURCE...``."""
+    if len(sys.argv) < 4:
+        print("usage: python -m rm690b0.anim DEST FPS SOURCE...")
+        sys.exit(2)
+    fps = float(sys.argv[2])
+    width, height, frames, size = encode_files(
+        sys.argv[3:], sys.argv[1], fps, keyframe_interval=round(fps)
+    )
+    print(
+        "%dx%d, %d frames, %d bytes (%.1f%% of raw RGB565)"
+        % (width, height, frames, size, 100 * size / (width * height * 2 * frames))
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,394 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.bands`
+====================================================
+
+Band rendering: composing the screen a few rows at a time.
+
+A :class:`BandRenderer` owns one buffer of ``band_height`` full-width
+rows. On :meth:`BandRenderer.render` it walks the display from top to
+bottom, lets every layer draw into the buffer the part of the band that
+is dirty, and sends it with :meth:`rm690b0.RM690B0.write_window` before
+reusing the buffer for the next band. Bands that hold no dirty rectangle
+are skipped without drawing. A scene needs ``600 * band_height * 2``
+bytes instead of a 540KB canvas.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+Layers are callables taking a :class:`Band`. They are called in order for
+every band, so later layers draw over earlier ones, and should draw
+through :meth:`Band.fill_rect` and :meth:`Band.blit`, which clip to the
+area being rendered. Layers must be able to redraw any band at any time;
+state that only exists on screen, like an image decoded once, does not
+fit this model.
+
+Smaller bands need less memory but send more windows, each with its own
+setup cost. :func:`compare_band_heights` measures both on the actual
+board.
+
+Example:
+
+    display = RM690B0(bus, band_height=16)
+    bands = display.bands
+    ball = SolidRect(100, 100, 24, 24, 0xF800)
+    bands.layers = [SolidRect(0, 0, 600, 450, 0x0000), ball]
+    bands.mark_all()
+    bands.render()
+    bands.mark_dirty(*ball.bounds)
+    ball.x += 4
+    bands.mark_dirty(*ball.bounds)
+    bands.render()
+"""
+
+import gc
+import time
+from collections import namedtuple
+
+from rm690b0.regions import DirtyRegionTracker
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+BandStats = namedtuple(
+    "BandStats",
+    ("band_height", "buffer_bytes", "bands", "skipped", "pixels", "elapsed"),
+)
+"""
+Result of one :meth:`BandRenderer.render`.
+
+``bands`` counts the bands sent and ``skipped`` those with nothing dirty
+or, with a tile shadow, nothing changed;
+``pixels`` is the number of pixels sent and ``elapsed`` the time taken in
+seconds.
+"""
+
+if hasattr(time, "monotonic_ns"):
+
+    def _now():
+        return time.monotonic_ns() / 1e9
+
+else:
+    _now = time.monotonic
+
+
+class Band:
+    """
+    Band of rows being rendered, handed to each layer.
+
+    Coordinates are display coordinates. Drawing is clipped to
+    :attr:`area`.
+    """
+
+    def __init__(self, buffer, stride):
+        self.buffer = buffer
+        """Band pixels, big-endian RGB565, as a memoryview."""
+        self.stride = stride
+        """Bytes per band row."""
+        self.top = 0
+        """Display row of the first band row."""
+        self.area = (0, 0, 0, 0)
+        """Part of the display being rendered, as ``(x1, y1, x2, y2)``."""
+
+    def fill_rect(
+        self, x, y, width, height, color
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Fill a rectangle.
+
+        :param int color: RGB565 colour
+        """
+        x1, y1, x2, y2 = self._clip(x, y, width, height)
+        if x2 <= x1 or y2 <= y1:
+            return
+        row = bytes((color >> 8, color & 0xFF)) * (x2 - x1)
+        buffer = self.buffer
+        stride = self.stride
+        start = (y1 - self.top) * stride + x1 * 2
+        for start in range(start, start + (y2 - y1) * stride, stride):
+            buffer[start : start + len(row)] = row
+
+    def blit(
+        self, x, y, width, height, pixels, *, stride=None
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments,too-many-locals
+        """
+        Copy a block of pixels.
+
+        :param pixels: ``width * height`` big-endian RGB565 pixels, row by
+            row, in any buffer
+        :param int stride: Bytes from one source row to the next
+            (default: ``width * 2``)
+        """
+        x1, y1, x2, y2 = self._clip(x, y, width, height)
+        if x2 <= x1 or y2 <= y1:
+            return
+        source = memoryview(pixels)
+        if stride is None:
+            stride = width * 2
+        count = (x2 - x1) * 2
+        src = (y1 - y) * stride + (x1 - x) * 2
+        dest = (y1 - self.top) * self.stride + x1 * 2
+        buffer = self.buffer
+        for _ in range(y2 - y1):
+            buffer[dest : dest + count] = source[src : src + count]
+            src += stride
+            dest += self.stride
+
+    def _clip(self, x, y, width, height):
+        area = self.area
+        return (
+            max(x, area[0]),
+            max(y, area[1]),
+            min(x + width, area[2]),
+            min(y + height, area[3]),
+        )
+
+
+class SolidRect:  # pylint: disable=too-few-public-methods
+    """
+    Layer drawing a filled rectangle.
+
+    :param int color: RGB565 colour
+    """
+
+    def __init__(
+        self, x, y, width, height, color
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.color = color
+
+    @property
+    def bounds(self):
+        """Covered ``(x1, y1, x2, y2)``, for marking dirty."""
+        return (self.x, self.y, self.x + self.width, self.y + self.height)
+
+    def __call__(self, band):
+        band.fill_rect(self.x, self.y, self.width, self.height, self.color)
+
+
+class PixelBlock(SolidRect):  # pylint: disable=too-few-public-methods
+    """
+    Layer drawing a block of big-endian RGB565 pixels, such as an icon.
+
+    :param pixels: ``width * height * 2`` bytes of pixel data
+    """
+
+    def __init__(
+        self, x, y, width, height, pixels
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        super().__init__(x, y, width, height, None)
+        self.pixels = pixels
+
+    def __call__(self, band):
+        band.blit(self.x, self.y, self.width, self.height, self.pixels)
+
+
+class BandRenderer:
+    """
+    Renders layers into one reusable band buffer and sends it band by band.
+
+    :param display: :class:`rm690b0.RM690B0` to render to; its rotation
+        must be 0 or done in hardware
+    :param int band_height: Rows per band (default: 16)
+    """
+
+    def __init__(self, display, band_height=16):
+        self.display = display
+        self.width = display.width
+        self.height = display.height
+        self.layers = []
+        """Callables taking a :class:`Band`, drawn in order."""
+        self.dirty = DirtyRegionTracker(self.width, self.height)
+        """Rectangles to render on the next :meth:`render`."""
+        self.last_render = None
+        """:class:`BandStats` of the most recent :meth:`render`."""
+        self._band = None
+        self._band_height = 0
+        self.band_height = band_height
+
+    @property
+    def band_height(self):
+        """Rows per band; setting it reallocates the band buffer."""
+        return self._band_height
+
+    @band_height.setter
+    def band_height(self, rows):
+        rows = max(1, min(rows, self.height))
+        if rows == self._band_height:
+            return
+        self._band = None
+        gc.collect()
+        stride = self.width * 2
+        self._band = Band(memoryview(bytearray(stride * rows)), stride)
+        self._band_height = rows
+
+    @property
+    def buffer_bytes(self):
+        """Size of the band buffer in bytes."""
+        return len(self._band.buffer)
+
+    def mark_dirty(self, x1, y1, x2, y2):
+        """Mark a rectangle to be rendered on the next :meth:`render`."""
+        self.dirty.add(x1, y1, x2, y2)
+
+    def mark_all(self):
+        """Render the whole display on the next :meth:`render`."""
+        self.dirty.add_all()
+
+    def render(self):
+        """
+        Draw and send every band that holds dirty rectangles.
+
+        Each band sends the columns spanned by the dirty rectangles
+        crossing it, over the rows they cover. With a
+        :attr:`rm690b0.RM690B0.shadow` whose tile size divides
+        :attr:`band_height`, that area is widened to whole tiles and only
+        the tiles that changed are sent.
+
+        :return: :class:`BandStats`
+        """
+        for _ in self._render_bands():
+            pass
+        return self.last_render
+
+    async def render_async(self):
+        """
+        :meth:`render` that lets other ``asyncio`` tasks run after each
+        band sent.
+
+        :return: :class:`BandStats`
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        for _ in self._render_bands():
+            await asyncio.sleep(0)
+        return self.last_render
+
+    def _render_bands(self):  # pylint: disable=too-many-locals
+        """Render band by band, yielding after each band sent."""
+        start = _now()
+        rects = self.dirty.plan()
+        self.dirty.clear()
+        band = self._band
+        rows = self._band_height
+        sent = 0
+        skipped = 0
+        pixels = 0
+        shadow = self.display.shadow
+        if shadow is not None and rows % shadow.tile_size:
+            shadow = None
+        for top in range(0, self.height, rows):
+            bottom = min(top + rows, self.height)
+            area = _band_area(rects, top, bottom)
+            if area is None:
+                skipped += 1
+                continue
+            if shadow is not None:
+                area = _tile_aligned(area, shadow.tile_size, self.width, bottom)
+            band.top = top
+            band.area = tuple(area)
+            for layer in self.layers:
+                layer(band)
+            windows = [band.area]
+            if shadow is not None:
+                windows = shadow.changed(band.buffer, band.stride, area, buffer_top=top)
+            for x1, y1, x2, y2 in windows:
+                self.display.write_window(
+                    x1,
+                    y1,
+                    x2 - x1,
+                    y2 - y1,
+                    band.buffer[(y1 - top) * band.stride + x1 * 2 :],
+                    stride=band.stride,
+                )
+                pixels += (x2 - x1) * (y2 - y1)
+            if shadow is not None:
+                shadow.commit()
+            if windows:
+                sent += 1
+                yield
+            else:
+                skipped += 1
+        self.last_render = BandStats(
+            rows, self.buffer_bytes, sent, skipped, pixels, _now() - start
+        )
+
+
+def _band_area(rects, top, bottom):
+    """Union of the parts of ``rects`` between rows ``top`` and ``bottom``."""
+    area = None
+    for x1, y1, x2, y2 in rects:
+        if y1 < bottom and top < y2:
+            if area is None:
+                area = [x1, max(y1, top), x2, min(y2, bottom)]
+            else:
+                area[0] = min(area[0], x1)
+                area[1] = min(area[1], max(y1, top))
+                area[2] = max(area[2], x2)
+                area[3] = max(area[3], min(y2, bottom))
+    return area
+
+
+def _tile_aligned(area, tile, width, bottom):
+    return [
+        area[0] - area[0] % tile,
+        area[1] - area[1] % tile,
+        min(width, area[2] + (-area[2] % tile)),
+        min(bottom, area[3] + (-area[3] % tile)),
+    ]
+
+
+def compare_band_heights(display, layers, heights=(4, 8, 16, 32, 64), iterations=3):
+    """
+    Render a full-screen scene with several band heights.
+
+    Every height gets its own renderer, so the memory figures include the
+    band buffer. ``mem_used`` is the heap allocated from creating the
+    renderer to the end of the last render, transient allocations
+    included, or None where ``gc.mem_free`` is missing.
+
+    :param display: :class:`rm690b0.RM690B0` to render to
+    :param layers: Layers as for :attr:`BandRenderer.layers`
+    :param heights: Band heights to try
+    :param int iterations: Full-screen renders timed per height
+    :return: List of dicts with ``band_height``, ``buffer_bytes``,
+        ``mem_used``, ``bands`` per frame, ``frame_ms`` and ``mpixel_s``
+    """
+    results = []
+    for height in heights:
+        gc.collect()
+        # pylint: disable=no-member
+        free = gc.mem_free() if hasattr(gc, "mem_free") else None
+        renderer = BandRenderer(display, height)
+        renderer.layers = list(layers)
+        elapsed = 0.0
+        stats = None
+        for _ in range(iterations):
+            renderer.mark_all()
+            stats = renderer.render()
+            elapsed += stats.elapsed
+        used = None
+        if free is not None:
+            used = free - gc.mem_free()
+        results.append(
+            {
+                "band_height": stats.band_height,
+                "buffer_bytes": stats.buffer_bytes,
+                "mem_used": used,
+                "bands": stats.bands,
+                "frame_ms": round(elapsed / iterations * 1000, 2),
+                "mpixel_s": round(
+                    stats.pixels * iterations / elapsed / 1e6 if elapsed else 0, 3
+                ),
+            }
+        )
+        del renderer
+    return results
@@ -0,0 +1,346 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.benchmark`
+====================================================
+
+Repeatable display benchmark scenarios with JSON-lines output.
+
+Each scenario runs a number of warm-up iterations, then times a fixed
+number of measured ones and reports min/median/p95/p99, throughput in
+Mpixel/s and MB/s, and the change in free memory. Results are emitted as
+one JSON object per line so runs can be compared across firmware and
+driver versions.
+
+Scenarios draw through a small target interface. :class:`DisplayTarget`
+drives a real :class:`rm690b0.RM690B0` through displayio, and
+:class:`HostTarget` renders into a byte buffer and flushes dirty windows
+over any bus, typically an emulator bus, so the same scenarios also run
+on a host.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Example:
+
+    from rm690b0.benchmark import DisplayTarget, run_all
+
+    target = DisplayTarget(display, bitmap)
+    for result in run_all(target):
+        print(result)
+
+On a host, ``python -m rm690b0.benchmark`` runs every scenario against the
+panel emulator.
+"""
+
+import gc
+import json
+import sys
+import time
+
+from rm690b0 import DirtyRegionTracker, __version__ as _driver_version
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+_COLORS = (0xF800, 0x07E0, 0x001F, 0xFFE0, 0x07FF, 0xF81F)
+
+if hasattr(time, "monotonic_ns"):
+
+    def _now():
+        return time.monotonic_ns() / 1e9
+
+else:
+    _now = time.monotonic
+
+
+class DisplayTarget:
+    """
+    Benchmark target drawing into a displayio bitmap on an RM690B0.
+
+    The bitmap must be a full-screen 65536-colour bitmap shown through an
+    RGB565 ``ColorConverter``. Each iteration is one committed frame.
+
+    :param display: :class:`rm690b0.RM690B0` instance
+    :param bitmap: Full-screen ``displayio.Bitmap`` shown on the display
+    """
+
+    name = "displayio"
+
+    def __init__(self, display, bitmap):
+        import bitmaptools  # pylint: disable=import-outside-toplevel
+
+        self._bitmaptools = bitmaptools
+        self.display = display
+        self.bitmap = bitmap
+        self.width = bitmap.width
+        self.height = bitmap.height
+        self.bytes_sent = 0
+
+    def begin(self):
+        """Start drawing one iteration."""
+        self.display.begin_frame(self.bitmap)
+
+    def fill_rect(
+        self, x, y, width, height, color
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Fill a rectangle with an RGB565 colour."""
+        self._bitmaptools.fill_region(self.bitmap, x, y, x + width, y + height, color)
+        self.display.mark_dirty(x, y, x + width, y + height)
+
+    def scroll(self, rows, color):
+        """Move the whole image up by ``rows`` rows and fill the gap."""
+        self._bitmaptools.blit(
+            self.bitmap, self.bitmap, 0, 0, x1=0, y1=rows, x2=self.width, y2=self.height
+        )
+        self.fill_rect(0, self.height - rows, self.width, rows, color)
+        self.display.mark_dirty(0, 0, self.width, self.height)
+
+    def commit(self):
+        """Send the iteration to the panel."""
+        self.bytes_sent += self.display.commit_frame().bytes
+
+
+class HostTarget:
+    """
+    Benchmark target rendering into a wire-order RGB565 byte buffer.
+
+    Dirty rectangles are planned with a :class:`rm690b0.DirtyRegionTracker`
+    and sent as CASET/RASET/RAMWR windows, the same traffic shape the
+    driver produces on hardware.
+
+    :param bus: Bus with a ``send()`` method, such as
+        :class:`rm690b0.emulator.FakeQSPIBus`
+    :param int width: Canvas width in pixels (default: 600)
+    :param int height: Canvas height in pixels (default: 450)
+    :param int rowstart: Row offset added to RASET (default: 16)
+    """
+
+    name = "host"
+
+    def __init__(self, bus, width=600, height=450, rowstart=16):
+        self.bus = bus
+        self.width = width
+        self.height = height
+        self.rowstart = rowstart
+        self.canvas = bytearray(width * height * 2)
+        self.dirty = DirtyRegionTracker(width, height)
+        self.bytes_sent = 0
+
+    def begin(self):
+        """Start drawing one iteration."""
+        self.dirty.clear()
+
+    def fill_rect(
+        self, x, y, width, height, color
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Fill a rectangle with an RGB565 colour."""
+        x1 = max(0, x)
+        x2 = min(self.width, x + width)
+        if x2 <= x1:
+            return
+        row = bytes((color >> 8, color & 0xFF)) * (x2 - x1)
+        stride = self.width * 2
+        for line in range(max(0, y), min(self.height, y + height)):
+            start = line * stride + x1 * 2
+            self.canvas[start : start + len(row)] = row
+        self.dirty.add(x, y, x + width, y + height)
+
+    def scroll(self, rows, color):
+        """Move the whole image up by ``rows`` rows and fill the gap."""
+        shift = rows * self.width * 2
+        self.canvas[:-shift] = self.canvas[shift:]
+        self.fill_rect(0, self.height - rows, self.width, rows, color)
+        self.dirty.add_all()
+
+    def commit(self):
+        """Send the dirty windows over the bus."""
+        canvas = memoryview(self.canvas)
+        stride = self.width * 2
+        for x1, y1, x2, y2 in self.dirty.plan():
+            self.bus.send(0x2A, _address(x1, x2 - 1))
+            self.bus.send(0x2B, _address(y1 + self.rowstart, y2 - 1 + self.rowstart))
+            if x1 == 0 and x2 == self.width:
+                payload = canvas[y1 * stride : y2 * stride]
+            else:
+                payload = b"".join(
+                    canvas[line * stride + x1 * 2 : line * stride + x2 * 2]
+                    for line in range(y1, y2)
+                )
+            self.bus.send(0x2C, payload)
+            self.bytes_sent += len(payload)
+        self.dirty.clear()
+
+
+def _address(start, end):
+    return bytes((start >> 8, start & 0xFF, end >> 8, end & 0xFF))
+
+
+def _full_fill(target, i):
+    target.fill_rect(0, 0, target.width, target.height, _COLORS[i % len(_COLORS)])
+    return target.width * target.height
+
+
+def _partial_100(target, i):
+    x = (i * 43) % (target.width - 100)
+    y = (i * 29) % (target.height - 100)
+    target.fill_rect(x, y, 100, 100, (i * 997) & 0xFFFF)
+    return 100 * 100
+
+
+def _small_rects(target, i):
+    for j in range(100):
+        k = i * 100 + j
+        x = (k * 37) % (target.width - 40)
+        y = (k * 23) % (target.height - 40)
+        target.fill_rect(x, y, 40, 40, (k * 613) & 0xFFFF)
+    return 100 * 40 * 40
+
+
+def _sprite_motion(target, i):
+    size = 32
+    span_x = target.width - size - 8
+    span_y = target.height - size - 8
+    for j in range(4):
+        prev_x = ((i - 1) * 6 + j * 97) % span_x
+        prev_y = ((i - 1) * 4 + j * 61) % span_y
+        x = (i * 6 + j * 97) % span_x
+        y = (i * 4 + j * 61) % span_y
+        target.fill_rect(prev_x, prev_y, size, size, 0x0000)
+        target.fill_rect(x, y, size, size, _COLORS[j])
+    return 4 * 2 * size * size
+
+
+def _text_update(target, i):
+    # A ten-digit counter in 12x24 cells where only the last two change
+    cell_w = 12
+    cell_h = 24
+    changed = 2 if i % 10 else 3
+    for cell in range(10 - changed, 10):
+        x = 40 + cell * cell_w
+        target.fill_rect(x, 40, cell_w, cell_h, 0x0000)
+        target.fill_rect(x + 2, 42, cell_w - 4, cell_h - 4, 0xFFFF)
+    return changed * cell_w * cell_h
+
+
+def _scroll(target, i):
+    target.scroll(16, _COLORS[i % len(_COLORS)])
+    return target.width * target.height
+
+
+#: Scenario name and step function pairs, in run order
+SCENARIOS = (
+    ("full_fill", _full_fill),
+    ("partial_100x100", _partial_100),
+    ("small_rects_100x40x40", _small_rects),
+    ("sprite_motion_4x32", _sprite_motion),
+    ("text_update", _text_update),
+    ("scroll_16", _scroll),
+)
+
+
+def _percentile(ordered, fraction):
+    index = min(len(ordered) - 1, int(fraction * len(ordered)))
+    return ordered[index]
+
+
+def _mem_free():
+    gc.collect()
+    if not hasattr(gc, "mem_free"):
+        return None
+    return gc.mem_free()  # pylint: disable=no-member
+
+
+def run_scenario(name, step, target, *, warmup=3, iterations=30):
+    """
+    Run one scenario and summarize its timings.
+
+    :param str name: Scenario name used in the result
+    :param step: Function drawing iteration ``i`` on ``target``; returns
+        the number of pixels it drew
+    :param target: :class:`DisplayTarget` or :class:`HostTarget`
+    :param int warmup: Untimed iterations run first (default: 3)
+    :param int iterations: Timed iterations (default: 30)
+    :return: Result dictionary
+    """
+    for i in range(warmup):
+        target.begin()
+        step(target, i)
+        target.commit()
+    mem_before = _mem_free()
+    target.bytes_sent = 0
+    times = []
+    pixels = 0
+    for i in range(warmup, warmup + iterations):
+        start = _now()
+        target.begin()
+        pixels += step(target, i)
+        target.commit()
+        times.append(_now() - start)
+    mem_after = _mem_free()
+    ordered = sorted(times)
+    total = sum(times)
+    return {
+        "scenario": name,
+        "target": target.name,
+        "driver": _driver_version,
+        "platform": "%s %s"
+        % (
+            sys.implementation.name,
+            ".".join(str(v) for v in sys.implementation.version),
+        ),
+        "iterations": iterations,
+        "min_ms": ordered[0] * 1000,
+        "median_ms": _percentile(ordered, 0.5) * 1000,
+        "p95_ms": _percentile(ordered, 0.95) * 1000,
+        "p99_ms": _percentile(ordered, 0.99) * 1000,
+        "mpixel_s": pixels / total / 1e6 if total else None,
+        "mb_s": target.bytes_sent / total / 1e6 if total else None,
+        "bytes_per_iteration": target.bytes_sent // iterations,
+        "mem_delta": (
+            None if mem_before is None or mem_after is None else mem_before - mem_after
+        ),
+    }
+
+
+def run_all(target, *, warmup=3, iterations=30, scenarios=SCENARIOS):
+    """
+    Run scenarios one after another, yielding each result.
+
+    :param target: :class:`DisplayTarget` or :class:`HostTarget`
+    :param int warmup: Untimed iterations per scenario (default: 3)
+    :param int iterations: Timed iterations per scenario (default: 30)
+    :param scenarios: Sequence of ``(name, step)`` pairs (default: all)
+    """
+    for name, step in scenarios:
+        yield run_scenario(name, step, target, warmup=warmup, iterations=iterations)
+
+
+def dumps(result):
+    """Serialize a result as one JSON line."""
+    return json.dumps(result)
+
+
+def main():
+    """
+    Run every scenario against the host emulator and print JSON lines.
+
+    The emulated panel is brought up with the driver's init sequence
+    first. The run stops with an error as soon as the emulator reports a
+    protocol violation, since timings of rejected writes mean nothing.
+    """
+    from rm690b0.emulator import FakeQSPIBus  # pylint: disable=import-outside-toplevel
+
+    bus = FakeQSPIBus()
+    bus.panel.power_on()
+    target = HostTarget(bus)
+    for result in run_all(target):
+        if bus.panel.errors:
+            print("emulator error: %s" % bus.panel.errors[0], file=sys.stderr)
+            sys.exit(1)
+        print(dumps(result))
+
+
+if __name__ == "__main__":
+    main()
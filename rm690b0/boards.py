@@ -0,0 +1,275 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.boards`
+====================================================
+
+Board profiles and QSPI bus frequency autotuning.
+
+A :class:`BoardProfile` records a board's display pin names, the bus
+frequency known to work and the panel geometry. :func:`detect_profile`
+picks the profile of the running board by ``board.board_id``, or the
+first pin naming convention the board module matches, and caches the
+result so the pins are looked up once.
+
+:func:`autotune` steps the bus frequency up, checks every step with a
+write and readback of a test pattern, and returns the fastest frequency
+that passed. :func:`store_frequency` keeps it in non-volatile memory,
+where :func:`rm690b0.create_qspi_bus` picks it up.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+The readback check needs a bus with a ``read(command, buffer)`` method.
+The emulator's :class:`rm690b0.emulator.FakeQSPIBus` has one and can be
+told to corrupt pixel data above a frequency, to test the tuning logic on
+a host. Buses that cannot read need a ``check`` function of their own,
+for example one that draws a pattern and asks for confirmation.
+
+Example:
+
+    import board
+    from rm690b0 import create_qspi_bus
+    from rm690b0.boards import autotune, store_frequency
+
+    def make_bus(frequency):
+        displayio.release_displays()
+        return create_qspi_bus(board, frequency=frequency)
+
+    best = autotune(make_bus, start=40_000_000, stop=80_000_000)
+    store_frequency(best)
+"""
+
+from collections import namedtuple
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+BoardProfile = namedtuple(
+    "BoardProfile",
+    ("name", "pins", "max_frequency", "width", "height", "colstart", "rowstart"),
+)
+"""
+Display wiring and limits of a board.
+
+``pins`` maps ``clock``, ``data0`` to ``data3``, ``cs`` and ``reset`` to
+pin names in the board module; a ``reset`` of None tries the usual reset
+pin names. ``max_frequency`` is the highest bus frequency known to work,
+in Hz.
+"""
+
+
+def _pins(prefix, reset):
+    pins = {
+        "clock": prefix + ("SCK" if prefix == "DISPLAY_" else "CLK"),
+        "cs": prefix + "CS",
+        "reset": reset,
+    }
+    for line in range(4):
+        pins["data%d" % line] = "%sD%d" % (prefix, line)
+    return pins
+
+
+PROFILES = {
+    "waveshare_esp32_s3_touch_amoled_241": BoardProfile(
+        "Waveshare ESP32-S3-Touch-AMOLED-2.41",
+        _pins("LCD_", None),
+        40_000_000,
+        600,
+        450,
+        0,
+        16,
+    ),
+}
+"""Known boards, keyed by ``board.board_id``."""
+
+CONVENTIONS = (
+    BoardProfile("LCD_ pins", _pins("LCD_", None), 40_000_000, 600, 450, 0, 16),
+    BoardProfile("QSPI_ pins", _pins("QSPI_", None), 40_000_000, 600, 450, 0, 16),
+    BoardProfile("DISPLAY_ pins", _pins("DISPLAY_", None), 40_000_000, 600, 450, 0, 16),
+)
+"""Profiles for boards not in :data:`PROFILES`, tried in order."""
+
+_RESET_NAMES = ("LCD_RESET", "AMOLED_RESET", "DISPLAY_RST")
+
+_detected = {}
+
+_NVM_MAGIC = b"RMHz"
+
+
+def detect_profile(board_module):
+    """
+    Profile of the board a board module describes.
+
+    :param board_module: The board module (typically ``board``)
+    :return: :class:`BoardProfile`
+    :raises AttributeError: If the board matches no profile or convention
+    """
+    board_id = getattr(board_module, "board_id", None)
+    key = board_id if board_id is not None else id(board_module)
+    profile = _detected.get(key)
+    if profile is not None:
+        return profile
+    profile = PROFILES.get(board_id)
+    if profile is None:
+        for convention in CONVENTIONS:
+            if hasattr(board_module, convention.pins["clock"]):
+                profile = convention
+                break
+        else:
+            raise AttributeError(
+                "No display pins found; tried "
+                + ", ".join(convention.pins["clock"] for convention in CONVENTIONS)
+            )
+    _detected[key] = profile
+    return profile
+
+
+def resolve_pins(board_module, profile):
+    """
+    Look up the pins of a profile.
+
+    :return: Dict from pin role to pin object; ``reset`` is None if the
+        board lacks it
+    :raises AttributeError: If a required pin is missing
+    """
+    pins = {}
+    for role, name in profile.pins.items():
+        if role == "reset":
+            names = (name,) if name else _RESET_NAMES
+            pins[role] = None
+            for name in names:
+                if hasattr(board_module, name):
+                    pins[role] = getattr(board_module, name)
+                    break
+            continue
+        if not hasattr(board_module, name):
+            raise AttributeError("Missing board pin: %s" % name)
+        pins[role] = getattr(board_module, name)
+    return pins
+
+
+def readback_check(bus, pixels=256):
+    """
+    Write a test pattern to frame memory and read it back.
+
+    The pattern covers a ``pixels / 16`` x 16 window at the top-left of
+    frame memory and mixes bit patterns, so stuck, swapped or late data
+    lines change it.
+
+    :param bus: Bus with ``send(command, data)`` and ``read(command, buffer)``
+    :param int pixels: Pattern size, a multiple of 16 (default: 256)
+    :return: True if the pattern read back intact
+    :raises RuntimeError: If the bus cannot read
+    """
+    if not hasattr(bus, "read"):
+        raise RuntimeError("bus cannot read back; pass a check function")
+    columns = pixels // 16
+    pattern = bytearray(pixels * 2)
+    for i in range(pixels):
+        value = (i * 0x9E37 ^ (0xAAAA if i & 1 else 0x5555)) & 0xFFFF
+        pattern[2 * i] = value >> 8
+        pattern[2 * i + 1] = value & 0xFF
+    bus.send(0x3A, b"\x55")
+    bus.send(0x2A, bytes((0, 0, (columns - 1) >> 8, (columns - 1) & 0xFF)))
+    bus.send(0x2B, b"\x00\x00\x00\x0f")
+    bus.send(0x2C, pattern)
+    result = bytearray(len(pattern))
+    bus.read(0x2E, result)
+    return result == pattern
+
+
+def autotune(
+    make_bus,
+    *,
+    start=40_000_000,
+    stop=80_000_000,
+    step=5_000_000,
+    check=None,
+    repeats=3,
+):  # pylint: disable=too-many-arguments
+    """
+    Find the fastest bus frequency that passes an integrity check.
+
+    Frequencies from ``start`` to ``stop`` are tried in order. Each is
+    checked ``repeats`` times, and the search stops at the first failure,
+    since a marginal bus gets worse, not better, as the clock rises.
+
+    :param make_bus: Function creating a bus at a frequency in Hz; it must
+        release any bus it created before
+    :param int start: First frequency to try, in Hz
+    :param int stop: Last frequency to try, in Hz
+    :param int step: Frequency increment, in Hz
+    :param check: Function taking a bus and returning True if it works
+        (default: :func:`readback_check`)
+    :param int repeats: Checks per frequency (default: 3)
+    :return: Fastest passing frequency in Hz, or None if even ``start``
+        failed
+    """
+    if check is None:
+        check = readback_check
+    best = None
+    frequency = start
+    while frequency <= stop:
+        bus = make_bus(frequency)
+        try:
+            passed = all(check(bus) for _ in range(repeats))
+        finally:
+            if hasattr(bus, "deinit"):
+                bus.deinit()
+        if not passed:
+            break
+        best = frequency
+        frequency += step
+    return best
+
+
+def _nvm():
+    try:
+        import microcontroller  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return None
+    return getattr(microcontroller, "nvm", None)
+
+
+def store_frequency(frequency, memory=None, offset=0):
+    """
+    Save a tuned bus frequency.
+
+    :param int frequency: Frequency in Hz, or None to clear it
+    :param memory: Buffer to store 8 bytes in (default:
+        ``microcontroller.nvm``)
+    :param int offset: Position of the record in ``memory`` (default: 0)
+    """
+    if memory is None:
+        memory = _nvm()
+    if memory is None:
+        return
+    if frequency is None:
+        record = bytes(8)
+    else:
+        record = _NVM_MAGIC + frequency.to_bytes(4, "little")
+    memory[offset : offset + 8] = record
+
+
+def stored_frequency(memory=None, offset=0):
+    """
+    Tuned bus frequency saved by :func:`store_frequency`.
+
+    :param memory: Buffer holding the record (default:
+        ``microcontroller.nvm``)
+    :param int offset: Position of the record in ``memory`` (default: 0)
+    :return: Frequency in Hz, or None if none was stored
+    """
+    if memory is None:
+        memory = _nvm()
+    if memory is None or len(memory) < offset + 8:
+        return None
+    record = bytes(memory[offset : offset + 8])
+    if record[:4] != _NVM_MAGIC:
+        return None
+    return int.from_bytes(record[4:], "little")
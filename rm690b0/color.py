@@ -0,0 +1,287 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.color`
+====================================================
+
+RGB888 to RGB565 conversion in the panel's wire byte order.
+
+:func:`convert` turns packed ``r, g, b`` bytes into big-endian RGB565,
+the byte order the panel takes, so the result can go straight to
+:meth:`rm690b0.RM690B0.write_window` or into a
+:class:`rm690b0.bands.Band`. Each output byte is two lookups in tables
+built once at import, instead of shifts and masks per channel.
+
+With ``ulab`` (or NumPy on a host) the undithered conversion runs over
+the whole buffer at once. Without it, or with dithering, it runs per
+pixel in Python.
+
+Dithering trades banding in smooth gradients, such as sky or sensor heat
+maps, for fine noise: ``"ordered"`` adds a 4x4 Bayer pattern and costs
+little more than plain conversion; ``"diffusion"`` spreads each pixel's
+rounding error to its neighbours (Floyd-Steinberg) and looks better on
+photos, but is several times slower. :func:`compare_methods` measures
+all of them on the actual board.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Example:
+
+    from rm690b0.color import convert
+
+    pixels = bytearray(160 * 120 * 2)
+    while True:
+        convert(camera.take(), pixels, width=160, dither="ordered")
+        display.write_window(0, 0, 160, 120, pixels)
+"""
+
+import time
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+_HIGH_R = bytes(value & 0xF8 for value in range(256))
+_HIGH_G = bytes(value >> 5 for value in range(256))
+_LOW_G = bytes((value << 3) & 0xE0 for value in range(256))
+_LOW_B = bytes(value >> 3 for value in range(256))
+
+_BIAS = 64
+_CLAMP = bytes(min(255, max(0, value - _BIAS)) for value in range(256 + 2 * _BIAS))
+
+_BAYER = (0, 8, 2, 10, 12, 4, 14, 6, 3, 11, 1, 9, 15, 7, 13, 5)
+# Offsets spanning one quantization step of 5 and 6 bits, from 0 up, since
+# the conversion truncates
+_ORDERED_5 = tuple(_BIAS + threshold // 2 for threshold in _BAYER)
+_ORDERED_6 = tuple(_BIAS + threshold // 4 for threshold in _BAYER)
+# Clamp, then scale so that a 5-bit level n stands for n * 255 / 31, as
+# the panel shows it, instead of n * 8 (likewise for 6 bits). The average
+# of a flat area then stays where it was, as with diffusion.
+_SCALE_5 = bytes((value * 248 + 127) // 255 for value in _CLAMP)
+_SCALE_6 = bytes((value * 252 + 127) // 255 for value in _CLAMP)
+
+_numpy = []
+
+
+def _vector_module():
+    """``ulab.numpy`` or ``numpy``, or None; looked up once."""
+    if not _numpy:
+        module = None
+        try:
+            # pylint: disable=import-outside-toplevel
+            from ulab import numpy as module
+        except ImportError:
+            try:
+                import numpy as module  # pylint: disable=import-outside-toplevel
+            except ImportError:
+                pass
+        _numpy.append(module)
+    return _numpy[0]
+
+
+def color565(red, green, blue):
+    """
+    RGB565 value of an 8-bit RGB colour.
+
+    :return: RGB565 colour, as the rest of this library takes it
+    """
+    return (_HIGH_R[red] | _HIGH_G[green]) << 8 | _LOW_G[green] | _LOW_B[blue]
+
+
+def rgb565_values(rgb, *, width=None, dither=None):
+    """
+    Convert RGB888 pixels to a list of RGB565 values.
+
+    Same as :func:`convert`, for code that works on colour values rather
+    than wire bytes, such as the image and animation encoders.
+
+    :param rgb: Packed ``r, g, b`` bytes, row by row
+    :param int width: Pixels per row; needed for dithering
+    :param str dither: None, ``"ordered"`` or ``"diffusion"``
+    :return: List of RGB565 colours
+    """
+    data = convert(rgb, width=width, dither=dither)
+    return [data[i] << 8 | data[i + 1] for i in range(0, len(data), 2)]
+
+
+def convert(
+    rgb, out=None, *, width=None, dither=None, vectorize=True
+):  # pylint: disable=too-many-arguments
+    """
+    Convert RGB888 pixels to big-endian RGB565.
+
+    :param rgb: Packed ``r, g, b`` bytes, row by row, in any buffer
+    :param out: Writable buffer of ``2 / 3`` the size of ``rgb`` to
+        convert into; a new ``bytearray`` if omitted
+    :param int width: Pixels per row; needed for dithering
+    :param str dither: None, ``"ordered"`` or ``"diffusion"``
+    :param bool vectorize: Use ``ulab``/NumPy when available (default: True)
+    :return: ``out``
+    :raises ValueError: If ``out`` is too small, or dithering lacks ``width``
+    """
+    count = len(rgb) // 3
+    if out is None:
+        out = bytearray(count * 2)
+    elif len(out) < count * 2:
+        raise ValueError("out must hold %d bytes" % (count * 2))
+    if dither is None:
+        numpy = _vector_module() if vectorize else None
+        if numpy is not None:
+            _convert_vector(numpy, rgb, out, count)
+        else:
+            _convert(rgb, out, count)
+        return out
+    if not width:
+        raise ValueError("dithering needs width")
+    if dither == "ordered":
+        _convert_ordered(rgb, out, count, width)
+    elif dither == "diffusion":
+        _convert_diffusion(rgb, out, count, width)
+    else:
+        raise ValueError("dither must be None, 'ordered' or 'diffusion'")
+    return out
+
+
+def _convert(rgb, out, count):
+    high_r = _HIGH_R
+    high_g = _HIGH_G
+    low_g = _LOW_G
+    low_b = _LOW_B
+    source = 0
+    for dest in range(0, count * 2, 2):
+        green = rgb[source + 1]
+        out[dest] = high_r[rgb[source]] | high_g[green]
+        out[dest + 1] = low_g[green] | low_b[rgb[source + 2]]
+        source += 3
+
+
+def _convert_vector(numpy, rgb, out, count):
+    pixels = numpy.frombuffer(rgb, dtype=numpy.uint8)
+    red = pixels[0 : count * 3 : 3]
+    green = pixels[1 : count * 3 : 3]
+    blue = pixels[2 : count * 3 : 3]
+    result = numpy.frombuffer(out, dtype=numpy.uint8)
+    result[0 : count * 2 : 2] = numpy.bitwise_or(
+        numpy.bitwise_and(red, 0xF8), numpy.right_shift(green, 5)
+    )
+    result[1 : count * 2 : 2] = numpy.bitwise_or(
+        numpy.bitwise_and(numpy.left_shift(green, 3), 0xE0),
+        numpy.right_shift(blue, 3),
+    )
+
+
+def _convert_ordered(rgb, out, count, width):  # pylint: disable=too-many-locals
+    high_r = _HIGH_R
+    high_g = _HIGH_G
+    low_g = _LOW_G
+    low_b = _LOW_B
+    scale_5 = _SCALE_5
+    scale_6 = _SCALE_6
+    source = 0
+    dest = 0
+    row = 0
+    while dest < count * 2:
+        base = (row & 3) * 4
+        offsets_5 = _ORDERED_5[base : base + 4]
+        offsets_6 = _ORDERED_6[base : base + 4]
+        for column in range(min(width, count - dest // 2)):
+            offset_5 = offsets_5[column & 3]
+            green = scale_6[rgb[source + 1] + offsets_6[column & 3]]
+            out[dest] = high_r[scale_5[rgb[source] + offset_5]] | high_g[green]
+            out[dest + 1] = low_g[green] | low_b[scale_5[rgb[source + 2] + offset_5]]
+            source += 3
+            dest += 2
+        row += 1
+
+
+def _convert_diffusion(rgb, out, count, width):  # pylint: disable=too-many-locals
+    clamp = _CLAMP
+    # Error carried into the current and the next row, per channel, with a
+    # spare entry at each end for the left and right neighbours
+    current = [[0] * (width + 2) for _ in range(3)]
+    following = [[0] * (width + 2) for _ in range(3)]
+    source = 0
+    dest = 0
+    levels = [0, 0, 0]
+    while dest < count * 2:
+        for column in range(1, min(width, count - dest // 2) + 1):
+            for channel, bits in ((0, 5), (1, 6), (2, 5)):
+                value = clamp[rgb[source + channel] + current[channel][column] + _BIAS]
+                level = value >> (8 - bits)
+                levels[channel] = level
+                error = value - (level << (8 - bits) | level >> (2 * bits - 8))
+                right = error * 7 >> 4
+                below_left = error * 3 >> 4
+                below_error = error * 5 >> 4
+                current[channel][column + 1] += right
+                below = following[channel]
+                below[column - 1] += below_left
+                below[column] += below_error
+                below[column + 1] += error - right - below_left - below_error
+            green = levels[1]
+            out[dest] = levels[0] << 3 | green >> 3
+            out[dest + 1] = (green & 7) << 5 | levels[2]
+            source += 3
+            dest += 2
+        current, following = following, current
+        for errors in following:
+            for column in range(width + 2):
+                errors[column] = 0
+
+
+def compare_methods(width=160, height=120, iterations=3):
+    """
+    Time every conversion method on a synthetic gradient.
+
+    ``bias`` is the average difference between the colours shown and the
+    source, in 8-bit steps. Plain conversion truncates, so its bias moves
+    with the colours; both dithering methods should stay near zero.
+
+    :param int width: Image width in pixels
+    :param int height: Image height in pixels
+    :param int iterations: Conversions timed per method
+    :return: List of dicts with ``method``, ``frame_ms``, ``mpixel_s`` and
+        ``bias``
+    """
+    rgb = bytearray(width * height * 3)
+    for i in range(width * height):
+        rgb[i * 3] = i % width * 255 // max(1, width - 1)
+        rgb[i * 3 + 1] = i // width * 255 // max(1, height - 1)
+        rgb[i * 3 + 2] = 128
+    out = bytearray(width * height * 2)
+    methods = [("python", {"vectorize": False})]
+    if _vector_module() is not None:
+        methods.insert(0, ("vector", {}))
+    methods.append(("ordered", {"dither": "ordered"}))
+    methods.append(("diffusion", {"dither": "diffusion"}))
+    results = []
+    for name, options in methods:
+        start = time.monotonic()
+        for _ in range(iterations):
+            convert(rgb, out, width=width, **options)
+        elapsed = (time.monotonic() - start) / iterations
+        results.append(
+            {
+                "method": name,
+                "frame_ms": round(elapsed * 1000, 2),
+                "mpixel_s": round(width * height / elapsed / 1e6 if elapsed else 0, 3),
+                "bias": round(_bias(rgb, out), 2),
+            }
+        )
+    return results
+
+
+def _bias(rgb, out):
+    """Mean of shown minus source channel values, over all channels."""
+    total = 0
+    for i in range(len(out) // 2):
+        value = out[i * 2] << 8 | out[i * 2 + 1]
+        red = value >> 11
+        green = value >> 5 & 0x3F
+        blue = value & 0x1F
+        total += red << 3 | red >> 2
+        total += green << 2 | green >> 4
+        total += blue << 3 | blue >> 2
+        total -= rgb[i * 3] + rgb[i * 3 + 1] + rgb[i * 3 + 2]
+    return total / max(1, len(out) // 2 * 3)
@@ -0,0 +1,182 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.console`
+====================================================
+
+Text console that scrolls with the controller's hardware scrolling.
+
+Each new line is rendered into a one-line buffer and written over the
+line that scrolled out of view, then the scroll pointer moves by one line
+height. A new line therefore costs a single ``width x line height`` window
+(about 17KB with the built-in font in portrait) instead of a full-screen
+redraw.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+The panel scrolls along its 600-pixel side, so lines stack along the
+display's y axis only in portrait. The console needs a display created
+with ``hardware_rotation=True`` and ``rotation`` 90 or 270.
+
+It writes with :meth:`rm690b0.RM690B0.write_window` and owns the scroll
+area; it should not share the screen with displayio content there.
+
+Fonts are anything with the ``get_bounding_box()``/``get_glyph()``
+interface of ``terminalio.FONT`` and ``adafruit_bitmap_font``; every
+character gets a cell of the bounding box size.
+
+Example:
+
+    display = RM690B0(bus, rotation=90, hardware_rotation=True)
+    console = ScrollConsole(display, top=40)
+    console.write("boot ok\\n")
+    console.write("temp=%d\\n" % temp)
+"""
+
+from rm690b0.text import glyph_runs
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+
+class ScrollConsole:  # pylint: disable=too-many-instance-attributes
+    """
+    Line console on the hardware scroll area of an RM690B0.
+
+    :param display: :class:`rm690b0.RM690B0` in a portrait hardware rotation
+    :param font: Font to draw with (default: ``terminalio.FONT``)
+    :param int top: Fixed rows above the console (default: 0)
+    :param int bottom: Fixed rows below the console; rows that do not make
+        up a whole text line are added to it (default: 0)
+    :param int foreground: RGB565 text colour (default: white)
+    :param int background: RGB565 background colour (default: black)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        display,
+        font=None,
+        *,
+        top=0,
+        bottom=0,
+        foreground=0xFFFF,
+        background=0x0000,
+    ):
+        if display.scan_axis != "y":
+            raise ValueError("console needs a portrait hardware rotation")
+        if font is None:
+            import terminalio  # pylint: disable=import-outside-toplevel
+
+            font = terminalio.FONT
+        self.display = display
+        self.font = font
+        self.foreground = bytes((foreground >> 8, foreground & 0xFF))
+        self.background = bytes((background >> 8, background & 0xFF))
+        box = font.get_bounding_box()
+        self.cell_width = box[0]
+        self.line_height = box[1]
+        self.columns = display.width // self.cell_width
+        self.rows = (display.height - top - bottom) // self.line_height
+        if self.rows < 1:
+            raise ValueError("no room for a text line")
+        self.top = top
+        display.set_scroll_area(
+            top, display.height - top - self.rows * self.line_height
+        )
+        self._stride = display.width * 2
+        self._line_buffer = bytearray(self._stride * self.line_height)
+        self._glyphs = {}
+        self._first = 0
+        self._cursor = 0
+        self._text = ""
+        self._scroll_due = False
+        self.clear()
+
+    def clear(self):
+        """Blank the console and move the cursor to the first line."""
+        self._first = 0
+        self._cursor = 0
+        self._text = ""
+        self._line_buffer[:] = self.background * (len(self._line_buffer) // 2)
+        for row in range(self.rows):
+            self._send(row)
+        self.display.scroll(0)
+
+    def write(self, text):
+        """
+        Append text; ``\\n`` ends a line and long lines wrap.
+
+        Only the current line is re-sent, plus one window for every line
+        that scrolls into view.
+        """
+        line = self._text
+        for char in text:
+            if char == "\n":
+                self._render(line)
+                self._newline()
+                line = ""
+                continue
+            if char == "\r":
+                line = ""
+                continue
+            if len(line) == self.columns:
+                self._render(line)
+                self._newline()
+                line = ""
+            line += char
+        self._text = line
+        self._render(line)
+
+    def _newline(self):
+        if self._cursor < self.rows - 1:
+            self._cursor += 1
+        else:
+            # Scrolled once the new line has been drawn over the oldest one
+            self._first = (self._first + 1) % self.rows
+            self._scroll_due = True
+
+    def _render(self, text):
+        buffer = self._line_buffer
+        buffer[:] = self.background * (len(buffer) // 2)
+        width = self.cell_width * 2
+        for column, char in enumerate(text):
+            cell = self._glyph(char)
+            if cell is None:
+                continue
+            x = column * width
+            for row in range(self.line_height):
+                start = row * self._stride + x
+                buffer[start : start + width] = cell[row * width : (row + 1) * width]
+        self._send((self._first + self._cursor) % self.rows)
+        if self._scroll_due:
+            self._scroll_due = False
+            self.display.scroll(self._first * self.line_height)
+
+    def _send(self, row):
+        self.display.write_window(
+            0,
+            self.top + row * self.line_height,
+            self.display.width,
+            self.line_height,
+            self._line_buffer,
+            stride=self._stride,
+        )
+
+    def _glyph(self, char):
+        """Rendered cell for ``char`` in wire byte order, cached."""
+        if char in self._glyphs:
+            return self._glyphs[char]
+        runs = glyph_runs(self.font, char)
+        cell = None
+        if runs is not None:
+            cell = bytearray(self.background * (self.cell_width * self.line_height))
+            for row, x1, x2 in runs:
+                start = (row * self.cell_width + x1) * 2
+                cell[start : start + (x2 - x1) * 2] = self.foreground * (x2 - x1)
+        self._glyphs[char] = cell
+        return cell
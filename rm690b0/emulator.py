@@ -0,0 +1,596 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.emulator`
+====================================================
+
+Host-side RM690B0 panel emulator and fake QSPI bus.
+
+The emulator parses the command stream a driver sends over the bus and
+keeps a model of the panel's frame memory, so traffic patterns can be
+replayed, inspected and benchmarked without hardware. It runs on CPython.
+Importing it runs the package ``__init__``, which imports ``busdisplay``,
+so Blinka's displayio (``adafruit-blinka-displayio``, listed in
+``requirements.txt``) must be installed.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+:class:`FakeQSPIBus` is a ``fourwire.FourWire`` as far as displayio is
+concerned, so :class:`rm690b0.RM690B0` can be created on it and sends
+its init sequence through it. Blinka allows one display at a time, so
+call ``displayio.release_displays()`` before creating another. Code that
+drives the bus without a display, such as
+:class:`rm690b0.benchmark.HostTarget`, must bring the panel up with
+:meth:`RM690B0Emulator.power_on` first. Without it the panel keeps its
+reset state, in which the landscape windows the driver uses fall outside
+frame memory.
+
+The frame memory is 480 x 600 pixels in the panel's native portrait
+orientation. The visible 450 columns start at column 16, which is where
+the driver's default ``rowstart=16`` comes from once MADCTL swaps rows and
+columns for the landscape layout. The model stores memory in that
+landscape layout as a flat ``array('H')`` holding pixels in wire byte
+order, so common writes become one slice assignment per row.
+
+Example:
+
+    from rm690b0 import RM690B0
+    from rm690b0.emulator import FakeQSPIBus
+
+    bus = FakeQSPIBus()
+    display = RM690B0(bus)
+    display.write_window(0, 0, 600, 450, b"\\xf8\\x00" * (600 * 450))
+    bus.panel.save_ppm("frame.ppm")
+"""
+
+from array import array
+
+from fourwire import FourWire
+
+from rm690b0.initseq import InitSequenceError, iter_decode
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+#: Frame memory columns in native orientation (the 450-pixel axis)
+GRAM_COLUMNS = 480
+#: Frame memory rows in native orientation (the 600-pixel axis)
+GRAM_ROWS = 600
+#: First visible native column
+VISIBLE_COLUMN_START = 16
+#: Number of visible native columns
+VISIBLE_COLUMNS = 450
+
+_MADCTL_MY = 0x80
+_MADCTL_MX = 0x40
+_MADCTL_MV = 0x20
+
+# displayio bus data types
+_DISPLAY_COMMAND = 0
+
+
+class EmulatorError(Exception):
+    """Raised by a strict :class:`RM690B0Emulator` on a protocol violation."""
+
+
+class RM690B0Emulator:  # pylint: disable=too-many-instance-attributes
+    """
+    Model of an RM690B0 controller and its frame memory.
+
+    Commands are fed in through :meth:`command`, usually by a
+    :class:`FakeQSPIBus`. Problems such as odd column alignment, writes
+    outside the frame memory or pixel data before a window is set are
+    collected in :attr:`errors`, or raised when ``strict`` is set.
+
+    :param bool strict: Raise :class:`EmulatorError` on protocol violations
+        instead of recording them (default: False)
+    """
+
+    def __init__(self, *, strict=False):
+        self.strict = strict
+        self.gram = array("H", bytes(GRAM_COLUMNS * GRAM_ROWS * 2))
+        """Frame memory in landscape layout, pixels in wire byte order."""
+        self.errors = []
+        """Protocol violations seen so far, as strings."""
+        self.registers = {}
+        """Last arguments of every command, keyed by ``(page, command)``."""
+        self.commands = 0
+        """Number of commands received."""
+        self.pixels_written = 0
+        """Number of pixels written to frame memory."""
+        self.delay_ms = 0
+        """Total delay requested by replayed init sequences, in ms."""
+        self.page = 0
+        """Selected command page."""
+        self.sleeping = True
+        """True while in sleep mode."""
+        self.display_on = False
+        """True after display on (0x29)."""
+        self.tearing_effect = False
+        """True while the TE output is enabled."""
+        self.madctl = 0x00
+        """Memory access control (MADCTL) value."""
+        self.colmod = 0x77
+        """Pixel format (COLMOD) value."""
+        self.brightness = 0
+        """Brightness (0x51) value."""
+        self.partial_mode = False
+        """True in partial display mode."""
+        self.partial_area = (0, GRAM_ROWS - 1)
+        """Partial area lines as ``(start, end)``, inclusive."""
+        self.scroll_area = (0, GRAM_ROWS, 0)
+        """Scroll definition as ``(top, lines, bottom)``."""
+        self.scroll_start = 0
+        """Scroll start line (VSCSAD)."""
+        self.columns = (0, GRAM_COLUMNS - 1)
+        """Column window as ``(start, end)``, inclusive."""
+        self.rows = (0, GRAM_ROWS - 1)
+        """Row window as ``(start, end)``, inclusive."""
+        self._cursor = None
+        self._handlers = {
+            0x01: self._software_reset,
+            0x10: self._sleep_in,
+            0x11: self._sleep_out,
+            0x12: self._partial_mode_on,
+            0x13: self._normal_mode_on,
+            0x28: self._display_off,
+            0x29: self._display_on,
+            0x2A: self._column_address,
+            0x2B: self._row_address,
+            0x2C: self._memory_write,
+            0x30: self._partial_area,
+            0x33: self._scroll_area,
+            0x34: self._tearing_off,
+            0x35: self._tearing_on,
+            0x36: self._memory_access_control,
+            0x37: self._scroll_start,
+            0x3A: self._pixel_format,
+            0x3C: self._memory_write_continue,
+            0x51: self._brightness,
+            0xFE: self._page_select,
+        }
+        self.reset()
+
+    def reset(self):
+        """Put the controller into its power-on state; memory is kept."""
+        self.page = 0
+        self.sleeping = True
+        self.display_on = False
+        self.tearing_effect = False
+        self.madctl = 0x00
+        self.colmod = 0x77
+        self.brightness = 0
+        self.partial_mode = False
+        self.partial_area = (0, GRAM_ROWS - 1)
+        self.scroll_area = (0, GRAM_ROWS, 0)
+        self.scroll_start = 0
+        self.columns = (0, GRAM_COLUMNS - 1)
+        self.rows = (0, GRAM_ROWS - 1)
+        self._cursor = None
+
+    def power_on(self, sequence=None):
+        """
+        Bring the panel up the way :class:`rm690b0.RM690B0` does.
+
+        :param sequence: Init sequence to replay (default: the driver's
+            standard sequence)
+        """
+        if sequence is None:
+            # pylint: disable=import-outside-toplevel
+            from rm690b0 import _INIT_SEQUENCE as sequence
+        self.reset()
+        self.run_init_sequence(sequence)
+
+    @property
+    def host_size(self):
+        """Size of the host address space as ``(columns, rows)``."""
+        if self.madctl & _MADCTL_MV:
+            return (GRAM_ROWS, GRAM_COLUMNS)
+        return (GRAM_COLUMNS, GRAM_ROWS)
+
+    def command(self, command, data=b""):
+        """
+        Execute one command.
+
+        :param int command: Command byte
+        :param data: Argument bytes (any buffer-protocol object)
+        """
+        self.commands += 1
+        self.registers[(self.page, command)] = bytes(data[:16])
+        if self.page != 0 and command != 0xFE:
+            return
+        handler = self._handlers.get(command)
+        if handler is not None:
+            handler(data)
+
+    def run_init_sequence(self, sequence):
+        """
+        Replay a BusDisplay-encoded init sequence.
+
+        Each entry is a command byte, a length byte whose top bit flags a
+        trailing delay byte, the arguments and the optional delay. Delays
+        are added to :attr:`delay_ms` instead of being slept, with 255
+        meaning 500 ms as in displayio.
+
+        :param sequence: Encoded init sequence
+        """
+        try:
+            for entry in iter_decode(sequence):
+                self.command(entry.command, entry.data)
+                self.delay_ms += entry.delay
+        except InitSequenceError as error:
+            self._error(str(error))
+
+    def pixel(self, x, y):
+        """
+        RGB565 value of a visible pixel in the landscape layout.
+
+        :param int x: Column, 0 to 599
+        :param int y: Row, 0 to 449
+        """
+        value = self.gram[(y + VISIBLE_COLUMN_START) * GRAM_ROWS + x]
+        return ((value & 0xFF) << 8) | (value >> 8) if _LITTLE else value
+
+    def screen_pixel(self, x, y):
+        """
+        RGB565 value shown at a visible pixel, with hardware scrolling.
+
+        :param int x: Column, 0 to 599
+        :param int y: Row, 0 to 449
+        """
+        top, lines, _ = self.scroll_area
+        if top <= x < top + lines:
+            x = top + (self.scroll_start - top + x - top) % lines
+        return self.pixel(x, y)
+
+    def frame_bytes(self, visible=True):
+        """
+        Frame memory in wire byte order (big-endian RGB565).
+
+        :param bool visible: Only the visible 600 x 450 area (default: True)
+        """
+        if not visible:
+            return self.gram.tobytes()
+        start = VISIBLE_COLUMN_START * GRAM_ROWS
+        return self.gram[start : start + VISIBLE_COLUMNS * GRAM_ROWS].tobytes()
+
+    def save_ppm(self, file, visible=True):
+        """
+        Write the frame memory as a binary PPM image.
+
+        :param file: Path or binary file object
+        :param bool visible: Only the visible 600 x 450 area (default: True)
+        """
+        height = VISIBLE_COLUMNS if visible else GRAM_COLUMNS
+        data = self.frame_bytes(visible)
+        rgb = bytearray(len(data) // 2 * 3)
+        rgb[0::3] = bytes(_RED[b] for b in data[0::2])
+        rgb[1::3] = bytes(
+            _GREEN[((hi & 0x07) << 3) | (lo >> 5)]
+            for hi, lo in zip(data[0::2], data[1::2])
+        )
+        rgb[2::3] = bytes(_BLUE[b] for b in data[1::2])
+        header = b"P6\n%d %d\n255\n" % (GRAM_ROWS, height)
+        if hasattr(file, "write"):
+            file.write(header)
+            file.write(rgb)
+        else:
+            with open(file, "wb") as stream:
+                stream.write(header)
+                stream.write(rgb)
+
+    def read_memory(self, count):
+        """
+        Pixels from the start of the current window, as memory read returns them.
+
+        :param int count: Number of pixels
+        :return: ``bytes`` in wire byte order
+        """
+        x_start, x_end = self.columns
+        y_start, y_end = self.rows
+        host_columns, host_rows = self.host_size
+        pixels = array("H")
+        column, row = x_start, y_start
+        for _ in range(count):
+            if column < host_columns and row < host_rows:
+                pixels.append(self.gram[self._index(column, row)])
+            else:
+                pixels.append(0)
+            column += 1
+            if column > x_end:
+                column = x_start
+                row = row + 1 if row < y_end else y_start
+        return pixels.tobytes()
+
+    def _error(self, message):
+        if self.strict:
+            raise EmulatorError(message)
+        self.errors.append(message)
+
+    def _software_reset(self, _data):
+        self.reset()
+
+    def _sleep_in(self, _data):
+        self.sleeping = True
+
+    def _sleep_out(self, _data):
+        self.sleeping = False
+
+    def _partial_mode_on(self, _data):
+        self.partial_mode = True
+
+    def _normal_mode_on(self, _data):
+        self.partial_mode = False
+
+    def _partial_area(self, data):
+        area = self._address(data, "PTLAR", GRAM_ROWS)
+        if area is not None:
+            self.partial_area = area
+
+    def _scroll_area(self, data):
+        if len(data) < 6:
+            self._error("VSCRDEF needs 6 bytes")
+            return
+        area = tuple((data[i] << 8) | data[i + 1] for i in (0, 2, 4))
+        if sum(area) != GRAM_ROWS:
+            self._error(
+                "VSCRDEF %d+%d+%d does not cover %d lines" % (area + (GRAM_ROWS,))
+            )
+            return
+        self.scroll_area = area
+
+    def _scroll_start(self, data):
+        if len(data) < 2:
+            self._error("VSCSAD needs 2 bytes")
+            return
+        start = (data[0] << 8) | data[1]
+        top, lines, _ = self.scroll_area
+        if not top <= start < top + lines:
+            self._error("VSCSAD %d outside the scroll area" % start)
+        self.scroll_start = start
+
+    def _display_off(self, _data):
+        self.display_on = False
+
+    def _display_on(self, _data):
+        self.display_on = True
+
+    def _tearing_off(self, _data):
+        self.tearing_effect = False
+
+    def _tearing_on(self, _data):
+        self.tearing_effect = True
+
+    def _memory_access_control(self, data):
+        if data:
+            self.madctl = data[0]
+
+    def _pixel_format(self, data):
+        if data:
+            self.colmod = data[0]
+            if data[0] != 0x55:
+                self._error("COLMOD 0x%02X is not RGB565" % data[0])
+
+    def _brightness(self, data):
+        if data:
+            self.brightness = data[0]
+
+    def _page_select(self, data):
+        if data:
+            self.page = data[0]
+
+    def _address(self, data, name, limit):
+        if len(data) < 4:
+            self._error("%s needs 4 bytes" % name)
+            return None
+        start = (data[0] << 8) | data[1]
+        end = (data[2] << 8) | data[3]
+        if end < start:
+            self._error("%s end %d before start %d" % (name, end, start))
+            return None
+        if end >= limit:
+            self._error("%s end %d outside memory" % (name, end))
+        return (start, end)
+
+    def _column_address(self, data):
+        window = self._address(data, "CASET", self.host_size[0])
+        if window is not None:
+            if window[0] % 2 or (window[1] - window[0] + 1) % 2:
+                self._error("CASET %d-%d not even-aligned" % window)
+            self.columns = window
+        self._cursor = None
+
+    def _row_address(self, data):
+        window = self._address(data, "RASET", self.host_size[1])
+        if window is not None:
+            self.rows = window
+        self._cursor = None
+
+    def _memory_write(self, data):
+        self._cursor = (self.columns[0], self.rows[0])
+        self._write_pixels(data)
+
+    def _memory_write_continue(self, data):
+        if self._cursor is None:
+            self._error("RAMWRC without RAMWR")
+            return
+        self._write_pixels(data)
+
+    def _write_pixels(self, data):
+        data = memoryview(data).cast("B")
+        if not data:
+            return
+        if len(data) % 2:
+            self._error("odd pixel payload of %d bytes" % len(data))
+        pixels = array("H")
+        pixels.frombytes(data[: len(data) & ~1])
+        self.pixels_written += len(pixels)
+        self._cursor = self._store(pixels, self._cursor)
+
+    def _store(self, pixels, cursor):
+        # pylint: disable=too-many-locals
+        madctl = self.madctl
+        host_columns, host_rows = self.host_size
+        x_start, x_end = self.columns
+        y_start, y_end = self.rows
+        column, row = cursor
+        if madctl & _MADCTL_MV:
+            step = -1 if madctl & _MADCTL_MY else 1
+        else:
+            step = -GRAM_ROWS if madctl & _MADCTL_MX else GRAM_ROWS
+        gram = self.gram
+        count = len(pixels)
+        pos = 0
+        while pos < count:
+            run = min(x_end - column + 1, count - pos)
+            fit = min(run, host_columns - column)
+            if row < host_rows and fit > 0:
+                i = self._index(column, row)
+                stop = i + step * fit
+                gram[i : stop if stop >= 0 else None : step] = pixels[pos : pos + fit]
+            pos += run
+            column += run
+            if column > x_end:
+                column = x_start
+                row = row + 1 if row < y_end else y_start
+        return (column, row)
+
+    def _index(self, column, row):
+        madctl = self.madctl
+        if madctl & _MADCTL_MV:
+            native_column, native_row = row, column
+        else:
+            native_column, native_row = column, row
+        if madctl & _MADCTL_MX:
+            native_column = GRAM_COLUMNS - 1 - native_column
+        if madctl & _MADCTL_MY:
+            native_row = GRAM_ROWS - 1 - native_row
+        return native_column * GRAM_ROWS + native_row
+
+
+class FakeQSPIBus(FourWire):
+    """
+    Stand-in for ``qspibus.QSPIBus`` backed by an :class:`RM690B0Emulator`.
+
+    It is a ``fourwire.FourWire`` without pins, so displayio accepts it
+    and :class:`rm690b0.RM690B0` can be created on it: init sequences,
+    displayio refreshes and the driver's direct writes all end up in the
+    emulator. ``send()`` works as on the real bus, so code written against
+    a bus from :func:`rm690b0.create_qspi_bus` runs on a host unchanged.
+
+    Above ``corrupt_above`` the bus flips a bit in every 61st byte of
+    pixel data, like a link clocked past what the wiring allows, so
+    frequency tuning can be tested on a host.
+
+    :param panel: Emulator to drive; a new one is created if omitted
+    :param int frequency: Nominal bus frequency in Hz (default: 40MHz)
+    :param int corrupt_above: Frequency in Hz above which pixel data is
+        corrupted (default: None, never)
+    """
+
+    # FourWire.__init__ claims SPI and GPIO pins, which this bus has none of
+    # pylint: disable=super-init-not-called
+    def __init__(self, panel=None, *, frequency=40_000_000, corrupt_above=None):
+        self.panel = panel if panel is not None else RM690B0Emulator()
+        self.frequency = frequency
+        self.corrupt_above = corrupt_above
+        self._deinited = False
+        self._in_transaction = False
+        self._command = None
+        self._command_sent = False
+
+    def read(self, command, buffer):
+        """
+        Read a command's response into a buffer.
+
+        Only memory read (0x2E) is modelled; it reads pixels from the start
+        of the current window, in wire byte order.
+
+        :param int command: Command byte
+        :param buffer: Writable buffer to fill
+        """
+        self._check()
+        if command != 0x2E:
+            raise ValueError("read of command 0x%02X is not emulated" % command)
+        buffer[:] = self.panel.read_memory(len(buffer) // 2)
+
+    def reset(self):
+        """Pulse the panel reset line."""
+        self.panel.reset()
+
+    def deinit(self):
+        """Release the bus."""
+        self._deinited = True
+
+    def _check(self):
+        if self._deinited:
+            raise ValueError("Object has been deinitialized and can no longer be used")
+
+    def _free(self):
+        return not self._in_transaction
+
+    def _begin_transaction(self):
+        self._check()
+        if self._in_transaction:
+            return False
+        self._in_transaction = True
+        return True
+
+    def _send(self, data_type, _chip_select, data):
+        self._check()
+        if data_type == _DISPLAY_COMMAND:
+            self._flush_command()
+            self._command = data[0]
+            self._command_sent = False
+            return
+        if self._command is None:
+            raise ValueError("data sent without a command")
+        command = self._command
+        if self._command_sent:
+            # More data for the same command only makes sense for pixels
+            command = 0x3C
+        self._command_sent = True
+        self._execute(command, data)
+
+    def _end_transaction(self):
+        self._flush_command()
+        self._command = None
+        self._in_transaction = False
+
+    def _flush_command(self):
+        if self._command is not None and not self._command_sent:
+            self._command_sent = True
+            self._execute(self._command, b"")
+
+    def _execute(self, command, data):
+        if (
+            command in (0x2C, 0x3C)
+            and self.corrupt_above is not None
+            and self.frequency > self.corrupt_above
+        ):
+            data = bytearray(data)
+            for i in range(len(data) // 2, len(data), 61):
+                data[i] ^= 0x10
+        self.panel.command(command, data)
+
+
+def create_fake_qspi_bus(_board_module=None, frequency=40_000_000, **_kwargs):
+    """
+    Host counterpart of :func:`rm690b0.create_qspi_bus`.
+
+    :param _board_module: Ignored; accepted for signature compatibility
+    :param int frequency: Nominal bus frequency in Hz (default: 40MHz)
+    :return: :class:`FakeQSPIBus` driving a fresh emulator
+    """
+    return FakeQSPIBus(frequency=frequency)
+
+
+_LITTLE = array("H", b"\x01\x00")[0] == 1
+_RED = bytes(((b >> 3) * 255 + 15) // 31 for b in range(256))
+_GREEN = bytes((g * 255 + 31) // 63 for g in range(64))
+_BLUE = bytes(((b & 0x1F) * 255 + 15) // 31 for b in range(256))
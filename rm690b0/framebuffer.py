@@ -0,0 +1,232 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.framebuffer`
+====================================================
+
+Double-buffered RGB565 framebuffer sent with
+:meth:`rm690b0.RM690B0.write_window`.
+
+The application draws into the back buffer while the front buffer holds
+the last presented frame. :meth:`DoubleBuffer.swap` exchanges the two and
+copies only the rectangles that changed into the new back buffer, so it
+starts out identical to what is on screen. :meth:`DoubleBuffer.flush`
+sends those rectangles from the front buffer, which is never drawn into.
+
+The transfer does not overlap with drawing: :meth:`DoubleBuffer.present`
+returns once the pixels are out, so a frame still takes its drawing time
+plus its bus time. What the second buffer saves is a copy. The frame
+being sent stays intact without taking a snapshot of it, so during
+:meth:`DoubleBuffer.present_async` other ``asyncio`` tasks may draw into
+the back buffer, as long as they do not swap before it returns.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+Two full frames take 1,080,000 bytes at 600x450. On boards with PSRAM,
+CircuitPython places the heap there, so the buffers are allocated in PSRAM
+without any extra steps; they are allocated right after a garbage
+collection to find two contiguous blocks.
+
+Pixels are stored big-endian, in the order they go over the wire.
+
+Example:
+
+    display = RM690B0(bus, double_buffer=True)
+    buffers = display.buffers
+    while True:
+        buffers.fill_rect(x, y, 32, 32, 0x0000)
+        x += 4
+        buffers.fill_rect(x, y, 32, 32, 0xF800)
+        buffers.present()
+"""
+
+import gc
+
+from rm690b0.regions import DirtyRegionTracker
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+
+class DoubleBuffer:
+    """
+    Two full-screen RGB565 framebuffers for an RM690B0.
+
+    :param display: :class:`rm690b0.RM690B0` to present on; its rotation
+        must be 0 or done in hardware
+    """
+
+    def __init__(self, display):
+        self.display = display
+        self.width = display.width
+        self.height = display.height
+        self.stride = self.width * 2
+        """Bytes per framebuffer row."""
+        gc.collect()
+        self._buffers = (
+            memoryview(bytearray(self.stride * self.height)),
+            memoryview(bytearray(self.stride * self.height)),
+        )
+        self._back = 0
+        self.dirty = DirtyRegionTracker(self.width, self.height)
+        """Rectangles drawn into the back buffer since the last swap."""
+        self.pending = []
+        """Rectangles of the front buffer not yet sent to the panel."""
+        self.swaps = 0
+        self._held_changes = 0
+
+    @property
+    def back(self):
+        """Buffer being drawn into, as a memoryview."""
+        return self._buffers[self._back]
+
+    @property
+    def front(self):
+        """Buffer holding the last swapped frame, as a memoryview."""
+        return self._buffers[self._back ^ 1]
+
+    def mark_dirty(self, x1, y1, x2, y2):
+        """Mark a rectangle of the back buffer as changed."""
+        self.dirty.add(x1, y1, x2, y2)
+
+    def fill_rect(
+        self, x, y, width, height, color
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Fill a rectangle of the back buffer and mark it dirty.
+
+        :param int color: RGB565 colour
+        """
+        x1 = max(0, x)
+        x2 = min(self.width, x + width)
+        y1 = max(0, y)
+        y2 = min(self.height, y + height)
+        if x2 <= x1 or y2 <= y1:
+            return
+        row = bytes((color >> 8, color & 0xFF)) * (x2 - x1)
+        back = self.back
+        first = y1 * self.stride + x1 * 2
+        for start in range(first, y2 * self.stride, self.stride):
+            back[start : start + len(row)] = row
+        self.dirty.add(x1, y1, x2, y2)
+
+    def swap(self):
+        """
+        Make the back buffer the front one.
+
+        Anything still pending from the previous swap is sent first. The
+        dirty rectangles are then copied into the new back buffer and
+        become :attr:`pending`.
+
+        :return: Rectangles to be sent by :meth:`flush`
+        """
+        if self.pending:
+            self.flush()
+        rects = self.dirty.plan()
+        copies = rects
+        # Drawing held back by a clip is not sent, but must still be carried
+        # over to the other buffer, on the swap after anything new was held
+        # back; a redraw of the same area does not grow the held rectangle
+        dirty = self.dirty
+        if dirty.held is not None and dirty.held_changes != self._held_changes:
+            copies = rects + [dirty.held]
+        self._held_changes = dirty.held_changes
+        self._back ^= 1
+        front = self.front
+        back = self.back
+        stride = self.stride
+        for x1, y1, x2, y2 in copies:
+            if x1 == 0 and x2 == self.width:
+                back[y1 * stride : y2 * stride] = front[y1 * stride : y2 * stride]
+                continue
+            for start in range(y1 * stride + x1 * 2, y2 * stride, stride):
+                stop = start + (x2 - x1) * 2
+                back[start:stop] = front[start:stop]
+        self.dirty.clear()
+        self.pending = rects
+        self.swaps += 1
+        return rects
+
+    def flush(self):
+        """
+        Send the pending rectangles of the front buffer to the panel.
+
+        With a :attr:`rm690b0.RM690B0.shadow`, only the tiles that changed
+        are sent.
+
+        :return: Number of pixel bytes sent
+        """
+        sent = 0
+        for x1, y1, x2, y2 in self._windows():
+            self.display.write_window(
+                x1,
+                y1,
+                x2 - x1,
+                y2 - y1,
+                self.front[y1 * self.stride + x1 * 2 :],
+                stride=self.stride,
+            )
+            sent += (x2 - x1) * (y2 - y1) * 2
+        self._flushed()
+        return sent
+
+    async def flush_async(self, chunk_rows=None):
+        """
+        :meth:`flush` that lets other ``asyncio`` tasks run between chunks.
+
+        :param int chunk_rows: Rows sent per chunk (default:
+            :attr:`rm690b0.RM690B0.chunk_rows`)
+        :return: Number of pixel bytes sent
+        """
+        sent = 0
+        for x1, y1, x2, y2 in self._windows():
+            await self.display.write_window_async(
+                x1,
+                y1,
+                x2 - x1,
+                y2 - y1,
+                self.front[y1 * self.stride + x1 * 2 :],
+                stride=self.stride,
+                chunk_rows=chunk_rows,
+            )
+            sent += (x2 - x1) * (y2 - y1) * 2
+        self._flushed()
+        return sent
+
+    def present(self):
+        """
+        Swap and send the new frame.
+
+        :return: Number of pixel bytes sent
+        """
+        self.swap()
+        return self.flush()
+
+    async def present_async(self, chunk_rows=None):
+        """
+        Swap and send the new frame with :meth:`flush_async`.
+
+        :return: Number of pixel bytes sent
+        """
+        self.swap()
+        return await self.flush_async(chunk_rows)
+
+    def _windows(self):
+        """Pending rectangles, narrowed to changed tiles with a shadow."""
+        shadow = self.display.shadow
+        if shadow is None:
+            return self.pending
+        rects = []
+        for rect in self.pending:
+            rects.extend(shadow.changed(self.front, self.stride, rect))
+        return rects
+
+    def _flushed(self):
+        if self.display.shadow is not None:
+            self.display.shadow.commit()
+        self.pending = []
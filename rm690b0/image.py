@@ -0,0 +1,342 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.image`
+====================================================
+
+Run-length compressed RGB565 images, decoded straight to the panel.
+
+:func:`draw_image` decodes an image band by band into one small buffer
+and sends each band with :meth:`rm690b0.RM690B0.write_window`, so showing
+a full-screen splash or background takes a few KB of RAM instead of a
+540KB bitmap. :func:`encode` and ``python -m rm690b0.image`` create the
+files on a host.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+The format is an 8-byte header, ``b"RL56"`` followed by the width and
+height as big-endian 16-bit values, then packets covering the pixels in
+row order. Packets may span rows. Each packet starts with a byte whose
+top bit selects a run (set) or literal pixels (clear); if bit 6 is set,
+the low 6 bits and the next byte form a 14-bit count, otherwise the low 6
+bits are the count. The stored count is one less than the number of
+pixels. A run is followed by one pixel, literals by ``count`` pixels, all
+big-endian RGB565 as sent over the wire.
+
+The host encoder reads binary PPM files, as written by
+:meth:`rm690b0.emulator.RM690B0Emulator.save_ppm`, and any other format
+Pillow can open when it is installed.
+
+Example:
+
+    from rm690b0.image import draw_image
+
+    display = RM690B0(bus)
+    draw_image(display, "/splash.rl56")
+
+On a host::
+
+    python -m rm690b0.image splash.png splash.rl56
+"""
+
+import io
+import sys
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+MAGIC = b"RL56"
+"""First bytes of every image."""
+
+_RUN = 0x80
+_LONG = 0x40
+_MAX_COUNT = 0x4000
+# Runs shorter than this are cheaper inside a literal packet
+_MIN_RUN = 3
+
+
+class ImageError(ValueError):
+    """The image data is not a valid RL56 stream."""
+
+
+class RLEReader:
+    """
+    Incremental decoder of an RL56 image.
+
+    Pixels are read in row order into caller-supplied buffers; the reader
+    itself only keeps a small chunk of the compressed stream.
+
+    :param source: Path, binary file object or bytes of the image
+    :param int chunk_size: Bytes read from the source at a time
+        (default: 256)
+    :raises ImageError: If the header is not an RL56 header
+    """
+
+    def __init__(self, source, *, chunk_size=256):
+        self._owned = isinstance(source, str)
+        if self._owned:
+            source = open(source, "rb")  # pylint: disable=consider-using-with
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            source = io.BytesIO(source)
+        self._stream = source
+        self._chunk = bytearray(chunk_size)
+        self._start = 0
+        self._end = 0
+        header = bytearray(8)
+        self._read_into(memoryview(header))
+        if header[:4] != MAGIC:
+            self.close()
+            raise ImageError("not an RL56 image")
+        self.width = header[4] << 8 | header[5]
+        """Image width in pixels."""
+        self.height = header[6] << 8 | header[7]
+        """Image height in pixels."""
+        self._left = 0
+        self._run = None
+
+    def read_pixels(self, buffer):
+        """
+        Decode the next pixels into a buffer.
+
+        :param buffer: Writable buffer filled completely, two bytes per
+            pixel in wire byte order
+        :raises ImageError: If the image ends before the buffer is full
+        """
+        view = memoryview(buffer)
+        size = len(view)
+        pos = 0
+        while pos < size:
+            if not self._left:
+                self._next_packet()
+            count = min(self._left, (size - pos) // 2)
+            if not count:
+                raise ImageError("buffer holds an odd number of bytes")
+            stop = pos + count * 2
+            if self._run is None:
+                self._read_into(view[pos:stop])
+            else:
+                # Fill by doubling the filled part, without allocating
+                view[pos : pos + 2] = self._run
+                filled = 2
+                while pos + filled < stop:
+                    step = min(filled, stop - pos - filled)
+                    view[pos + filled : pos + filled + step] = view[pos : pos + step]
+                    filled += step
+            pos = stop
+            self._left -= count
+
+    def close(self):
+        """Close the source if the reader opened it."""
+        if self._owned:
+            self._stream.close()
+            self._owned = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _next_packet(self):
+        header = self._byte()
+        count = header & 0x3F
+        if header & _LONG:
+            count = count << 8 | self._byte()
+        self._left = count + 1
+        if header & _RUN:
+            self._run = bytes((self._byte(), self._byte()))
+        else:
+            self._run = None
+
+    def _byte(self):
+        if self._start == self._end:
+            self._fill()
+        value = self._chunk[self._start]
+        self._start += 1
+        return value
+
+    def _fill(self):
+        self._start = 0
+        self._end = self._stream.readinto(self._chunk) or 0
+        if not self._end:
+            raise ImageError("image data ends early")
+
+    def _read_into(self, view):
+        pos = 0
+        size = len(view)
+        while pos < size:
+            if self._start == self._end:
+                if size - pos >= len(self._chunk):
+                    # Large literals go straight into the destination
+                    count = self._stream.readinto(view[pos:]) or 0
+                    if not count:
+                        raise ImageError("image data ends early")
+                    pos += count
+                    continue
+                self._fill()
+            count = min(self._end - self._start, size - pos)
+            view[pos : pos + count] = self._chunk[self._start : self._start + count]
+            self._start += count
+            pos += count
+
+
+def draw_image(display, source, x=0, y=0, *, band_size=4800):
+    """
+    Decode an RL56 image onto the display, one band of rows at a time.
+
+    :param display: :class:`rm690b0.RM690B0`; see
+        :meth:`~rm690b0.RM690B0.write_window` for the rotation, alignment
+        and displayio caveats
+    :param source: Path, binary file object or bytes of the image
+    :param int x: Left edge; must be even, as must the image width
+    :param int y: Top edge
+    :param int band_size: Bytes of the band buffer; a band holds at least
+        one row (default: 4800, four rows at 600 pixels wide)
+    :return: Covered ``(x1, y1, x2, y2)``
+    :raises ImageError: If the image data is invalid
+    """
+    with RLEReader(source) as reader:
+        width = reader.width
+        height = reader.height
+        row_bytes = width * 2
+        rows = max(1, band_size // row_bytes) if row_bytes else 1
+        band = memoryview(bytearray(rows * row_bytes))
+        for top in range(0, height, rows):
+            count = min(rows, height - top)
+            view = band[: count * row_bytes]
+            reader.read_pixels(view)
+            display.write_window(x, y + top, width, count, view)
+    return (x, y, x + width, y + height)
+
+
+def _packet(out, header, count):
+    count -= 1
+    if count > 0x3F:
+        out.append(header | _LONG | count >> 8)
+        out.append(count & 0xFF)
+    else:
+        out.append(header | count)
+
+
+def encode(pixels, width, height):
+    """
+    Compress RGB565 pixels into an RL56 image.
+
+    :param pixels: Sequence of ``width * height`` RGB565 values in row order
+    :param int width: Image width, 1 to 65535
+    :param int height: Image height, 1 to 65535
+    :return: Image as ``bytes``
+    """
+    total = width * height
+    if not 0 < width < 0x10000 or not 0 < height < 0x10000:
+        raise ValueError("image size out of range")
+    if len(pixels) != total:
+        raise ValueError("expected %d pixels" % total)
+    out = bytearray(MAGIC)
+    out += bytes((width >> 8, width & 0xFF, height >> 8, height & 0xFF))
+    literal = 0
+    i = 0
+    while i < total:
+        value = pixels[i]
+        run = 1
+        while i + run < total and run < _MAX_COUNT and pixels[i + run] == value:
+            run += 1
+        if run >= _MIN_RUN:
+            _flush_literal(out, pixels, literal, i - literal)
+            _packet(out, _RUN, run)
+            out.append(value >> 8)
+            out.append(value & 0xFF)
+            literal = i + run
+        i += run
+    _flush_literal(out, pixels, literal, total - literal)
+    return bytes(out)
+
+
+def _flush_literal(out, pixels, start, count):
+    while count:
+        step = min(count, _MAX_COUNT)
+        _packet(out, 0, step)
+        for value in pixels[start : start + step]:
+            out.append(value >> 8)
+            out.append(value & 0xFF)
+        start += step
+        count -= step
+
+
+def read_ppm(file):
+    """
+    Read a binary (P6) PPM image with 8-bit channels.
+
+    :param file: Path or binary file object
+    :return: ``(width, height, pixels)`` with RGB565 pixels
+    """
+    if not hasattr(file, "read"):
+        with open(file, "rb") as stream:
+            return read_ppm(stream)
+    data = file.read()
+    fields = []
+    pos = 0
+    while len(fields) < 4:
+        while pos < len(data) and data[pos : pos + 1].isspace():
+            pos += 1
+        if data[pos : pos + 1] == b"#":
+            pos = data.index(b"\n", pos)
+            continue
+        start = pos
+        while pos < len(data) and not data[pos : pos + 1].isspace():
+            pos += 1
+        fields.append(data[start:pos])
+    if fields[0] != b"P6" or fields[3] != b"255":
+        raise ImageError("only 8-bit binary PPM images are supported")
+    width = int(fields[1])
+    height = int(fields[2])
+    rgb = data[pos + 1 : pos + 1 + width * height * 3]
+    from rm690b0.color import rgb565_values  # pylint: disable=import-outside-toplevel
+
+    return width, height, rgb565_values(rgb)
+
+
+def encode_file(source, dest):
+    """
+    Compress an image file into an RL56 file.
+
+    :param str source: PPM file, or any image Pillow can open
+    :param str dest: Output path
+    :return: ``(width, height, size)`` with the compressed size in bytes
+    """
+    from rm690b0.color import rgb565_values  # pylint: disable=import-outside-toplevel
+
+    if source.lower().endswith((".ppm", ".pnm")):
+        width, height, pixels = read_ppm(source)
+    else:
+        from PIL import Image  # pylint: disable=import-outside-toplevel
+
+        with Image.open(source) as image:
+            image = image.convert("RGB")
+            width, height = image.size
+            pixels = rgb565_values(image.tobytes())
+    data = encode(pixels, width, height)
+    with open(dest, "wb") as stream:
+        stream.write(data)
+    return width, height, len(data)
+
+
+def main():
+    """Compress an image given on the command line: ``SOURCE DEST``."""
+    if len(sys.argv) != 3:
+        print("usage: python -m rm690b0.image SOURCE DEST")
+        sys.exit(2)
+    width, height, size = encode_file(sys.argv[1], sys.argv[2])
+    print(
+        "%dx%d, %d bytes (%.1f%% of raw RGB565)"
+        % (width, height, size, 100 * size / (width * height * 2))
+    )
+
+
+if __name__ == "__main__":
+    main()
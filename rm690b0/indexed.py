@@ -0,0 +1,165 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.indexed`
+====================================================
+
+Palette-indexed framebuffer for UIs with few colours.
+
+An :class:`IndexedFramebuffer` stores 1, 2, 4 or 8 bits per pixel in a
+``displayio.Bitmap`` and shows it through a ``displayio.Palette``. At
+4 bits a full 600x450 screen takes 135KB instead of 540KB. Changing a
+palette entry recolours every pixel using it on the next refresh without
+touching pixel data, so switching a theme costs one full refresh and no
+drawing.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+The expansion from indices to RGB565 happens in the displayio core while
+it streams each refresh area to the bus: the palette keeps every entry
+converted to the display's colour format, so each pixel is one table
+lookup in C. Doing the same lookup in Python before
+:meth:`rm690b0.RM690B0.write_window` would be far slower.
+
+Palette entries are given as RGB565 values, like the rest of this
+library, and widened to the 24-bit colours ``displayio.Palette`` takes
+so that they convert back exactly.
+
+Example:
+
+    display = RM690B0(bus, indexed_bits=4)
+    screen = display.indexed
+    screen.set_colors(DARK_THEME)
+    with display.frame(screen.bitmap):
+        display.mark_dirty(*screen.fill_rect(20, 20, 200, 40, 3))
+    screen.set_colors(LIGHT_THEME)
+    display.refresh()
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+DEFAULT_COLORS = (
+    0x0000,
+    0xFFFF,
+    0xF800,
+    0x07E0,
+    0x001F,
+    0xFFE0,
+    0x07FF,
+    0xF81F,
+    0x8410,
+    0xC618,
+    0x8000,
+    0x0400,
+    0x0010,
+    0x8400,
+    0x0410,
+    0x8010,
+)
+"""RGB565 colours the first palette entries start with: black, white,
+the primaries and secondaries, greys, then their dark variants."""
+
+
+def rgb565_to_888(color):
+    """
+    Widen an RGB565 colour to 24-bit RGB, replicating the top bits.
+
+    :param int color: RGB565 colour
+    :return: ``0xRRGGBB``
+    """
+    red = color >> 11
+    green = (color >> 5) & 0x3F
+    blue = color & 0x1F
+    return (
+        ((red << 3 | red >> 2) << 16)
+        | ((green << 2 | green >> 4) << 8)
+        | (blue << 3 | blue >> 2)
+    )
+
+
+class IndexedFramebuffer:
+    """
+    Full-screen bitmap of palette indices for an RM690B0.
+
+    :param display: :class:`rm690b0.RM690B0` to show it on
+    :param int bits: Bits per pixel, 1, 2, 4 or 8 (default: 4)
+    :param colors: RGB565 colours of the first palette entries
+        (default: :data:`DEFAULT_COLORS`)
+    :raises ValueError: If ``bits`` is not supported
+    """
+
+    def __init__(self, display, bits=4, colors=DEFAULT_COLORS):
+        # pylint: disable=import-outside-toplevel
+        import displayio
+
+        if bits not in (1, 2, 4, 8):
+            raise ValueError("bits must be 1, 2, 4 or 8")
+        self.display = display
+        self.bits = bits
+        self.width = display.width
+        self.height = display.height
+        self.bitmap = displayio.Bitmap(self.width, self.height, 1 << bits)
+        """Pixel indices; draw into it with ``bitmaptools`` or item access."""
+        self.palette = displayio.Palette(1 << bits)
+        """``displayio.Palette`` the indices go through."""
+        self.colors = [0x0000] * (1 << bits)
+        """RGB565 colour of every palette entry."""
+        self.group = displayio.Group()
+        """Group showing the bitmap, to be set as ``root_group``."""
+        self.group.append(displayio.TileGrid(self.bitmap, pixel_shader=self.palette))
+        self.set_colors(colors[: 1 << bits])
+
+    @property
+    def buffer_bytes(self):
+        """Size of the pixel data in bytes, with displayio's 32-bit row padding."""
+        return (self.width * self.bits + 31) // 32 * 4 * self.height
+
+    def set_color(self, index, color):
+        """
+        Change one palette entry.
+
+        Every pixel with this index changes colour on the next refresh.
+
+        :param int index: Palette index
+        :param int color: RGB565 colour
+        """
+        self.palette[index] = rgb565_to_888(color)
+        self.colors[index] = color
+
+    def set_colors(self, colors, start=0):
+        """
+        Change consecutive palette entries, such as a whole theme.
+
+        :param colors: RGB565 colours
+        :param int start: First palette index (default: 0)
+        """
+        for index, color in enumerate(colors, start):
+            self.set_color(index, color)
+
+    def fill_rect(
+        self, x, y, width, height, index
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Fill a rectangle with a palette index.
+
+        :return: Filled ``(x1, y1, x2, y2)`` for :meth:`rm690b0.RM690B0.mark_dirty`
+        """
+        import bitmaptools  # pylint: disable=import-outside-toplevel
+
+        x1 = max(0, x)
+        y1 = max(0, y)
+        x2 = min(self.width, x + width)
+        y2 = min(self.height, y + height)
+        if x1 < x2 and y1 < y2:
+            bitmaptools.fill_region(self.bitmap, x1, y1, x2, y2, index)
+        return (x1, y1, x2, y2)
+
+    def show(self):
+        """Make this framebuffer the display's ``root_group``."""
+        self.display.root_group = self.group
@@ -0,0 +1,317 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.initseq`
+====================================================
+
+Build, decode, check and optimize BusDisplay init sequences.
+
+An init sequence is a byte string of entries: a command byte, a length
+byte whose top bit (0x80) says a delay byte follows the arguments, the
+arguments, and the optional delay in milliseconds, where 255 means
+500 ms.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Example:
+
+    from rm690b0 import _INIT_SEQUENCE
+    from rm690b0 import initseq
+
+    print(initseq.describe(_INIT_SEQUENCE))
+    print(initseq.validate(_INIT_SEQUENCE))
+    fast = initseq.optimize(_INIT_SEQUENCE)
+    print(initseq.delay_budget(_INIT_SEQUENCE), "->", initseq.delay_budget(fast))
+
+    sequence = initseq.encode(
+        (
+            (0x3A, b"\\x55"),
+            (0x11, b"", 80),
+            (0x29, b""),
+        )
+    )
+"""
+
+from collections import namedtuple
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+_DELAY_FLAG = 0x80
+_MAX_ARGS = 0x7F
+_LONG_DELAY = 500
+_PAGE_SELECT = 0xFE
+_SOFTWARE_RESET = 0x01
+
+InitCommand = namedtuple("InitCommand", ("command", "data", "delay"))
+"""One init sequence entry: command byte, argument bytes, delay in ms."""
+
+#: Commands whose delay is kept by :func:`optimize`
+REQUIRED_DELAYS = (0x01, 0x10, 0x11)
+
+#: Argument counts of the standard commands, for :func:`validate`
+ARGUMENT_COUNTS = {
+    0x01: 0,
+    0x10: 0,
+    0x11: 0,
+    0x12: 0,
+    0x13: 0,
+    0x28: 0,
+    0x29: 0,
+    0x2A: 4,
+    0x2B: 4,
+    0x30: 4,
+    0x33: 6,
+    0x34: 0,
+    0x35: 1,
+    0x36: 1,
+    0x37: 2,
+    0x3A: 1,
+    0x51: 1,
+}
+
+# Commands that act rather than set a register, so repeating them is not
+# redundant
+_ACTIONS = (0x01, 0x10, 0x11, 0x12, 0x13, 0x28, 0x29, 0x2C, 0x3C)
+
+# TE on takes an optional mode byte
+_OPTIONAL_ARGUMENTS = (0x35,)
+
+_NAMES = {
+    0x01: "SWRESET",
+    0x10: "SLPIN",
+    0x11: "SLPOUT",
+    0x12: "PTLON",
+    0x13: "NORON",
+    0x28: "DISPOFF",
+    0x29: "DISPON",
+    0x2A: "CASET",
+    0x2B: "RASET",
+    0x2C: "RAMWR",
+    0x30: "PTLAR",
+    0x33: "VSCRDEF",
+    0x34: "TEOFF",
+    0x35: "TEON",
+    0x36: "MADCTL",
+    0x37: "VSCSAD",
+    0x3A: "COLMOD",
+    0x3C: "RAMWRC",
+    0x51: "WRDISBV",
+    0xFE: "PAGE",
+}
+
+
+class InitSequenceError(ValueError):
+    """Raised for a malformed init sequence or an unencodable entry."""
+
+
+def encode(commands):
+    """
+    Build an init sequence from a table of entries.
+
+    :param commands: Iterable of :class:`InitCommand` or tuples of
+        ``(command, data)`` or ``(command, data, delay_ms)``, where ``data``
+        is bytes or a sequence of ints and the delay is 0-254 or 500 ms
+    :return: Encoded sequence
+    :raises InitSequenceError: If an entry cannot be encoded
+    """
+    result = bytearray()
+    for entry in commands:
+        command = entry[0]
+        data = bytes(entry[1]) if len(entry) > 1 else b""
+        delay = entry[2] if len(entry) > 2 else 0
+        if not 0 <= command <= 0xFF:
+            raise InitSequenceError("command 0x%X is not a byte" % command)
+        if len(data) > _MAX_ARGS:
+            raise InitSequenceError(
+                "command 0x%02X has %d argument bytes, at most %d fit"
+                % (command, len(data), _MAX_ARGS)
+            )
+        if delay == _LONG_DELAY:
+            delay_byte = 255
+        elif 0 <= delay < 255:
+            delay_byte = delay
+        else:
+            raise InitSequenceError(
+                "command 0x%02X delay %d ms is not 0-254 or 500" % (command, delay)
+            )
+        result.append(command)
+        result.append(len(data) | (_DELAY_FLAG if delay else 0))
+        result.extend(data)
+        if delay:
+            result.append(delay_byte)
+    return bytes(result)
+
+
+def iter_decode(sequence):
+    """
+    Decode an init sequence entry by entry.
+
+    Entries before a malformed one are yielded before the error is raised,
+    so a partially valid sequence can still be replayed.
+
+    :param sequence: Encoded sequence
+    :raises InitSequenceError: If the sequence is truncated
+    """
+    i = 0
+    end = len(sequence)
+    while i < end:
+        if i + 2 > end:
+            raise InitSequenceError("entry at byte %d has no length byte" % i)
+        command = sequence[i]
+        length = sequence[i + 1] & _MAX_ARGS
+        has_delay = sequence[i + 1] & _DELAY_FLAG
+        start = i + 2
+        stop = start + length
+        if stop + (1 if has_delay else 0) > end:
+            raise InitSequenceError(
+                "command 0x%02X at byte %d runs past the end" % (command, i)
+            )
+        delay = 0
+        if has_delay:
+            delay = sequence[stop]
+            if delay == 255:
+                delay = _LONG_DELAY
+            stop += 1
+        yield InitCommand(command, bytes(sequence[start : start + length]), delay)
+        i = stop
+
+
+def decode(sequence):
+    """
+    Decode a whole init sequence.
+
+    :param sequence: Encoded sequence
+    :return: List of :class:`InitCommand`
+    :raises InitSequenceError: If the sequence is malformed
+    """
+    return list(iter_decode(sequence))
+
+
+def delay_budget(sequence):
+    """
+    Total delay an init sequence asks for.
+
+    :param sequence: Encoded sequence or list of :class:`InitCommand`
+    :return: Milliseconds
+    """
+    entries = decode(sequence) if isinstance(sequence, (bytes, bytearray)) else sequence
+    return sum(entry.delay for entry in entries)
+
+
+def _redundant(entries):
+    """Indexes of register writes that a later write to the same register undoes."""
+    redundant = []
+    last_write = {}
+    page = 0
+    previous_page_select = None
+    for index, entry in enumerate(entries):
+        command = entry.command
+        if command == _SOFTWARE_RESET:
+            last_write = {}
+            page = 0
+            previous_page_select = None
+            continue
+        if command == _PAGE_SELECT:
+            if previous_page_select is not None:
+                redundant.append(previous_page_select)
+            previous_page_select = index
+            page = entry.data[0] if entry.data else page
+            continue
+        previous_page_select = None
+        if command in _ACTIONS:
+            continue
+        key = (page, command)
+        if key in last_write:
+            redundant.append(last_write[key])
+        last_write[key] = index
+    return sorted(redundant)
+
+
+def validate(sequence):
+    """
+    Check an init sequence for problems.
+
+    Reports truncation, argument counts that do not match the standard
+    commands and register writes that a later write makes redundant.
+
+    :param sequence: Encoded sequence
+    :return: List of problem descriptions; empty if none were found
+    """
+    problems = []
+    entries = []
+    try:
+        for entry in iter_decode(sequence):
+            entries.append(entry)
+    except InitSequenceError as error:
+        problems.append(str(error))
+    page = 0
+    for index, entry in enumerate(entries):
+        if entry.command == _PAGE_SELECT:
+            page = entry.data[0] if entry.data else page
+            continue
+        expected = ARGUMENT_COUNTS.get(entry.command) if page == 0 else None
+        count = len(entry.data)
+        if expected is not None and count != expected:
+            if not (entry.command in _OPTIONAL_ARGUMENTS and count == 0):
+                problems.append(
+                    "entry %d: %s takes %d argument bytes, got %d"
+                    % (index, _name(entry.command), expected, count)
+                )
+    for index in _redundant(entries):
+        problems.append(
+            "entry %d: %s is overwritten later" % (index, _name(entries[index].command))
+        )
+    return problems
+
+
+def optimize(sequence, *, keep_delays=REQUIRED_DELAYS):
+    """
+    Drop redundant writes and trim delays from an init sequence.
+
+    Register writes that a later write to the same register (on the same
+    command page) replaces are removed, along with their delays. Delays are
+    then kept only on commands listed in ``keep_delays``.
+
+    :param sequence: Encoded sequence
+    :param keep_delays: Commands whose delays are kept
+        (default: :data:`REQUIRED_DELAYS`)
+    :return: Optimized encoded sequence
+    """
+    entries = decode(sequence)
+    redundant = _redundant(entries)
+    kept = []
+    for index, entry in enumerate(entries):
+        if index in redundant:
+            continue
+        if entry.delay and entry.command not in keep_delays:
+            entry = InitCommand(entry.command, entry.data, 0)
+        kept.append(entry)
+    return encode(kept)
+
+
+def describe(sequence):
+    """
+    Render an init sequence as a readable table.
+
+    :param sequence: Encoded sequence
+    :return: One line per entry: command, name, arguments and delay
+    """
+    lines = []
+    for entry in iter_decode(sequence):
+        line = "0x%02X %-8s %s" % (
+            entry.command,
+            _name(entry.command),
+            " ".join("%02X" % b for b in entry.data),
+        )
+        if entry.delay:
+            line += "  (%d ms)" % entry.delay
+        lines.append(line.rstrip())
+    lines.append("total delay: %d ms" % delay_budget(sequence))
+    return "\n".join(lines)
+
+
+def _name(command):
+    return _NAMES.get(command, "0x%02X" % command)
@@ -0,0 +1,217 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.orbit`
+====================================================
+
+Pixel orbiting against AMOLED burn-in.
+
+A :class:`PixelOrbit` moves the whole image a few pixels at a time along
+a closed path, so static UI elements do not light the same pixels for
+hours. Along the panel's scan axis (x in landscape) it moves the image
+with the hardware scroll pointer: one command and no pixel data, with no
+flash since frame memory is not touched. Across the scan axis the
+controller cannot move what it shows, so the image is sent again shifted
+into the spare frame memory above and below the display. The path walks
+the scan axis back and forth and changes the other coordinate only at
+the end of each sweep, so most steps cost a 2-byte command.
+
+Orbiting is therefore not free of pixel transfers: every step across the
+scan axis resends the whole frame, or with displayio alone forces a full
+redraw. With the default radius of 3 that is 12 of the 96 steps of a
+cycle, 2 of every 16; :attr:`PixelOrbit.redraws_per_cycle` gives the
+figure for other radii.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+Scrolling wraps: the lines pushed out at one end of the scan axis come
+back at the other. Keep ``radius`` lines at both ends of the display
+background-coloured, as is usual for orbiting layouts anyway. The orbit
+owns the scroll pointer; do not combine it with
+:class:`rm690b0.console.ScrollConsole` or other scrolling. Lines fixed by
+:meth:`rm690b0.RM690B0.set_scroll_area` stay put.
+
+The shift across the scan axis goes through
+:meth:`rm690b0.RM690B0.set_window_offset`, which marks
+:attr:`rm690b0.RM690B0.buffers` and :attr:`rm690b0.RM690B0.bands` fully
+dirty, so their next flush resends the frame at the new place. When
+neither exists, the ``root_group`` is moved instead and displayio
+redraws it on its next refresh. Code writing its own windows should
+redraw everything when :meth:`PixelOrbit.step` returns True.
+
+Example:
+
+    display = RM690B0(bus, double_buffer=True)
+    orbit = PixelOrbit(display, radius=3, interval=60)
+    while True:
+        draw_clock(display.buffers)
+        orbit.update()
+        display.buffers.present()
+"""
+
+import time
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+
+def orbit_path(radius, cross_step=1):
+    """
+    Closed path of ``(scan, cross)`` shifts covering a square.
+
+    The path sweeps the scan coordinate from one side to the other,
+    steps the cross coordinate, sweeps back, and so on over the square,
+    then retraces itself to the start.
+
+    :param int radius: Largest shift along either axis
+    :param int cross_step: Granularity of the cross coordinate (default: 1)
+    :return: List of ``(scan, cross)`` shifts
+    """
+    limit = radius // cross_step * cross_step
+    scans = list(range(-radius, radius + 1))
+    path = []
+    for i, cross in enumerate(range(-limit, limit + 1, cross_step)):
+        row = scans if i % 2 == 0 else scans[::-1]
+        path.extend((scan, cross) for scan in row)
+    return path + path[-2:0:-1]
+
+
+class PixelOrbit:
+    """
+    Moves the image of an RM690B0 around a small square on a schedule.
+
+    :param display: :class:`rm690b0.RM690B0` to orbit; its rotation must
+        be 0 or done in hardware
+    :param int radius: Largest shift in pixels along either axis
+        (default: 3)
+    :param float interval: Seconds between steps for :meth:`update` and
+        :meth:`run` (default: 60)
+    :raises ValueError: If ``radius`` exceeds the frame memory margins
+        across the scan axis
+    :raises RuntimeError: If displayio is rotating the display in software
+    """
+
+    def __init__(self, display, radius=3, interval=60):
+        if display.rotation % 360:
+            raise RuntimeError("orbit needs rotation 0 or hardware_rotation")
+        left, top, right, bottom = display.frame_margins
+        if display.scan_axis == "x":
+            margin = min(top, bottom)
+            cross_step = 1
+        else:
+            margin = min(left, right)
+            # write_window columns must be even
+            cross_step = 2
+        if radius > margin:
+            raise ValueError(
+                "radius %d exceeds the %d-line frame memory margin" % (radius, margin)
+            )
+        self.display = display
+        self.interval = interval
+        self.path = orbit_path(radius, cross_step)
+        """``(scan, cross)`` shifts visited in order."""
+        self.index = self.path.index((0, 0))
+        self.steps = 0
+        """Steps taken."""
+        self.redraws = 0
+        """Steps that needed the image to be sent again."""
+        self._cross = 0
+        self._last = time.monotonic()
+        self._running = False
+
+    @property
+    def offset(self):
+        """Current shift of the image as ``(x, y)`` in pixels."""
+        scan, cross = self.path[self.index]
+        if self.display.scan_axis == "x":
+            return (scan, cross)
+        return (cross, scan)
+
+    @property
+    def redraws_per_cycle(self):
+        """
+        Steps that resend the image in one trip around the path, as
+        ``(redraws, steps)``; ``(12, 96)`` for a radius of 3.
+        """
+        path = self.path
+        redraws = sum(1 for i in range(len(path)) if path[i][1] != path[i - 1][1])
+        return (redraws, len(path))
+
+    def step(self):
+        """
+        Move to the next point of the path.
+
+        :return: True if the image must be sent again, False if the move
+            was done by scrolling alone
+        """
+        self.index = (self.index + 1) % len(self.path)
+        self.steps += 1
+        return self._move(*self.path[self.index])
+
+    def update(self, now=None):
+        """
+        Take a step if :attr:`interval` has passed since the last one.
+
+        :param float now: Current ``time.monotonic()``, if already known
+        :return: True if the image must be sent again
+        """
+        if now is None:
+            now = time.monotonic()
+        if now - self._last < self.interval:
+            return False
+        self._last = now
+        return self.step()
+
+    def reset(self):
+        """
+        Move the image back to where it started.
+
+        :return: True if the image must be sent again
+        """
+        self.index = self.path.index((0, 0))
+        return self._move(0, 0)
+
+    async def run(self):
+        """
+        Step every :attr:`interval` seconds until :meth:`stop` is called.
+
+        The resend after a shift across the scan axis is left to the next
+        flush or refresh, such as a :class:`rm690b0.refresher.Refresher`.
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        self._running = True
+        while self._running:
+            await asyncio.sleep(self.interval)
+            if self._running:
+                self.step()
+
+    def stop(self):
+        """End :meth:`run` before its next step."""
+        self._running = False
+
+    def _move(self, scan, cross):
+        display = self.display
+        # The scroll pointer moves content towards the start of the axis
+        display.scroll(-scan)
+        if cross == self._cross:
+            return False
+        delta = cross - self._cross
+        self._cross = cross
+        self.redraws += 1
+        if display.scan_axis == "x":
+            display.set_window_offset(0, cross)
+        else:
+            display.set_window_offset(cross, 0)
+        group = display.root_group
+        if display.buffers is None and display.bands is None and group is not None:
+            if display.scan_axis == "x":
+                group.y += delta
+            else:
+                group.x += delta
+        return True
@@ -0,0 +1,214 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.pacing`
+====================================================
+
+Frame pacing, optionally locked to the panel's tearing-effect signal.
+
+* Author(s): Przemyslaw Patrick Socha
+"""
+
+import time
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+
+class FramePacer:
+    """
+    Paces frames to a target rate, optionally locked to the TE signal.
+
+    :meth:`wait` sleeps until the next frame slot instead of spinning, so
+    the CPU is free for background tasks. With a TE source the flush is
+    additionally held until the next tearing-effect edge, which the
+    RM690B0 raises when the panel starts scanning a new frame. Frames
+    that start more than one period late are counted as dropped and the
+    schedule restarts from the current time rather than bursting to catch
+    up.
+
+    The TE source is anything with a monotonically increasing ``count``
+    attribute, such as ``countio.Counter``. Time and sleep functions can
+    be replaced, which lets the pacer run on a host with a simulated
+    clock and TE line.
+
+    :param float target_fps: Target frame rate in frames per second
+    :param te_source: Edge counter for the TE line, or None for a
+        software timer only
+    :param float te_timeout: Longest wait for a TE edge in seconds
+        (default: 0.05)
+    :param float te_margin: How early to wake before the expected TE edge
+        in seconds (default: 0.004)
+    :param clock: Function returning the current time in seconds
+    :param sleep: Function sleeping for the given number of seconds
+
+    Example:
+
+        pacer = FramePacer(30)
+        while True:
+            draw()
+            pacer.wait()
+            display.refresh()
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        target_fps,
+        te_source=None,
+        *,
+        te_timeout=0.05,
+        te_margin=0.004,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ):
+        if target_fps <= 0:
+            raise ValueError("target_fps must be positive")
+        self.period = 1 / target_fps
+        self.te_source = te_source
+        self.te_timeout = te_timeout
+        self.te_margin = te_margin
+        self._clock = clock
+        self._sleep = sleep
+        self._deadline = None
+        self.frames = 0
+        """Number of frames paced so far."""
+        self.dropped = 0
+        """Number of frame slots missed because a frame ran late."""
+        self.te_timeouts = 0
+        """Number of waits where no TE edge arrived in time."""
+        self.slept = 0.0
+        """Total time spent sleeping in :meth:`wait`, in seconds."""
+
+    @property
+    def target_fps(self):
+        """Target frame rate in frames per second."""
+        return 1 / self.period
+
+    @target_fps.setter
+    def target_fps(self, value):
+        if value <= 0:
+            raise ValueError("target_fps must be positive")
+        self.period = 1 / value
+        self._deadline = None
+
+    def reset(self):
+        """Restart the schedule and clear the counters."""
+        self._deadline = None
+        self.frames = 0
+        self.dropped = 0
+        self.te_timeouts = 0
+        self.slept = 0.0
+
+    def wait(self):
+        """
+        Block until it is time to flush the next frame.
+
+        :return: True if the flush is aligned to a TE edge
+        """
+        delay = self._start_wait()
+        if delay > 0:
+            self._sleep(delay)
+        aligned = False
+        if self.te_source is not None:
+            aligned = self._wait_for_edge()
+        self._end_wait(aligned)
+        return aligned
+
+    async def wait_async(self):
+        """
+        Like :meth:`wait`, but lets other ``asyncio`` tasks run meanwhile.
+
+        The ``sleep`` function given to the pacer is not used.
+
+        :return: True if the flush is aligned to a TE edge
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        delay = self._start_wait()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        aligned = False
+        if self.te_source is not None:
+            source = self.te_source
+            start = source.count
+            limit = self._clock() + self.te_timeout
+            while source.count == start:
+                if self._clock() >= limit:
+                    self.te_timeouts += 1
+                    break
+                await asyncio.sleep(self.te_margin / 4)
+            else:
+                aligned = True
+        self._end_wait(aligned)
+        return aligned
+
+    def _start_wait(self):
+        """Count the frame and return how long to sleep before it."""
+        now = self._clock()
+        if self._deadline is None:
+            self._deadline = now
+        delay = self._deadline - now
+        if delay > 0:
+            self.slept += delay
+        elif -delay >= self.period:
+            missed = int(-delay / self.period)
+            self.dropped += missed
+            self._deadline = now
+        self.frames += 1
+        return delay
+
+    def _end_wait(self, aligned):
+        if aligned:
+            self._deadline = self._clock() + self.period - self.te_margin
+        else:
+            self._deadline += self.period
+
+    def _wait_for_edge(self):
+        source = self.te_source
+        start = source.count
+        limit = self._clock() + self.te_timeout
+        poll = self.te_margin / 4
+        while source.count == start:
+            now = self._clock()
+            if now >= limit:
+                self.te_timeouts += 1
+                return False
+            self._sleep(poll)
+            self.slept += poll
+        return True
+
+
+class _PolledEdgeCounter:
+    """Counts rising edges on a digital input while it is being polled."""
+
+    def __init__(self, pin):
+        import digitalio  # pylint: disable=import-outside-toplevel
+
+        self._input = digitalio.DigitalInOut(pin)
+        self._input.direction = digitalio.Direction.INPUT
+        self._last = self._input.value
+        self._count = 0
+
+    @property
+    def count(self):
+        """Rising edges seen so far."""
+        value = self._input.value
+        if value and not self._last:
+            self._count += 1
+        self._last = value
+        return self._count
+
+    def deinit(self):
+        """Release the pin."""
+        self._input.deinit()
+
+
+def _te_counter(pin):
+    """Create an edge counter for the TE pin, preferring countio."""
+    try:
+        import countio  # pylint: disable=import-outside-toplevel
+    except ImportError:
+        return _PolledEdgeCounter(pin)
+    return countio.Counter(pin, edge=countio.Edge.RISE)
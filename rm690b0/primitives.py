@@ -0,0 +1,335 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.primitives`
+====================================================
+
+Span-rasterized circles, rounded rectangles and lines with an LRU cache.
+
+Shapes are rasterized into horizontal spans, one or two per row, using
+integer arithmetic for circles and corners and a scanline fill for
+lines. Spans are drawn with one ``bitmaptools.fill_region`` call each,
+so the cost of a shape is a call per row rather than a Python operation
+per pixel.
+
+:class:`PrimitiveCache` memoizes both the spans, keyed by shape, size
+and stroke, and the sprite bitmaps, keyed additionally by colour, so a
+gauge or HUD that draws the same shapes every frame rasterizes each one
+only once.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Example:
+
+    shapes = PrimitiveCache()
+    ball = shapes.sprite("circle", 14, color=0xFFFF)
+    display.mark_dirty(*ball.move(canvas, 0x0000, x, y))
+
+    shapes.draw(canvas, "round_rect", 20, 20, 160, 80, 12, color=0xF800, stroke=2)
+"""
+
+from collections import namedtuple
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+Raster = namedtuple("Raster", ("x", "y", "width", "height", "spans"))
+"""
+A rasterized shape.
+
+``spans`` is a list of ``(row, x1, x2)`` runs with exclusive ``x2``
+inside a ``width`` x ``height`` box. ``x`` and ``y`` are the offset of the
+box from the shape's anchor point: the centre of a circle, the top-left
+corner of a rectangle and the start of a line.
+"""
+
+
+def _half_widths(radius):
+    """Half-width of a filled circle on each row, from the centre row out."""
+    widths = []
+    limit = radius * radius + radius
+    half = radius
+    for row in range(radius + 1):
+        while half * half + row * row > limit:
+            half -= 1
+        widths.append(half)
+    return widths
+
+
+def _circle_rows(radius):
+    widths = _half_widths(radius)
+    return [
+        (radius - widths[abs(row)], radius + widths[abs(row)] + 1)
+        for row in range(-radius, radius + 1)
+    ]
+
+
+def _round_rect_rows(width, height, radius):
+    radius = max(0, min(radius, width // 2, height // 2))
+    widths = _half_widths(radius)
+    rows = []
+    for row in range(height):
+        if row < radius:
+            inset = radius - widths[radius - row]
+        elif row >= height - radius:
+            inset = radius - widths[row - (height - 1 - radius)]
+        else:
+            inset = 0
+        rows.append((inset, width - inset))
+    return rows
+
+
+def _outline(outer, inner, stroke):
+    """Spans of the ``outer`` rows minus ``inner`` rows placed ``stroke`` inside."""
+    spans = []
+    for row, (x1, x2) in enumerate(outer):
+        hole = row - stroke
+        if 0 <= hole < len(inner) and inner[hole][0] < inner[hole][1]:
+            left = inner[hole][0] + stroke
+            right = inner[hole][1] + stroke
+            if x1 < left:
+                spans.append((row, x1, left))
+            if right < x2:
+                spans.append((row, right, x2))
+        elif x1 < x2:
+            spans.append((row, x1, x2))
+    return spans
+
+
+def _filled(rows):
+    return [(row, x1, x2) for row, (x1, x2) in enumerate(rows) if x1 < x2]
+
+
+def circle(radius, stroke=0):
+    """
+    Rasterize a circle centred on its anchor.
+
+    :param int radius: Radius in pixels; the shape is ``2 * radius + 1`` wide
+    :param int stroke: Outline width, or 0 for a filled circle
+    :return: :class:`Raster`
+    """
+    outer = _circle_rows(radius)
+    if 0 < stroke <= radius:
+        spans = _outline(outer, _circle_rows(radius - stroke), stroke)
+    else:
+        spans = _filled(outer)
+    return Raster(-radius, -radius, 2 * radius + 1, 2 * radius + 1, spans)
+
+
+def round_rect(width, height, radius=0, stroke=0):
+    """
+    Rasterize a rectangle with rounded corners, anchored at its top-left.
+
+    :param int width: Width in pixels
+    :param int height: Height in pixels
+    :param int radius: Corner radius, 0 for square corners
+    :param int stroke: Outline width, or 0 for a filled rectangle
+    :return: :class:`Raster`
+    """
+    outer = _round_rect_rows(width, height, radius)
+    if 0 < stroke and 2 * stroke < min(width, height):
+        inner = _round_rect_rows(
+            width - 2 * stroke, height - 2 * stroke, max(0, radius - stroke)
+        )
+        spans = _outline(outer, inner, stroke)
+    else:
+        spans = _filled(outer)
+    return Raster(0, 0, width, height, spans)
+
+
+def line(end_x, end_y, stroke=1):  # pylint: disable=too-many-locals
+    """
+    Rasterize a line from its anchor to ``(end_x, end_y)``.
+
+    The line is filled as a quadrilateral ``stroke`` pixels wide, one
+    span per row, so thick and steep lines have no gaps.
+
+    :param int end_x: End point column, relative to the start
+    :param int end_y: End point row, relative to the start
+    :param int stroke: Line width (default: 1)
+    :return: :class:`Raster`
+    """
+    length = (end_x * end_x + end_y * end_y) ** 0.5
+    half = stroke / 2
+    if length:
+        normal_x = -end_y / length * half
+        normal_y = end_x / length * half
+        cap_x = end_x / length * half
+        cap_y = end_y / length * half
+    else:
+        normal_x, normal_y, cap_x, cap_y = half, 0.0, 0.0, half
+    # Pixel centres are at +0.5; the line runs between the centres of its
+    # end pixels, extended by half the stroke at square caps
+    corners = (
+        (0.5 - cap_x + normal_x, 0.5 - cap_y + normal_y),
+        (0.5 + end_x + cap_x + normal_x, 0.5 + end_y + cap_y + normal_y),
+        (0.5 + end_x + cap_x - normal_x, 0.5 + end_y + cap_y - normal_y),
+        (0.5 - cap_x - normal_x, 0.5 - cap_y - normal_y),
+    )
+    top = int(min(y for _, y in corners) // 1)
+    bottom = int(max(y for _, y in corners) // 1) + 1
+    rows = []
+    for row in range(top, bottom):
+        center = row + 0.5
+        left = None
+        right = None
+        for i, (x1, y1) in enumerate(corners):
+            x2, y2 = corners[(i + 1) % 4]
+            if (y1 <= center < y2) or (y2 <= center < y1):
+                x = x1 + (center - y1) * (x2 - x1) / (y2 - y1)
+                left = x if left is None or x < left else left
+                right = x if right is None or x > right else right
+        if left is not None:
+            first = int(-((0.5 - left) // 1))
+            stop = int((right - 0.5) // 1) + 1
+            if first < stop:
+                rows.append((row, first, stop))
+    if not rows:
+        return Raster(0, 0, 0, 0, [])
+    x_min = min(span[1] for span in rows)
+    x_max = max(span[2] for span in rows)
+    y_min = rows[0][0]
+    spans = [(row - y_min, x1 - x_min, x2 - x_min) for row, x1, x2 in rows]
+    return Raster(x_min, y_min, x_max - x_min, rows[-1][0] - y_min + 1, spans)
+
+
+_SHAPES = {"circle": circle, "round_rect": round_rect, "line": line}
+
+
+def fill_spans(dest, raster, x, y, color):
+    """
+    Draw a raster into a bitmap with one ``fill_region`` call per span.
+
+    :param dest: Destination ``displayio.Bitmap``
+    :param Raster raster: Shape to draw
+    :param int x: Anchor column
+    :param int y: Anchor row
+    :param int color: Value written to ``dest``
+    :return: Covered ``(x1, y1, x2, y2)`` for dirty tracking
+    """
+    import bitmaptools  # pylint: disable=import-outside-toplevel
+
+    fill_region = bitmaptools.fill_region
+    left = x + raster.x
+    top = y + raster.y
+    width = dest.width
+    height = dest.height
+    for row, x1, x2 in raster.spans:
+        row += top
+        if 0 <= row < height:
+            x1 = max(0, left + x1)
+            x2 = min(width, left + x2)
+            if x1 < x2:
+                fill_region(dest, x1, row, x2, row + 1, color)
+    return (left, top, left + raster.width, top + raster.height)
+
+
+class PrimitiveCache:
+    """
+    Size-bounded LRU cache of rasterized shapes.
+
+    Shapes are named ``"circle"`` (radius), ``"round_rect"`` (width,
+    height, radius) and ``"line"`` (end_x, end_y), followed by their size
+    arguments as in :func:`circle`, :func:`round_rect` and :func:`line`.
+
+    :param int max_entries: Rasters and sprite bitmaps kept, each (default: 32)
+    """
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._rasters = {}
+        self._sprites = {}
+        self._clock = 0
+
+    def raster(self, shape, *size, stroke=0):
+        """
+        Spans of a shape, rasterized on first use.
+
+        :param str shape: ``"circle"``, ``"round_rect"`` or ``"line"``
+        :param size: Size arguments of the shape
+        :param int stroke: Outline or line width
+        :return: :class:`Raster`
+        """
+        key = (shape, size, stroke)
+        raster = self._get(self._rasters, key)
+        if raster is None:
+            if shape == "line":
+                raster = line(*size, stroke=max(1, stroke))
+            else:
+                raster = _SHAPES[shape](*size, stroke=stroke)
+            self._put(self._rasters, key, raster)
+        return raster
+
+    def sprite(self, shape, *size, color, stroke=0):
+        """
+        Shape drawn into its own bitmap, as an :class:`rm690b0.sprite.RLESprite`.
+
+        The sprite is anchored like the shape, so ``sprite.blit(canvas, x,
+        y)`` puts a circle's centre at ``(x, y)``. Only the shape's spans
+        are copied when it is drawn or erased.
+
+        Only the bitmap and its runs are cached. Each call returns a new
+        sprite, so two sprites of the same shape and colour keep their
+        own :attr:`~rm690b0.sprite.RLESprite.position`.
+
+        :param int color: RGB565 colour
+        :return: :class:`rm690b0.sprite.RLESprite`
+        """
+        # pylint: disable=import-outside-toplevel
+        import displayio
+        from rm690b0.sprite import RLESprite
+
+        key = (shape, size, stroke, color)
+        image = self._get(self._sprites, key)
+        if image is None:
+            raster = self.raster(shape, *size, stroke=stroke)
+            bitmap = displayio.Bitmap(
+                max(1, raster.width), max(1, raster.height), 65536
+            )
+            runs = [[] for _ in range(raster.height)]
+            for row, x1, x2 in raster.spans:
+                runs[row].append((x1, x2))
+            fill_spans(bitmap, raster, -raster.x, -raster.y, color)
+            image = (bitmap, runs, (raster.x, raster.y))
+            self._put(self._sprites, key, image)
+        return RLESprite(image[0], runs=image[1], origin=image[2])
+
+    def draw(
+        self, dest, shape, x, y, *size, color, stroke=0
+    ):  # pylint: disable=too-many-arguments
+        """
+        Draw a shape straight into a bitmap from its cached spans.
+
+        :param dest: Destination ``displayio.Bitmap``
+        :param int x: Anchor column
+        :param int y: Anchor row
+        :param int color: Value written to ``dest``
+        :return: Covered ``(x1, y1, x2, y2)`` for dirty tracking
+        """
+        return fill_spans(dest, self.raster(shape, *size, stroke=stroke), x, y, color)
+
+    def clear(self):
+        """Drop every cached raster and sprite bitmap."""
+        self._rasters = {}
+        self._sprites = {}
+
+    def _get(self, table, key):
+        entry = table.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._clock += 1
+        entry[0] = self._clock
+        return entry[1]
+
+    def _put(self, table, key, value):
+        if len(table) >= self.max_entries:
+            oldest = min(table, key=lambda k: table[k][0])
+            del table[oldest]
+        self._clock += 1
+        table[key] = [self._clock, value]
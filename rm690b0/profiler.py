@@ -0,0 +1,281 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.profiler`
+====================================================
+
+Bus traffic profiler with a QSPI wire-time model.
+
+:class:`ProfilingBus` wraps the bus returned by
+:func:`rm690b0.create_qspi_bus` (or an emulator bus) and counts what goes
+over it. :class:`WireModel` turns those counts into the shortest possible
+transfer time at the configured frequency, so a measured refresh time can
+be compared against what the wire alone would need.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+Every RM690B0 QSPI transaction starts with a 32-bit header (instruction
+plus the command in the address field) clocked out on one line. Command
+arguments also go out on one line, while RAMWR/RAMWRC pixel payloads use
+all four lines. Chip-select gaps and driver overhead are not modelled;
+they are exactly what the comparison is meant to expose.
+
+displayio refreshes are sent by the firmware and never pass through a
+Python bus object, so they are profiled from :class:`rm690b0.FrameStats`
+with :meth:`ProfilingBus.record_frame` instead.
+
+Example:
+
+    bus = ProfilingBus(create_qspi_bus(board))
+    with bus.frame():
+        bus.send(0x2A, b"\\x00\\x00\\x00\\x63")
+        bus.send(0x2B, b"\\x00\\x10\\x00\\x73")
+        bus.send(0x2C, pixels)
+    print(bus.last_frame.as_dict(bus.model))
+
+    profiler = ProfilingBus(display.bus)
+    profiler.record_frame(display.commit_frame())
+    print(profiler.bus_bound())
+"""
+
+import time
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+_HEADER_BYTES = 4
+_PIXEL_COMMANDS = (0x2C, 0x3C)
+_WINDOW_COMMANDS = (0x2A, 0x2B)
+
+
+class WireModel:
+    """
+    Theoretical transfer time of RM690B0 QSPI traffic.
+
+    :param int frequency: Bus clock in Hz (default: 40MHz)
+    :param int lanes: Data lines used for pixel payloads (default: 4)
+    """
+
+    def __init__(self, frequency=40_000_000, lanes=4):
+        self.frequency = frequency
+        self.lanes = lanes
+
+    def command_time(self, command_bytes):
+        """Seconds needed for ``command_bytes`` sent on a single line."""
+        return command_bytes * 8 / self.frequency
+
+    def pixel_time(self, pixel_bytes):
+        """Seconds needed for ``pixel_bytes`` sent on all lanes."""
+        return pixel_bytes * 8 / (self.lanes * self.frequency)
+
+    def window_time(self, width, height):
+        """Seconds needed to set up and fill one ``width`` x ``height`` window."""
+        command_bytes = 3 * _HEADER_BYTES + 8
+        return self.command_time(command_bytes) + self.pixel_time(width * height * 2)
+
+    def time(self, stats):
+        """
+        Minimum wire time for the traffic in ``stats``.
+
+        :param BusStats stats: Counted traffic
+        :return: Seconds
+        """
+        return self.command_time(stats.command_bytes) + self.pixel_time(
+            stats.pixel_bytes
+        )
+
+
+class BusStats:  # pylint: disable=too-many-instance-attributes
+    """
+    Traffic counters for one frame or a whole session.
+
+    ``command_bytes`` includes the 4-byte header of every transaction,
+    ``pixel_bytes`` only the RAMWR/RAMWRC payload. ``windows`` counts
+    RAMWR commands, each of which starts filling a new window.
+    """
+
+    def __init__(self):
+        self.transactions = 0
+        self.command_bytes = 0
+        self.pixel_bytes = 0
+        self.windows = 0
+        self.window_setups = 0
+        self.delay = 0.0
+        self.elapsed = 0.0
+        self.frames = 0
+
+    def add(self, other):
+        """Add the counters of another :class:`BusStats` to this one."""
+        self.transactions += other.transactions
+        self.command_bytes += other.command_bytes
+        self.pixel_bytes += other.pixel_bytes
+        self.windows += other.windows
+        self.window_setups += other.window_setups
+        self.delay += other.delay
+        self.elapsed += other.elapsed
+        self.frames += other.frames
+
+    def as_dict(self, model=None):
+        """
+        Counters as a dictionary, suitable for JSON output.
+
+        With a :class:`WireModel` the wire time and the share of the
+        measured time it accounts for are included.
+        """
+        result = {
+            "frames": self.frames,
+            "transactions": self.transactions,
+            "command_bytes": self.command_bytes,
+            "pixel_bytes": self.pixel_bytes,
+            "windows": self.windows,
+            "window_setups": self.window_setups,
+            "delay_s": self.delay,
+            "elapsed_s": self.elapsed,
+        }
+        if model is not None:
+            wire = model.time(self)
+            result["wire_s"] = wire
+            result["bus_utilization"] = wire / self.elapsed if self.elapsed else None
+        return result
+
+
+class _Frame:
+    """Context manager returned by :meth:`ProfilingBus.frame`."""
+
+    def __init__(self, bus):
+        self._bus = bus
+
+    def __enter__(self):
+        self._bus.begin_frame()
+        return self._bus
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._bus.end_frame()
+        return False
+
+
+class ProfilingBus:
+    """
+    Bus wrapper that counts transactions and estimates wire time.
+
+    All attributes other than those below are passed through to the
+    wrapped bus, so the wrapper can stand in wherever the bus is used
+    from Python.
+
+    :param bus: Bus to wrap
+    :param int frequency: Bus clock in Hz; taken from ``bus.frequency`` when
+        available, otherwise 40MHz
+    :param int lanes: Data lines used for pixel payloads (default: 4)
+    """
+
+    def __init__(self, bus, *, frequency=None, lanes=4):
+        if frequency is None:
+            frequency = getattr(bus, "frequency", 40_000_000)
+        self.bus = bus
+        self.model = WireModel(frequency, lanes)
+        self.total = BusStats()
+        """Cumulative counters over all frames."""
+        self.last_frame = None
+        """:class:`BusStats` of the most recently finished frame."""
+        self._current = BusStats()
+        self._frame_start = None
+
+    def __getattr__(self, name):
+        return getattr(self.bus, name)
+
+    def send(self, command, data=b""):
+        """Count and forward one command to the wrapped bus."""
+        stats = self._current
+        stats.transactions += 1
+        stats.command_bytes += _HEADER_BYTES
+        # Typed buffers such as array('H') hold more than a byte per item
+        size = memoryview(data).nbytes
+        if command in _PIXEL_COMMANDS:
+            stats.pixel_bytes += size
+            if command == 0x2C:
+                stats.windows += 1
+        else:
+            stats.command_bytes += size
+            if command in _WINDOW_COMMANDS:
+                stats.window_setups += 1
+        self.bus.send(command, data)
+
+    def add_delay(self, seconds):
+        """Record time spent waiting on the panel, such as command delays."""
+        self._current.delay += seconds
+
+    def begin_frame(self):
+        """Start counting a new frame."""
+        self._current = BusStats()
+        self._frame_start = time.monotonic()
+
+    def end_frame(self):
+        """
+        Finish the current frame and add it to :attr:`total`.
+
+        :return: :class:`BusStats` of the finished frame
+        """
+        stats = self._current
+        if self._frame_start is not None:
+            stats.elapsed = time.monotonic() - self._frame_start
+        stats.frames = 1
+        self.total.add(stats)
+        self.last_frame = stats
+        self._current = BusStats()
+        self._frame_start = None
+        return stats
+
+    def frame(self):
+        """Context manager wrapping :meth:`begin_frame` and :meth:`end_frame`."""
+        return _Frame(self)
+
+    def record_frame(self, frame_stats):
+        """
+        Account for a displayio refresh from its :class:`rm690b0.FrameStats`.
+
+        Each window is counted as a CASET, RASET and RAMWR transaction.
+
+        :return: :class:`BusStats` of the recorded frame
+        """
+        stats = BusStats()
+        stats.transactions = 3 * frame_stats.windows
+        stats.command_bytes = 3 * _HEADER_BYTES * frame_stats.windows
+        stats.command_bytes += 8 * frame_stats.windows
+        stats.pixel_bytes = frame_stats.bytes
+        stats.windows = frame_stats.windows
+        stats.window_setups = 2 * frame_stats.windows
+        stats.elapsed = frame_stats.elapsed
+        stats.frames = 1
+        self.total.add(stats)
+        self.last_frame = stats
+        return stats
+
+    def wire_time(self, stats=None):
+        """
+        Minimum wire time of ``stats``, or of the last frame.
+
+        :return: Seconds
+        """
+        if stats is None:
+            stats = self.last_frame
+        return self.model.time(stats) if stats is not None else 0.0
+
+    def bus_bound(self, stats=None, threshold=0.8):
+        """
+        Whether the wire accounts for most of the measured time.
+
+        :param stats: Frame to judge; the last frame if omitted
+        :param float threshold: Share of elapsed time the wire must take
+            (default: 0.8)
+        :return: True if bus-bound, False if CPU-bound
+        """
+        if stats is None:
+            stats = self.last_frame
+        if stats is None or not stats.elapsed:
+            return False
+        return self.model.time(stats) >= threshold * stats.elapsed
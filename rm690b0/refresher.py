@@ -0,0 +1,202 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.refresher`
+====================================================
+
+Background display refresh as an ``asyncio`` task.
+
+A :class:`Refresher` runs at a target frame rate and sends whatever was
+marked dirty since its last frame. Marks made between frames are
+coalesced by a :class:`rm690b0.regions.DirtyRegionTracker`, so a
+rectangle marked ten times is sent once. Transfers go through the
+``_async`` methods of the driver and its renderers, which yield to other
+tasks between chunks of rows, so sensor polling, networking and touch
+handling keep running during a long flush.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+The refresher sends through :attr:`rm690b0.RM690B0.bands` or
+:attr:`rm690b0.RM690B0.buffers` when the display has one, and through
+displayio otherwise. With displayio, the marked area of ``bitmap`` is
+refreshed ``chunk_rows`` rows at a time through
+:func:`refresh_windows`; without a bitmap each
+refresh is a single call into the core and only yields before and after.
+
+Needs the ``asyncio`` library from the CircuitPython bundle.
+
+Example:
+
+    async def main():
+        display = RM690B0(bus, double_buffer=True)
+        refresher = Refresher(display, target_fps=30)
+        asyncio.create_task(refresher.run())
+        while True:
+            display.buffers.fill_rect(x, y, 32, 32, 0xF800)
+            await asyncio.sleep(0.01)
+
+    asyncio.run(main())
+"""
+
+import time
+
+from rm690b0.pacing import FramePacer
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+if hasattr(time, "monotonic_ns"):
+
+    def _now():
+        return time.monotonic_ns() / 1e9
+
+else:
+    _now = time.monotonic
+
+
+class Refresher:
+    """
+    Task refreshing an RM690B0 at a target rate.
+
+    :param display: :class:`rm690b0.RM690B0` to refresh
+    :param float target_fps: Frames per second (default: 30); frames stay
+        synced to the display's TE line if its pacer has one
+    :param bitmap: displayio bitmap that :meth:`mark_dirty` rectangles
+        refer to, when refreshing through displayio
+    :param int chunk_rows: Rows sent or refreshed between yields (default:
+        :attr:`rm690b0.RM690B0.chunk_rows`)
+    """
+
+    def __init__(self, display, target_fps=30, *, bitmap=None, chunk_rows=None):
+        self.display = display
+        self.bitmap = bitmap
+        self.chunk_rows = chunk_rows
+        te_source = display.pacer.te_source if display.pacer is not None else None
+        self.pacer = FramePacer(target_fps, te_source)
+        """:class:`rm690b0.pacing.FramePacer` setting the frame slots."""
+        self.frames = 0
+        """Frames that sent something."""
+        self.busy = 0.0
+        """Seconds spent in frames that sent something, other tasks included."""
+        self._running = False
+
+    @property
+    def dirty(self):
+        """Tracker the next frame is taken from."""
+        display = self.display
+        if display.bands is not None:
+            return display.bands.dirty
+        if display.buffers is not None:
+            return display.buffers.dirty
+        return display.dirty
+
+    def mark_dirty(self, x1, y1, x2, y2):
+        """Queue a rectangle for the next frame."""
+        self.dirty.add(x1, y1, x2, y2)
+
+    async def refresh(self):
+        """
+        Send one frame now, if anything is queued.
+
+        :return: True if something was sent
+        """
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        display = self.display
+        dirty = self.dirty
+        bounds = dirty.bounds
+        start = _now()
+        if display.bands is not None:
+            if bounds is None:
+                return False
+            await display.bands.render_async()
+        elif display.buffers is not None:
+            if bounds is None:
+                return False
+            await display.buffers.present_async(self.chunk_rows)
+        elif bounds is not None and self.bitmap is not None:
+            dirty.clear()
+            await refresh_windows(display, self.bitmap, [bounds], self.chunk_rows)
+        else:
+            # displayio keeps its own dirty areas, so refresh every slot
+            dirty.clear()
+            display.refresh()
+            await asyncio.sleep(0)
+            if bounds is None:
+                return False
+        self.frames += 1
+        self.busy += _now() - start
+        return True
+
+    async def run(self):
+        """Refresh at the target rate until :meth:`stop` is called."""
+        self._running = True
+        while self._running:
+            await self.pacer.wait_async()
+            await self.refresh()
+
+    def stop(self):
+        """End :meth:`run` after the current frame."""
+        self._running = False
+
+
+async def refresh_windows(display, bitmap, windows, chunk_rows=None):
+    """
+    Refresh windows of a displayio bitmap a few rows at a time.
+
+    Each window is cut into bands of ``chunk_rows`` rows, and every band
+    is marked dirty on ``bitmap``, refreshed on its own and followed by a
+    yield to other tasks. displayio adds the areas it tracks itself, such
+    as pixels set through ``bitmap[x, y]``, to the first refresh, so the
+    transfers are shortest when the pixels were written behind its back,
+    for example through a ``memoryview``.
+
+    :param display: :class:`rm690b0.RM690B0` showing ``bitmap``
+    :param bitmap: ``displayio.Bitmap`` the windows refer to
+    :param windows: ``(x1, y1, x2, y2)`` rectangles to refresh
+    :param int chunk_rows: Rows refreshed between yields (default:
+        :attr:`rm690b0.RM690B0.chunk_rows`)
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    if chunk_rows is None:
+        chunk_rows = display.chunk_rows
+    for x1, y1, x2, y2 in windows:
+        for top in range(y1, y2, chunk_rows):
+            bitmap.dirty(x1=x1, y1=top, x2=x2, y2=min(top + chunk_rows, y2))
+            display.refresh()
+            await asyncio.sleep(0)
+
+
+async def measure_overhead(sync, make_async, iterations=5):
+    """
+    Compare a blocking transfer with its ``asyncio`` counterpart.
+
+    Run it while other tasks are idle, so the difference is the cost of
+    chunking and yielding.
+
+    :param sync: Function doing the transfer
+    :param make_async: Function returning a coroutine doing the same transfer
+    :param int iterations: Runs of each
+    :return: Dict with ``sync_ms``, ``async_ms`` and ``overhead_pct``
+    """
+    start = _now()
+    for _ in range(iterations):
+        sync()
+    sync_time = (_now() - start) / iterations
+    start = _now()
+    for _ in range(iterations):
+        await make_async()
+    async_time = (_now() - start) / iterations
+    return {
+        "sync_ms": round(sync_time * 1000, 3),
+        "async_ms": round(async_time * 1000, 3),
+        "overhead_pct": round(
+            (async_time - sync_time) / sync_time * 100 if sync_time else 0, 1
+        ),
+    }
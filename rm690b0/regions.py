@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.regions`
+====================================================
+
+Dirty rectangle tracking and flush planning.
+
+* Author(s): Przemyslaw Patrick Socha
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+
+class DirtyRegionTracker:
+    """
+    Collects dirty rectangles and plans the cheapest set of flush windows.
+
+    Rectangles use the same exclusive ``x2``/``y2`` convention as
+    ``displayio.Bitmap.dirty()``. Each rectangle is clamped to the display
+    and widened to the controller's alignment as it is added. The RM690B0
+    needs an even start column and an even window width.
+
+    Flushing a window costs a fixed setup (CASET/RASET/RAMWR and, with
+    displayio, a whole refresh pass) plus a cost per pixel. Two rectangles
+    are merged whenever sending their union is no more expensive than
+    sending both, so overlapping and near-adjacent rectangles collapse
+    while distant ones stay separate.
+
+    :param int width: Display width in pixels (default: 600)
+    :param int height: Display height in pixels (default: 450)
+    :param int x_align: Column alignment in pixels (default: 2)
+    :param int y_align: Row alignment in pixels (default: 1)
+    :param int window_cost: Setup cost of one window, in pixels (default: 1024)
+    :param int pixel_cost: Cost of sending one pixel (default: 1)
+    :param int max_rects: Upper bound on planned windows (default: 8)
+
+    A clip set with :meth:`set_clip` keeps planned windows inside one
+    area, for example the band shown in partial display mode. Rectangles
+    reaching outside it are remembered and marked dirty again when the
+    clip is lifted.
+
+    Example:
+
+        dirty = DirtyRegionTracker(600, 450)
+        dirty.add(10, 10, 40, 40)
+        dirty.add(300, 200, 330, 230)
+        for x1, y1, x2, y2 in dirty.plan():
+            bitmap.dirty(x1=x1, y1=y1, x2=x2, y2=y2)
+            display.refresh()
+        dirty.clear()
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        width=600,
+        height=450,
+        *,
+        x_align=2,
+        y_align=1,
+        window_cost=1024,
+        pixel_cost=1,
+        max_rects=8,
+    ):
+        self.width = width
+        self.height = height
+        self.x_align = x_align
+        self.y_align = y_align
+        self.window_cost = window_cost
+        self.pixel_cost = pixel_cost
+        self.max_rects = max_rects
+        self.clip = None
+        """Area planned windows are kept inside, as ``(x1, y1, x2, y2)``."""
+        self.held = None
+        """Union of rectangles that reached outside :attr:`clip`, or None."""
+        self.held_changes = 0
+        """Number of rectangles held back by :attr:`clip` so far."""
+        self._rects = []
+
+    def __len__(self):
+        return len(self._rects)
+
+    @property
+    def bounds(self):
+        """Union of all pending rectangles as ``(x1, y1, x2, y2)``, or None."""
+        if not self._rects:
+            return None
+        return _union_all(self._rects)
+
+    @property
+    def area(self):
+        """Number of pixels covered by the pending rectangles."""
+        return sum(_area(rect) for rect in self._rects)
+
+    def align(self, x1, y1, x2, y2):
+        """
+        Clamp a rectangle to the display and widen it to the alignment.
+
+        :return: Aligned ``(x1, y1, x2, y2)``, or None if nothing is left
+        """
+        x1 = max(0, x1)
+        y1 = max(0, y1)
+        x2 = min(self.width, x2)
+        y2 = min(self.height, y2)
+        if x2 <= x1 or y2 <= y1:
+            return None
+        x1 -= x1 % self.x_align
+        y1 -= y1 % self.y_align
+        x2 = min(self.width, x2 + (-x2 % self.x_align))
+        y2 = min(self.height, y2 + (-y2 % self.y_align))
+        return (x1, y1, x2, y2)
+
+    def add(self, x1, y1, x2, y2):
+        """
+        Mark a rectangle as dirty.
+
+        :param int x1: Left edge (inclusive)
+        :param int y1: Top edge (inclusive)
+        :param int x2: Right edge (exclusive)
+        :param int y2: Bottom edge (exclusive)
+        """
+        rect = self.align(x1, y1, x2, y2)
+        if rect is not None and self.clip is not None:
+            whole = rect
+            rect = self.align(
+                max(x1, self.clip[0]),
+                max(y1, self.clip[1]),
+                min(x2, self.clip[2]),
+                min(y2, self.clip[3]),
+            )
+            if rect != whole:
+                self.held = whole if self.held is None else _union(self.held, whole)
+                self.held_changes += 1
+        if rect is None:
+            return
+        rects = self._rects
+        merged = True
+        while merged:
+            merged = False
+            for i, other in enumerate(rects):
+                union = _union(rect, other)
+                if self._merge_saves(rect, other, union):
+                    rect = union
+                    del rects[i]
+                    merged = True
+                    break
+        rects.append(rect)
+        while len(rects) > self.max_rects:
+            self._merge_cheapest_pair()
+
+    def add_all(self):
+        """Mark the whole display as dirty."""
+        self._rects = []
+        if self.clip is None:
+            self._rects.append((0, 0, self.width, self.height))
+        else:
+            self.add(0, 0, self.width, self.height)
+
+    def set_clip(self, rect):
+        """
+        Keep planned windows inside ``rect``, or lift the clip with None.
+
+        Pending rectangles are clipped right away. Lifting the clip marks
+        everything held back by it as dirty again.
+
+        :param rect: ``(x1, y1, x2, y2)`` or None
+        """
+        self.clip = rect
+        rects = self._rects
+        self._rects = []
+        if rect is None and self.held is not None:
+            rects.append(self.held)
+            self.held = None
+        for pending in rects:
+            self.add(*pending)
+
+    def clear(self):
+        """Forget all pending rectangles."""
+        self._rects = []
+
+    def cost(self, rects):
+        """
+        Estimated cost of flushing ``rects`` as separate windows.
+
+        :param rects: Iterable of ``(x1, y1, x2, y2)`` tuples
+        """
+        total = 0
+        for rect in rects:
+            total += self.window_cost + _area(rect) * self.pixel_cost
+        return total
+
+    def plan(self):
+        """
+        Choose the windows to flush for the pending rectangles.
+
+        Returns either the merged rectangles or their single union,
+        whichever the cost model says is cheaper. Pending rectangles are
+        kept until :meth:`clear` is called.
+
+        :return: List of ``(x1, y1, x2, y2)`` tuples
+        """
+        rects = self._rects
+        if len(rects) < 2:
+            return list(rects)
+        union = _union_all(rects)
+        if self.cost((union,)) <= self.cost(rects):
+            return [union]
+        return list(rects)
+
+    def _merge_saves(self, rect, other, union):
+        overlap_free = _area(rect) + _area(other)
+        return (_area(union) - overlap_free) * self.pixel_cost <= self.window_cost
+
+    def _merge_cheapest_pair(self):
+        rects = self._rects
+        best_growth = None
+        best = (0, 1, _union(rects[0], rects[1]))
+        for i, rect in enumerate(rects):
+            for j in range(i + 1, len(rects)):
+                union = _union(rect, rects[j])
+                growth = _area(union) - _area(rect) - _area(rects[j])
+                if best_growth is None or growth < best_growth:
+                    best_growth = growth
+                    best = (i, j, union)
+        i, j, union = best
+        del rects[j]
+        rects[i] = union
+
+
+def _area(rect):
+    return (rect[2] - rect[0]) * (rect[3] - rect[1])
+
+
+def _union(rect, other):
+    return (
+        min(rect[0], other[0]),
+        min(rect[1], other[1]),
+        max(rect[2], other[2]),
+        max(rect[3], other[3]),
+    )
+
+
+def _union_all(rects):
+    result = rects[0]
+    for rect in rects[1:]:
+        result = _union(result, rect)
+    return result
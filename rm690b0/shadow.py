@@ -0,0 +1,216 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.shadow`
+====================================================
+
+Tile-hash shadow of the panel's frame memory.
+
+A :class:`TileShadow` keeps a CRC-32 of every tile (16x16 pixels by
+default) last sent to the panel. Before a flush, the tiles under the
+dirty rectangles are hashed and only the parts of the dirty rectangles
+on tiles whose hash differs are sent, so erasing a sprite and drawing it
+back at the same place costs nothing on the bus and no flush sends more
+than it would without the shadow. The hashes cover only the dirty area, a CRC call per tile
+row, so the check stays cheap next to the transfer it saves.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+The shadow is used by the renderers that send through
+:meth:`rm690b0.RM690B0.write_window`: :class:`rm690b0.framebuffer.DoubleBuffer`
+and :class:`rm690b0.bands.BandRenderer`. displayio bitmaps cannot
+benefit, since ``bitmaptools`` and item assignment record their own dirty
+areas, which displayio refreshes regardless.
+
+Any other window written with :meth:`~rm690b0.RM690B0.write_window`
+invalidates the tiles it covers. Rotation, scrolling and sleep invalidate
+everything, and a new driver instance starts with no tile known. An
+unknown tile is always sent and becomes known once a flush covers it
+whole, so content left in frame memory by a previous run is never
+mistaken for the new frame.
+
+Example:
+
+    display = RM690B0(bus, double_buffer=True, tile_shadow=16)
+    ...
+    display.buffers.present()
+    print(display.shadow.suppressed_bytes)
+"""
+
+from binascii import crc32
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+
+class TileShadow:
+    """
+    Per-tile hashes of what the panel shows.
+
+    :param int width: Display width in pixels
+    :param int height: Display height in pixels
+    :param int tile_size: Tile width and height in pixels; must be even
+        (default: 16)
+    """
+
+    def __init__(self, width, height, tile_size=16):
+        if tile_size < 2 or tile_size % 2:
+            raise ValueError("tile_size must be even")
+        self.tile_size = tile_size
+        self.width = 0
+        self.height = 0
+        self.columns = 0
+        self.rows = 0
+        self._hashes = []
+        self._staged = []
+        self.suppressed_bytes = 0
+        """Pixel bytes not sent because their tiles were unchanged."""
+        self.last_suppressed = 0
+        """Pixel bytes suppressed by the most recent :meth:`changed`."""
+        self.resize(width, height)
+
+    def resize(self, width, height):
+        """Change the display size; every tile becomes unknown."""
+        self.width = width
+        self.height = height
+        self.columns = -(-width // self.tile_size)
+        self.rows = -(-height // self.tile_size)
+        self._hashes = [None] * (self.columns * self.rows)
+        self._staged = []
+
+    def invalidate(self, x1=0, y1=0, x2=None, y2=None):
+        """
+        Forget the tiles overlapping a rectangle, or all of them.
+
+        :param int x1: Left edge (inclusive)
+        :param int y1: Top edge (inclusive)
+        :param int x2: Right edge (exclusive); default: display width
+        :param int y2: Bottom edge (exclusive); default: display height
+        """
+        if x2 is None and y2 is None and not x1 and not y1:
+            self._hashes = [None] * (self.columns * self.rows)
+            self._staged = []
+            return
+        tile = self.tile_size
+        x2 = self.width if x2 is None else x2
+        y2 = self.height if y2 is None else y2
+        first = max(0, x1 // tile)
+        stop = min(self.columns, -(-x2 // tile))
+        hashes = self._hashes
+        for row in range(max(0, y1 // tile), min(self.rows, -(-y2 // tile))):
+            base = row * self.columns
+            for index in range(base + first, base + stop):
+                hashes[index] = None
+
+    def changed(
+        self, buffer, stride, rect, *, bits=16, buffer_top=0
+    ):  # pylint: disable=too-many-arguments,too-many-locals
+        """
+        Find the parts of a dirty rectangle whose tiles changed.
+
+        Tiles are hashed whole, so ``buffer`` must hold every row of the
+        tiles under the rectangle over the full display width, but the
+        returned rectangles are clipped to the dirty rectangle, widened
+        only to an even start column and width. Pixels outside it are
+        assumed to be on the panel already. New hashes are staged and take
+        effect with :meth:`commit` once the returned rectangles have been
+        sent; a tile not known before is only recorded once a rectangle
+        covers all of it.
+
+        :param buffer: Display contents, ``stride`` bytes per row
+        :param int stride: Bytes from one row to the next
+        :param rect: Dirty ``(x1, y1, x2, y2)``
+        :param int bits: Bits per pixel in ``buffer`` (default: 16)
+        :param int buffer_top: Display row of the first buffer row, for a
+            buffer holding a band of the display (default: 0)
+        :return: Rectangles to send as ``(x1, y1, x2, y2)``, one per run
+            of changed tiles in a tile row, with runs spanning the same
+            columns in consecutive tile rows merged
+        """
+        x1 = max(0, rect[0])
+        y1 = max(0, rect[1])
+        x2, y2 = min(self.width, rect[2]), min(self.height, rect[3])
+        if x2 <= x1 or y2 <= y1:
+            self.last_suppressed = 0
+            return []
+        left_edge = x1 - x1 % 2
+        right_edge = min(self.width, x2 + x2 % 2)
+        view = memoryview(buffer)
+        itemsize = getattr(view, "itemsize", 1)
+        tile = self.tile_size
+        first = max(0, x1 // tile)
+        stop = min(self.columns, -(-x2 // tile))
+        hashes = self._hashes
+        staged = self._staged
+        rects = []
+        previous = []
+        sent = 0
+        for row in range(y1 // tile, -(-y2 // tile)):
+            top = row * tile
+            bottom = min(top + tile, self.height)
+            runs = []
+            start = None
+            for column in range(first, stop):
+                left = column * tile
+                right = min(left + tile, self.width)
+                offset = (top - buffer_top) * stride + left * bits // 8
+                count = (right - left) * bits // 8
+                value = 0
+                for _ in range(bottom - top):
+                    value = crc32(
+                        view[offset // itemsize : (offset + count) // itemsize], value
+                    )
+                    offset += stride
+                index = row * self.columns + column
+                if hashes[index] == value:
+                    if start is not None:
+                        runs.append((start, left))
+                        start = None
+                    continue
+                if hashes[index] is not None or (
+                    x1 <= left and right <= x2 and y1 <= top and bottom <= y2
+                ):
+                    staged.append((index, value))
+                if start is None:
+                    start = left
+            if start is not None:
+                runs.append((start, min(stop * tile, self.width)))
+            top = max(top, y1)
+            bottom = min(bottom, y2)
+            runs = [
+                (max(left, left_edge), min(right, right_edge)) for left, right in runs
+            ]
+            sent += sum(right - left for left, right in runs) * (bottom - top)
+            previous = _merge_runs(rects, previous, runs, top, bottom)
+        area = (right_edge - left_edge) * (y2 - y1)
+        self.last_suppressed = (area - sent) * bits // 8
+        self.suppressed_bytes += self.last_suppressed
+        return [tuple(merged) for merged in rects]
+
+    def commit(self):
+        """Record the hashes staged by :meth:`changed` as sent."""
+        hashes = self._hashes
+        for index, value in self._staged:
+            hashes[index] = value
+        self._staged = []
+
+
+def _merge_runs(rects, previous, runs, top, bottom):
+    """Extend ``previous`` rectangles by matching runs; start new ones for the rest."""
+    current = []
+    for left, right in runs:
+        for merged in previous:
+            if merged[0] == left and merged[2] == right:
+                merged[3] = bottom
+                current.append(merged)
+                break
+        else:
+            merged = [left, top, right, bottom]
+            rects.append(merged)
+            current.append(merged)
+    return current
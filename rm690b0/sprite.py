@@ -0,0 +1,179 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.sprite`
+====================================================
+
+Run-length encoded sprites with transparency.
+
+A :class:`RLESprite` scans its source bitmap once and keeps only the
+opaque runs of each row. Rows with identical runs are merged into
+rectangles, so a solid shape is a single rectangle and a circle is one
+run per row. Drawing copies those rectangles with ``bitmaptools.blit``
+without a transparency test, and erasing restores the same rectangles
+from a background, so both cost as much as the opaque pixels rather than
+the bounding box.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Example:
+
+    ball = RLESprite(ball_bitmap)
+    display.begin_frame(canvas)
+    display.mark_dirty(*ball.erase(canvas, 0x0000))
+    display.mark_dirty(*ball.blit(canvas, x, y))
+    display.commit_frame()
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+
+class RLESprite:
+    """
+    Sprite drawn as opaque runs of a source bitmap.
+
+    :param source: ``displayio.Bitmap`` holding the sprite
+    :param int transparent: Source value treated as transparent
+        (default: 0x0000)
+    :param runs: Opaque runs when already known, one tuple of
+        ``(x1, x2)`` pairs per row; the source is then not scanned
+    :param origin: Offset of the sprite's top-left corner from the point
+        passed to :meth:`blit` and :meth:`move` (default: ``(0, 0)``)
+    """
+
+    def __init__(self, source, *, transparent=0x0000, runs=None, origin=(0, 0)):
+        import bitmaptools  # pylint: disable=import-outside-toplevel
+
+        self._bitmaptools = bitmaptools
+        self.source = source
+        self.width = source.width
+        self.height = source.height
+        self.origin = origin
+        if runs is None:
+            runs = [_row_runs(source, y, transparent) for y in range(self.height)]
+        self.rects = _merge_rows(runs)
+        """Opaque area as ``(x1, y1, x2, y2)`` rectangles in sprite coordinates."""
+        self.pixels = sum((x2 - x1) * (y2 - y1) for x1, y1, x2, y2 in self.rects)
+        """Number of opaque pixels."""
+        self.position = None
+        """Top-left corner of the last drawn copy, as ``(x, y)``, or None."""
+
+    def blit(self, dest, x, y):
+        """
+        Draw the sprite at ``(x, y)``, shifted by :attr:`origin`.
+
+        :param dest: Destination ``displayio.Bitmap``
+        :return: Covered ``(x1, y1, x2, y2)`` for dirty tracking
+        """
+        x += self.origin[0]
+        y += self.origin[1]
+        blit = self._bitmaptools.blit
+        source = self.source
+        for left, top, right, bottom, src_x, src_y in self._clipped(dest, x, y):
+            blit(
+                dest,
+                source,
+                left,
+                top,
+                x1=src_x,
+                y1=src_y,
+                x2=src_x + right - left,
+                y2=src_y + bottom - top,
+            )
+        self.position = (x, y)
+        return (x, y, x + self.width, y + self.height)
+
+    def erase(self, dest, background, x=None, y=None):
+        """
+        Restore the pixels the sprite covers from a background.
+
+        :param dest: Destination ``displayio.Bitmap``
+        :param background: Bitmap the size of ``dest`` to copy from, or a
+            colour to fill with
+        :param int x: Position as given to :meth:`blit`; defaults to the
+            last drawn position
+        :param int y: See ``x``
+        :return: Covered ``(x1, y1, x2, y2)``, or None if there was nothing
+            to erase
+        """
+        if x is None or y is None:
+            if self.position is None:
+                return None
+            x, y = self.position
+        else:
+            x += self.origin[0]
+            y += self.origin[1]
+        bitmaptools = self._bitmaptools
+        solid = isinstance(background, int)
+        for left, top, right, bottom, _, _ in self._clipped(dest, x, y):
+            if solid:
+                bitmaptools.fill_region(dest, left, top, right, bottom, background)
+            else:
+                bitmaptools.blit(
+                    dest, background, left, top, x1=left, y1=top, x2=right, y2=bottom
+                )
+        if (x, y) == self.position:
+            self.position = None
+        return (x, y, x + self.width, y + self.height)
+
+    def move(self, dest, background, x, y):
+        """
+        Erase the sprite at its last position and draw it at ``(x, y)``.
+
+        :return: ``(x1, y1, x2, y2)`` covering both positions
+        """
+        previous = self.erase(dest, background)
+        rect = self.blit(dest, x, y)
+        if previous is None:
+            return rect
+        return (
+            min(rect[0], previous[0]),
+            min(rect[1], previous[1]),
+            max(rect[2], previous[2]),
+            max(rect[3], previous[3]),
+        )
+
+    def _clipped(self, dest, x, y):
+        """Rectangles at ``(x, y)`` clipped to ``dest``, with source origins."""
+        width = dest.width
+        height = dest.height
+        for x1, y1, x2, y2 in self.rects:
+            left = max(0, x + x1)
+            top = max(0, y + y1)
+            right = min(width, x + x2)
+            bottom = min(height, y + y2)
+            if left < right and top < bottom:
+                yield (left, top, right, bottom, left - x, top - y)
+
+
+def _row_runs(source, y, transparent):
+    runs = []
+    start = None
+    for x in range(source.width):
+        if source[x, y] != transparent:
+            if start is None:
+                start = x
+        elif start is not None:
+            runs.append((start, x))
+            start = None
+    if start is not None:
+        runs.append((start, source.width))
+    return tuple(runs)
+
+
+def _merge_rows(rows):
+    """Rectangles covering per-row runs, with identical consecutive rows merged."""
+    rects = []
+    previous = ()
+    first = 0
+    for y in range(len(rows) + 1):
+        runs = tuple(rows[y]) if y < len(rows) else ()
+        if runs != previous:
+            for x1, x2 in previous:
+                rects.append((x1, first, x2, y))
+            previous = runs
+            first = y
+    return rects
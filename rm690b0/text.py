@@ -0,0 +1,236 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+"""
+`rm690b0.text`
+====================================================
+
+Glyph atlas text rendering with changed-cell updates.
+
+A :class:`GlyphAtlas` keeps pre-rendered RGB565 glyph cells for one font
+and scale, keyed by character and colours, and evicts the least recently
+used ones. A :class:`TextField` draws a line of text into a bitmap cell by
+cell and remembers what it drew, so an update only redraws the cells
+whose character changed. Going from "SCORE 0041" to "SCORE 0042" blits
+one cell and marks one cell dirty.
+
+* Author(s): Przemyslaw Patrick Socha
+
+Implementation Notes
+--------------------
+
+Fonts are anything with the ``get_bounding_box()``/``get_glyph()``
+interface of ``terminalio.FONT`` and ``adafruit_bitmap_font``. Every
+character gets a cell of the bounding box size, so proportional fonts are
+laid out monospaced.
+
+Target bitmaps hold RGB565 values, as the full-screen 65536-colour canvas
+shown through an RGB565 ``ColorConverter`` does.
+
+Example:
+
+    atlas = GlyphAtlas(terminalio.FONT, scale=3)
+    score = TextField(atlas, 16, 16, color=0x07FF)
+    display.begin_frame(canvas)
+    for rect in score.update(canvas, "SCORE %04d" % points):
+        display.mark_dirty(*rect)
+    display.commit_frame()
+"""
+
+__version__ = "0.0.0+auto.0"
+__repo__ = "https://github.com/ppsx/CircuitPython_RM690B0.git"
+
+
+def glyph_runs(font, char):  # pylint: disable=too-many-locals
+    """
+    Lit pixels of a character as runs inside its cell.
+
+    The cell is the font's bounding box, with glyphs placed on the
+    common baseline.
+
+    :param font: Font to read the glyph from
+    :param str char: Character
+    :return: List of ``(row, x1, x2)`` runs with exclusive ``x2``, or None
+        if the font has no such glyph
+    """
+    glyph = font.get_glyph(ord(char))
+    if glyph is None:
+        return None
+    box = font.get_bounding_box()
+    cell_width = box[0]
+    cell_height = box[1]
+    baseline = box[1] + (box[3] if len(box) > 3 else 0)
+    left = glyph.dx - (box[2] if len(box) > 2 else 0)
+    top = baseline - glyph.height - glyph.dy
+    bitmap = glyph.bitmap
+    tiles = max(1, bitmap.width // glyph.width) if glyph.width else 1
+    source_x = (glyph.tile_index % tiles) * glyph.width
+    source_y = (glyph.tile_index // tiles) * glyph.height
+    first_x = max(0, -left)
+    last_x = min(glyph.width, cell_width - left)
+    runs = []
+    for y in range(max(0, -top), min(glyph.height, cell_height - top)):
+        start = None
+        for x in range(first_x, last_x):
+            if bitmap[source_x + x, source_y + y]:
+                if start is None:
+                    start = x
+            elif start is not None:
+                runs.append((top + y, left + start, left + x))
+                start = None
+        if start is not None:
+            runs.append((top + y, left + start, left + last_x))
+    return runs
+
+
+class GlyphAtlas:
+    """
+    LRU cache of rendered glyph cells for one font and scale.
+
+    :param font: Font to render (default: ``terminalio.FONT``)
+    :param int scale: Integer pixel scale of every glyph (default: 1)
+    :param int max_glyphs: Cells kept before the least recently used one
+        is dropped (default: 96)
+    """
+
+    def __init__(self, font=None, *, scale=1, max_glyphs=96):
+        # pylint: disable=import-outside-toplevel
+        import bitmaptools
+        import displayio
+
+        if font is None:
+            import terminalio
+
+            font = terminalio.FONT
+        self._bitmaptools = bitmaptools
+        self._displayio = displayio
+        self.font = font
+        self.scale = scale
+        self.max_glyphs = max_glyphs
+        box = font.get_bounding_box()
+        self.cell_width = box[0] * scale
+        """Width of a character cell in pixels."""
+        self.cell_height = box[1] * scale
+        """Height of a character cell in pixels."""
+        self.hits = 0
+        self.misses = 0
+        self._cells = {}
+        self._clock = 0
+
+    def cell(self, char, color, background):
+        """
+        Bitmap of one character cell, rendered on first use.
+
+        :param str char: Character; one the font lacks renders blank
+        :param int color: RGB565 foreground
+        :param int background: RGB565 background
+        :return: ``displayio.Bitmap`` of :attr:`cell_width` x :attr:`cell_height`
+        """
+        key = (char, color, background)
+        entry = self._cells.get(key)
+        self._clock += 1
+        if entry is not None:
+            self.hits += 1
+            entry[0] = self._clock
+            return entry[1]
+        self.misses += 1
+        if len(self._cells) >= self.max_glyphs:
+            oldest = min(self._cells, key=lambda k: self._cells[k][0])
+            del self._cells[oldest]
+        bitmap = self._displayio.Bitmap(self.cell_width, self.cell_height, 65536)
+        bitmap.fill(background)
+        scale = self.scale
+        fill_region = self._bitmaptools.fill_region
+        for row, x1, x2 in glyph_runs(self.font, char) or ():
+            fill_region(
+                bitmap, x1 * scale, row * scale, x2 * scale, (row + 1) * scale, color
+            )
+        self._cells[key] = [self._clock, bitmap]
+        return bitmap
+
+    def clear(self):
+        """Drop every cached cell."""
+        self._cells = {}
+
+
+class TextField:  # pylint: disable=too-many-instance-attributes
+    """
+    A line of text at a fixed position that redraws only changed cells.
+
+    :param GlyphAtlas atlas: Glyph source
+    :param int x: Left edge in the target bitmap
+    :param int y: Top edge in the target bitmap
+    :param int color: RGB565 text colour (default: white)
+    :param int background: RGB565 background colour (default: black)
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self, atlas, x, y, *, color=0xFFFF, background=0x0000
+    ):
+        import bitmaptools  # pylint: disable=import-outside-toplevel
+
+        self._bitmaptools = bitmaptools
+        self.atlas = atlas
+        self.x = x
+        self.y = y
+        self.color = color
+        self.background = background
+        self.text = ""
+        """Text currently drawn."""
+        self._valid = False
+
+    @property
+    def bounds(self):
+        """Area of the drawn text as ``(x1, y1, x2, y2)``."""
+        return (
+            self.x,
+            self.y,
+            self.x + len(self.text) * self.atlas.cell_width,
+            self.y + self.atlas.cell_height,
+        )
+
+    def invalidate(self):
+        """Redraw every cell on the next :meth:`update`."""
+        self._valid = False
+
+    def update(self, dest, text):
+        """
+        Draw ``text``, redrawing only the cells that changed.
+
+        Cells no longer covered by a shorter text are filled with the
+        background.
+
+        :param dest: Destination ``displayio.Bitmap``
+        :param str text: New text
+        :return: Changed areas as a list of ``(x1, y1, x2, y2)``, one per
+            run of adjacent changed cells
+        """
+        # Nothing drawn yet: compare against no text, so every cell is drawn
+        old = self.text if self._valid else ""
+        atlas = self.atlas
+        bitmaptools = self._bitmaptools
+        width = atlas.cell_width
+        height = atlas.cell_height
+        top = self.y
+        rects = []
+        for i in range(max(len(text), len(old))):
+            char = text[i] if i < len(text) else None
+            if i < len(old) and old[i] == char:
+                continue
+            left = self.x + i * width
+            if char is None:
+                bitmaptools.fill_region(
+                    dest, left, top, left + width, top + height, self.background
+                )
+            else:
+                bitmaptools.blit(
+                    dest, atlas.cell(char, self.color, self.background), left, top
+                )
+            if rects and rects[-1][2] == left:
+                rects[-1] = (rects[-1][0], top, left + width, top + height)
+            else:
+                rects.append((left, top, left + width, top + height))
+        self.text = text
+        self._valid = True
+        return rects
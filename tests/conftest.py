@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+import displayio
+import pytest
+
+from rm690b0 import RM690B0
+from rm690b0.emulator import FakeQSPIBus, RM690B0Emulator
+
+
+class RecordingEmulator(RM690B0Emulator):
+    """Emulator that also keeps every command it receives."""
+
+    def __init__(self):
+        super().__init__(strict=True)
+        self.log = []
+
+    def command(self, command, data=b""):
+        self.log.append((command, bytes(data)))
+        super().command(command, data)
+
+
+@pytest.fixture(name="make_display")
+def make_display_fixture():
+    """Create an RM690B0 on a fake bus; Blinka allows one display at a time."""
+
+    def make(**kwargs):
+        displayio.release_displays()
+        return RM690B0(FakeQSPIBus(RecordingEmulator()), **kwargs)
+
+    yield make
+    displayio.release_displays()
+
+
+@pytest.fixture(name="show_bitmap")
+def show_bitmap_fixture():
+    """Show a full-screen two-colour bitmap on a display and return it."""
+
+    def show(display):
+        bitmap = displayio.Bitmap(display.width, display.height, 2)
+        palette = displayio.Palette(2)
+        palette[1] = 0x0000FF
+        group = displayio.Group()
+        group.append(displayio.TileGrid(bitmap, pixel_shader=palette))
+        display.root_group = group
+        display.refresh()
+        return bitmap
+
+    return show
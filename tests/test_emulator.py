@@ -0,0 +1,50 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+import displayio
+
+
+def test_driver_initializes_panel(make_display):
+    display = make_display()
+    panel = display.bus.panel
+    assert not panel.errors
+    assert panel.madctl == 0x30
+    assert panel.colmod == 0x55
+    assert not panel.sleeping
+    assert panel.display_on
+
+
+def test_write_window_stream(make_display):
+    display = make_display()
+    panel = display.bus.panel
+    panel.log.clear()
+    display.write_window(10, 20, 4, 2, bytes(range(16)))
+    assert panel.log == [
+        (0x2A, b"\x00\x0a\x00\x0d"),
+        (0x2B, b"\x00\x24\x00\x25"),
+        (0x2C, bytes(range(16))),
+    ]
+    assert panel.pixel(10, 20) == 0x0001
+    assert panel.pixel(13, 21) == 0x0E0F
+
+
+def test_displayio_refresh_stream(make_display):
+    display = make_display()
+    panel = display.bus.panel
+    bitmap = displayio.Bitmap(display.width, display.height, 2)
+    palette = displayio.Palette(2)
+    palette[1] = 0xFF0000
+    bitmap[51, 60] = 1
+    group = displayio.Group()
+    group.append(displayio.TileGrid(bitmap, pixel_shader=palette))
+    display.root_group = group
+    panel.log.clear()
+    display.refresh()
+    commands = [command for command, _ in panel.log]
+    assert commands[:3] == [0x2A, 0x2B, 0x2C]
+    assert panel.log[0][1] == b"\x00\x00\x02\x57"
+    assert panel.log[1][1] == b"\x00\x10\x01\xd1"
+    assert not panel.errors
+    assert panel.pixel(51, 60) == 0xF800
+    assert panel.pixel(50, 60) == 0x0000
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+
+def test_commit_sends_windows(make_display, show_bitmap):
+    display = make_display()
+    panel = display.bus.panel
+    bitmap = show_bitmap(display)
+    panel.log.clear()
+    with display.frame(bitmap) as frame:
+        bitmap[10, 10] = 1
+        display.mark_dirty(10, 10, 20, 20)
+        bitmap[500, 400] = 1
+        display.mark_dirty(500, 400, 510, 410)
+    assert frame.stats.windows == 2
+    assert frame.stats.pixels == 200
+    assert frame.stats.bytes == 400
+    assert [command for command, _ in panel.log].count(0x2C) == 2
+    assert panel.pixel(10, 10) == 0x001F
+    assert panel.pixel(500, 400) == 0x001F
+
+
+def test_commit_merges_close_marks(make_display, show_bitmap):
+    display = make_display()
+    bitmap = show_bitmap(display)
+    with display.frame(bitmap) as frame:
+        display.mark_dirty(10, 10, 20, 20)
+        display.mark_dirty(20, 10, 30, 20)
+    assert frame.stats.windows == 1
+    assert frame.stats.pixels == 200
+
+
+def test_empty_commit(make_display):
+    display = make_display()
+    with display.frame() as frame:
+        pass
+    assert frame.stats.windows == 0
+    assert frame.stats.bytes == 0
@@ -0,0 +1,30 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+
+def test_redraw_outside_band(make_display):
+    display = make_display(double_buffer=True)
+    buffers = display.buffers
+    display.enter_partial_mode(400, 600)
+    buffers.fill_rect(10, 10, 20, 20, 0x1111)
+    buffers.present()
+    buffers.fill_rect(10, 10, 20, 20, 0x2222)
+    buffers.present()
+    display.exit_partial_mode()
+    buffers.present()
+    assert display.bus.panel.pixel(15, 15) == 0x2222
+
+
+def test_held_area_copied_once(make_display):
+    display = make_display(double_buffer=True)
+    buffers = display.buffers
+    display.enter_partial_mode(400, 600)
+    buffers.fill_rect(10, 10, 20, 20, 0x1111)
+    buffers.present()
+    # Written behind the tracker's back: a swap that copies the held area
+    # again would carry it into the other buffer
+    offset = 15 * buffers.stride + 15 * 2
+    buffers.back[offset : offset + 2] = b"\xab\xcd"
+    buffers.present()
+    assert bytes(buffers.back[offset : offset + 2]) == b"\x11\x11"
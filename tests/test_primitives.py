@@ -0,0 +1,26 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+import displayio
+
+from rm690b0.primitives import PrimitiveCache
+
+
+def test_sprites_move_apart():
+    shapes = PrimitiveCache()
+    canvas = displayio.Bitmap(64, 32, 65536)
+    first = shapes.sprite("circle", 4, color=0xFFFF)
+    second = shapes.sprite("circle", 4, color=0xFFFF)
+    assert first is not second
+    assert first.source is second.source
+    assert shapes.hits == 1
+
+    first.blit(canvas, 10, 10)
+    second.blit(canvas, 40, 10)
+    assert first.position == (6, 6)
+    assert second.position == (36, 6)
+
+    first.erase(canvas, 0x0000)
+    assert canvas[10, 10] == 0x0000
+    assert canvas[40, 10] == 0xFFFF
@@ -0,0 +1,24 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+from array import array
+
+from rm690b0.emulator import FakeQSPIBus
+from rm690b0.profiler import ProfilingBus
+
+
+def test_typed_payload_bytes():
+    fake = FakeQSPIBus()
+    fake.panel.power_on()
+    bus = ProfilingBus(fake)
+    pixels = array("H", [0xF800] * 100)
+    with bus.frame():
+        bus.send(0x2A, b"\x00\x00\x00\x63")
+        bus.send(0x2B, b"\x00\x10\x00\x10")
+        bus.send(0x2C, pixels)
+    stats = bus.last_frame
+    assert stats.pixel_bytes == 200
+    assert stats.command_bytes == 3 * 4 + 8
+    assert stats.windows == 1
+    assert fake.panel.pixels_written == 100
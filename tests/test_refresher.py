@@ -0,0 +1,48 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+import asyncio
+
+from rm690b0.refresher import Refresher
+
+
+def _yields_during(make_coroutine):
+    """Number of times another task ran while the coroutine was awaited."""
+
+    async def main():
+        ticks = []
+
+        async def ticker():
+            while True:
+                ticks.append(None)
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        await asyncio.sleep(0)
+        ticks.clear()
+        await make_coroutine()
+        task.cancel()
+        return len(ticks)
+
+    return asyncio.run(main())
+
+
+def test_commit_yields_per_band(make_display, show_bitmap):
+    display = make_display()
+    panel = display.bus.panel
+    bitmap = show_bitmap(display)
+    panel.log.clear()
+    display.begin_frame(bitmap)
+    display.mark_dirty(0, 0, 40, 128)
+    assert _yields_during(lambda: display.commit_frame_async(chunk_rows=32)) == 4
+    assert [command for command, _ in panel.log].count(0x2C) == 4
+
+
+def test_refresher_yields_per_band(make_display, show_bitmap):
+    display = make_display()
+    bitmap = show_bitmap(display)
+    refresher = Refresher(display, bitmap=bitmap, chunk_rows=32)
+    refresher.mark_dirty(0, 0, 40, 100)
+    assert _yields_during(refresher.refresh) == 4
+    assert refresher.frames == 1
@@ -0,0 +1,39 @@
+# SPDX-FileCopyrightText: Copyright (c) 2026 Przemyslaw Patrick Socha
+#
+# SPDX-License-Identifier: MIT
+
+
+def test_small_updates_not_widened(make_display):
+    plain = make_display(double_buffer=True).buffers
+    plain_sent = 0
+    for i in range(10):
+        plain.fill_rect(20 + 40 * i, 20, 4, 4, 0xF800)
+        plain_sent += plain.present()
+
+    display = make_display(double_buffer=True, tile_shadow=16)
+    buffers = display.buffers
+    sent = 0
+    for i in range(10):
+        buffers.fill_rect(20 + 40 * i, 20, 4, 4, 0xF800)
+        sent += buffers.present()
+    assert sent == plain_sent == 320
+    assert display.shadow.last_suppressed == 0
+
+    buffers.fill_rect(7, 9, 32, 32, 0x07E0)
+    assert buffers.present() == 34 * 32 * 2
+
+
+def test_unchanged_redraw_skipped(make_display):
+    display = make_display(double_buffer=True, tile_shadow=16)
+    buffers = display.buffers
+    buffers.fill_rect(0, 0, 600, 450, 0x0000)
+    buffers.present()
+    buffers.fill_rect(21, 21, 4, 4, 0xF800)
+    assert buffers.present() == 6 * 4 * 2
+    buffers.fill_rect(21, 21, 4, 4, 0xF800)
+    assert buffers.present() == 0
+    assert display.shadow.last_suppressed == 6 * 4 * 2
+    buffers.fill_rect(26, 21, 2, 2, 0x001F)
+    buffers.present()
+    assert display.bus.panel.pixel(22, 22) == 0xF800
+    assert display.bus.panel.pixel(26, 21) == 0x001F